@@ -53,6 +53,18 @@ Respond in this exact JSON format:
 }}
 """
 
+# Appended to the query analysis prompt when the query holds several sub-questions
+QUERY_ROWS_PROMPT = """
+The query contains these sub-questions, one per row:
+{rows}
+
+In the same JSON response, also include a "rows" array that assigns every row to the agent
+answering it:
+"rows": [
+    {{"row": 1, "agent_id": "agent_name"}}
+]
+"""
+
 # Template for generating detailed orchestration specifications
 ORCHESTRATION_GENERATION_PROMPT = """
 You are an expert workflow orchestrator for Energy & Property Tech Inc. Based on the AI analysis, create a detailed orchestration specification.
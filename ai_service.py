@@ -23,11 +23,12 @@ Usage:
     orchestration = await ai_service.generate_orchestration_spec(query, analysis)
 """
 
+import asyncio
 import os
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import openai
 from dotenv import load_dotenv
 
@@ -39,10 +40,14 @@ from ai_prompts import (
     QUERY_ANALYSIS_PROMPT,
     ORCHESTRATION_GENERATION_PROMPT,
     ORCHESTRATION_VALIDATION_PROMPT,
+    QUERY_ROWS_PROMPT,
     AGENT_DIRECTIVE_PROMPT,
     FALLBACK_ORCHESTRATION_PROMPT
 )
 
+# Shared pretty-printing encoder for the JSON embedded in prompts
+_PROMPT_JSON_ENCODER = json.JSONEncoder(indent=2, separators=(",", ": "), ensure_ascii=False)
+
 class AIService:
     """
     AI Service for intelligent orchestration generation
@@ -79,7 +84,7 @@ class AIService:
         
         print(f"🤖 AI Service initialized with model: {self.model}")
     
-    async def analyze_query(self, user_query: str) -> Dict[str, Any]:
+    async def analyze_query(self, user_query: str, rows: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Analyze user query using AI to determine required agents and data sources
         
@@ -88,6 +93,8 @@ class AIService:
         
         Args:
             user_query: The user's business query (e.g., "Analyze Q2 performance")
+            rows: Sub-questions of the query; when given, the same call also
+                assigns each row to an agent under "rows"
             
         Returns:
             Dictionary containing AI analysis with:
@@ -112,6 +119,10 @@ class AIService:
             # Prepare the AI prompt with the user's query
             # The prompt includes context about available agents and data sources
             prompt = QUERY_ANALYSIS_PROMPT.format(user_query=user_query)
+            if rows:
+                # Row-marshal the sub-questions so one call answers all of them
+                marked_rows = "\n".join(f"<<ROW {i}>> {row} <</ROW>>" for i, row in enumerate(rows, 1))
+                prompt += QUERY_ROWS_PROMPT.format(rows=marked_rows)
             
             # Call OpenAI API for intelligent analysis
             response = await self._call_openai(prompt)
@@ -156,7 +167,7 @@ class AIService:
             # This prompt guides the AI to create a complete orchestration specification
             prompt = ORCHESTRATION_GENERATION_PROMPT.format(
                 user_query=user_query,
-                analysis_result=json.dumps(analysis_result, indent=2)
+                analysis_result=_PROMPT_JSON_ENCODER.encode(analysis_result)
             )
             
             # Call OpenAI API for orchestration generation
@@ -221,7 +232,7 @@ class AIService:
         try:
             # Prepare the AI prompt for validation
             prompt = ORCHESTRATION_VALIDATION_PROMPT.format(
-                orchestration_spec=json.dumps(orchestration_spec, indent=2)
+                orchestration_spec=_PROMPT_JSON_ENCODER.encode(orchestration_spec)
             )
             
             # Call OpenAI API for validation
@@ -257,7 +268,8 @@ class AIService:
                 "is_valid": True,  # Assume valid if validation fails
                 "issues": [],
                 "suggestions": [],
-                "confidence_score": 0.5
+                "confidence_score": 0.5,
+                "fallback_used": True
             }
     
     async def generate_agent_directives(self, user_query: str, agent_type: str, data_sources: list) -> list:
@@ -326,8 +338,9 @@ class AIService:
         for consistent, reliable results in business applications.
         """
         try:
-            # Make the API call to OpenAI
-            response = self.client.chat.completions.create(
+            # The client is synchronous; run it in a thread so concurrent queries overlap
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert business analyst and workflow orchestrator. Always respond with valid JSON."},
@@ -376,7 +389,8 @@ class AIService:
                 }
             ],
             "execution_order": ["operations_summary_agent"],
-            "reasoning": "Fallback analysis due to AI service error"
+            "reasoning": "Fallback analysis due to AI service error",
+            "fallback_used": True
         }
     
     def _create_fallback_orchestration(self, user_query: str) -> Dict[str, Any]:
@@ -397,6 +411,7 @@ class AIService:
             "timestamp": datetime.utcnow().isoformat(),
             "user_query": user_query,
             "ai_generated": False,
+            "fallback_used": True,
             "workflow": {
                 "agents": [
                     {
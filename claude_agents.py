@@ -21,6 +21,7 @@ intelligence to provide real business analysis and recommendations.
 import asyncio
 import json
 import os
+import weakref
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
@@ -35,6 +36,18 @@ load_dotenv()
 # Import our Fast MCP connectors
 from fast_mcp_connectors import FastMCPClient
 
+# One client (and so one keepalive connection pool) serves every agent. Async pools are
+# bound to the loop that opened them, so clients are cached per loop
+_claude_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anthropic.AsyncAnthropic]" = weakref.WeakKeyDictionary()
+
+def get_claude_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Shared AsyncAnthropic client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _claude_clients.get(loop)
+    if client is None:
+        client = _claude_clients[loop] = anthropic.AsyncAnthropic(api_key=api_key)
+    return client
+
 class BaseClaudeAgent(ABC):
     """
     Abstract base class for all Claude-powered agents
@@ -62,7 +75,6 @@ class BaseClaudeAgent(ABC):
         if not self.anthropic_api_key or self.anthropic_api_key == 'your_anthropic_api_key_here':
             raise ValueError("Anthropic API key not configured. Please set ANTHROPIC_API_KEY in your .env file.")
         
-        self.claude_client = anthropic.Anthropic(api_key=self.anthropic_api_key)
         # Use Claude Opus 4.1 for best-in-class analysis capabilities
         # UPGRADED: From claude-3-5-sonnet to Claude Opus
         self.model = "claude-3-5-sonnet-20241022"  # TEMPORARY: Keep working model while testing Opus
@@ -70,6 +82,11 @@ class BaseClaudeAgent(ABC):
         
         print(f"🤖 {self.agent_id} initialized with Claude {self.model}")
     
+    @property
+    def claude_client(self) -> anthropic.AsyncAnthropic:
+        """Claude client shared by all agents, so requests reuse warm connections"""
+        return get_claude_client(self.anthropic_api_key)
+    
     def _convert_to_json_serializable(self, obj: Any) -> Any:
         """
         Convert pandas/numpy objects to JSON-serializable formats
@@ -122,7 +139,7 @@ class BaseClaudeAgent(ABC):
             Claude's response as a string
         """
         try:
-            response = self.claude_client.messages.create(
+            response = await self.claude_client.messages.create(
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.3,  # Conservative temperature for business analysis
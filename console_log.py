@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Console Logging for Test Scripts
+================================
+
+One shared console logger for the test and smoke scripts. Records go through
+a QueueHandler to a QueueListener thread that writes them to stdout, so the
+scripts never block on terminal or CI pipe flushes between steps.
+
+Messages are written as-is (no level or timestamp prefix), keeping the
+scripts' emoji progress output unchanged.
+
+Usage:
+    log = get_logger(__name__)
+    log.info("✅ Step completed")
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# Parent of every script logger; kept off the root so application logging config is untouched
+CONSOLE_LOGGER = "console"
+
+_listener = None
+
+
+def _configure() -> None:
+    """Attach the queue handler and start the writer thread (once per process)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    records = queue.SimpleQueue()
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(records, stdout_handler)
+    _listener.start()
+    # Stopping the listener drains whatever is still queued before the process exits
+    atexit.register(_listener.stop)
+
+    console = logging.getLogger(CONSOLE_LOGGER)
+    console.addHandler(QueueHandler(records))
+    console.setLevel(logging.INFO)
+    console.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Console logger for a script, writing through the shared background queue"""
+    _configure()
+    return logging.getLogger(f"{CONSOLE_LOGGER}.{name}")
@@ -34,40 +34,43 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Demo catalogue, built once at import and shared by every launcher instance
+DEMO_QUERIES = {
+    "Regional Focus Analysis": {
+        "query": "I need to know which region is the most interesting one to focus on with regards to gross margin. Can you look at where to focus on and which are the top three selling assets that I should focus on? Make sure that in that region and for those potential accounts, those assets are not yet sold, so there's truly an upsell opportunity. After you've done that, can you come up with an explanation as to why we should focus on that region, those products, those assets, and those accounts? From there, I'm going to have to come up with a communication strategy - which marketing campaign can we aspire for and what is the best channel of communication. And why?",
+        "description": "Comprehensive regional analysis with upsell opportunities and marketing strategy",
+        "complexity": "High",
+        "expected_time": "60-90 seconds"
+    },
+    "Financial Performance Review": {
+        "query": "Can you analyze our financial performance across all regions and identify the top 3 revenue-generating products? Also, show me which regions have the highest growth potential based on current trends.",
+        "description": "Financial analysis focusing on revenue and growth potential",
+        "complexity": "Medium",
+        "expected_time": "45-60 seconds"
+    },
+    "Lead Funnel Optimization": {
+        "query": "Analyze our lead funnel performance and identify bottlenecks. Which conversion stages need improvement? What are the top 3 strategies to increase our MQL to SQL conversion rate?",
+        "description": "Lead funnel analysis with conversion optimization strategies",
+        "complexity": "Medium",
+        "expected_time": "45-60 seconds"
+    },
+    "Asset Performance Analysis": {
+        "query": "Which installed assets are performing best in terms of ROI? Can you identify the top 3 assets and explain why they're successful? Also, show me which assets have the highest upsell potential.",
+        "description": "Asset performance analysis with ROI focus and upsell opportunities",
+        "complexity": "Medium",
+        "expected_time": "45-60 seconds"
+    },
+    "Custom Query": {
+        "query": "",
+        "description": "Enter your own business query for analysis",
+        "complexity": "Variable",
+        "expected_time": "Variable"
+    }
+}
+
 class DemoLauncher:
     def __init__(self):
-        self.demo_queries = {
-            "Regional Focus Analysis": {
-                "query": "I need to know which region is the most interesting one to focus on with regards to gross margin. Can you look at where to focus on and which are the top three selling assets that I should focus on? Make sure that in that region and for those potential accounts, those assets are not yet sold, so there's truly an upsell opportunity. After you've done that, can you come up with an explanation as to why we should focus on that region, those products, those assets, and those accounts? From there, I'm going to have to come up with a communication strategy - which marketing campaign can we aspire for and what is the best channel of communication. And why?",
-                "description": "Comprehensive regional analysis with upsell opportunities and marketing strategy",
-                "complexity": "High",
-                "expected_time": "60-90 seconds"
-            },
-            "Financial Performance Review": {
-                "query": "Can you analyze our financial performance across all regions and identify the top 3 revenue-generating products? Also, show me which regions have the highest growth potential based on current trends.",
-                "description": "Financial analysis focusing on revenue and growth potential",
-                "complexity": "Medium",
-                "expected_time": "45-60 seconds"
-            },
-            "Lead Funnel Optimization": {
-                "query": "Analyze our lead funnel performance and identify bottlenecks. Which conversion stages need improvement? What are the top 3 strategies to increase our MQL to SQL conversion rate?",
-                "description": "Lead funnel analysis with conversion optimization strategies",
-                "complexity": "Medium",
-                "expected_time": "45-60 seconds"
-            },
-            "Asset Performance Analysis": {
-                "query": "Which installed assets are performing best in terms of ROI? Can you identify the top 3 assets and explain why they're successful? Also, show me which assets have the highest upsell potential.",
-                "description": "Asset performance analysis with ROI focus and upsell opportunities",
-                "complexity": "Medium",
-                "expected_time": "45-60 seconds"
-            },
-            "Custom Query": {
-                "query": "",
-                "description": "Enter your own business query for analysis",
-                "complexity": "Variable",
-                "expected_time": "Variable"
-            }
-        }
+        self.demo_queries = DEMO_QUERIES
         
         # Initialize system if available
         self.system = None
@@ -138,8 +138,8 @@ class EndToEndTester:
                 raise ValueError("OPENAI_API_KEY environment variable not set")
             
             # Initialize evaluator
-            from gpt5_evaluator_agent import GPT5EvaluatorAgent
-            evaluator = GPT5EvaluatorAgent(api_key)
+            from gpt5_evaluator_agent import CachedEvaluator
+            evaluator = CachedEvaluator(api_key)
             print("✅ GPT5 Evaluator Agent initialized successfully")
             
             # Test with a simple evaluation
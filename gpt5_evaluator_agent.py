@@ -10,15 +10,20 @@ Date: August 11, 2025
 Phase: 6 - Evaluation Phase
 """
 
-import json
+import asyncio
+import hashlib
 import logging
 import os
 import time
+import weakref
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import openai
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAI
+from tenacity import before_sleep_log, retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +32,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Evaluations in flight at once during batch evaluation, to stay under RPM/TPM limits
+BATCH_CONCURRENCY = 10
+
+# Attempts per GPT-5 call, with jittered exponential backoff of up to 30s between them
+MAX_ATTEMPTS = 3
+RETRY_MAX_WAIT = 30
+
+# API errors worth another attempt: rate limits, timeouts, dropped connections and 5xx
+TRANSIENT_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)
+
+# Shared by the sync and async completion calls; the SDK's own retries are disabled so attempts don't multiply
+retry_transient = retry(
+    retry=retry_if_exception_type(TRANSIENT_ERRORS),
+    wait=wait_random_exponential(multiplier=1, max=RETRY_MAX_WAIT),
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+# Offline Batch API runs: seconds between status checks, and the states a batch ends in
+BATCH_POLL_INTERVAL = 30
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# CachedEvaluator store: one JSON result per distinct evaluation request
+EVALUATION_CACHE_DIR = os.path.join("evaluation_results", ".cache")
+
+# Append-only listing metadata, one line per saved result file, so listing never opens the results
+EVALUATION_INDEX_FILE = os.path.join("evaluation_results", "index.jsonl")
+
+
+def file_timestamp() -> str:
+    """Local-time stamp for report filenames, with a short suffix so saves within one second don't collide."""
+    ns = time.time_ns()
+    return f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(ns // 1_000_000_000))}_{ns & 0xFFFF:04x}"
+
 
 @dataclass
 class EvaluationCriteria:
@@ -70,7 +110,7 @@ class EvaluationResult:
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
 
 
 class GPT5EvaluatorAgent:
@@ -92,6 +132,8 @@ class GPT5EvaluatorAgent:
         self.api_key = api_key
         self.model = model
         self.client = OpenAI(api_key=api_key)
+        # httpx async pools are bound to the loop that opened them, so async clients are cached per loop
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
         self.criteria = EvaluationCriteria()
         
         # Validate model is GPT-5 variant or GPT-4o (as fallback)
@@ -114,6 +156,16 @@ class GPT5EvaluatorAgent:
             logger.error("System prompt file not found. Using fallback prompt.")
             return self._get_fallback_prompt()
     
+    @cached_property
+    def system_prompt(self) -> str:
+        """
+        System prompt shared by every evaluation request, read once.
+        
+        Sending the identical (~3k token) rubric first in every request lets
+        OpenAI's automatic prompt caching reuse it across evaluations.
+        """
+        return self.load_system_prompt()
+    
     def _get_fallback_prompt(self) -> str:
         """Fallback system prompt if file cannot be loaded."""
         return """You are the GPT5 Evaluator Agent, an expert AI judge responsible for objectively assessing the quality and effectiveness of responses from specialized business intelligence agents in the Energy Property AI System.
@@ -152,31 +204,58 @@ Output your evaluation in the exact format specified in the system prompt."""
         start_time = time.time()
         
         try:
-            # Prepare evaluation prompt
-            evaluation_prompt = self._prepare_evaluation_prompt(
-                agent_type, query, response, context
-            )
+            evaluation_prompt = self._prepare_evaluation_prompt(agent_type, query, response, context)
             
             # Get GPT-5 evaluation
             evaluation_text = self._call_gpt5(evaluation_prompt)
-            
-            # Parse evaluation results
-            evaluation_result = self._parse_evaluation_result(
-                evaluation_text, agent_type, query, response
-            )
-            
-            # Calculate weighted scores
-            evaluation_result = self._calculate_weighted_scores(evaluation_result)
-            
-            execution_time = time.time() - start_time
-            logger.info(f"Evaluation completed in {execution_time:.2f} seconds")
-            
-            return evaluation_result
-            
+            return self._score_evaluation(evaluation_text, agent_type, query, response, start_time)
         except Exception as e:
             logger.error(f"Evaluation failed: {str(e)}")
             raise
     
+    async def aevaluate_response(
+        self, 
+        agent_type: str, 
+        query: str, 
+        response: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> EvaluationResult:
+        """
+        Evaluate an agent response using GPT-5 without blocking the event loop.
+        
+        Same arguments and result as evaluate_response, so many evaluations
+        can overlap their API round-trips.
+        """
+        logger.info(f"Starting evaluation of {agent_type} response")
+        start_time = time.time()
+        
+        try:
+            evaluation_prompt = self._prepare_evaluation_prompt(agent_type, query, response, context)
+            evaluation_text = await self._acall_gpt5(evaluation_prompt)
+            return self._score_evaluation(evaluation_text, agent_type, query, response, start_time)
+        except Exception as e:
+            logger.error(f"Evaluation failed: {str(e)}")
+            raise
+    
+    def _score_evaluation(
+        self,
+        evaluation_text: str,
+        agent_type: str,
+        query: str,
+        response: str,
+        start_time: float
+    ) -> EvaluationResult:
+        """Parse GPT-5's evaluation text and compute the weighted scores."""
+        evaluation_result = self._parse_evaluation_result(
+            evaluation_text, agent_type, query, response
+        )
+        evaluation_result = self._calculate_weighted_scores(evaluation_result)
+        
+        execution_time = time.time() - start_time
+        logger.info(f"Evaluation completed in {execution_time:.2f} seconds")
+        
+        return evaluation_result
+    
     def _prepare_evaluation_prompt(
         self, 
         agent_type: str, 
@@ -225,6 +304,75 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
             context_info += f"- {key}: {value}\n"
         return context_info
     
+    def _evaluation_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Chat messages for one evaluation request."""
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _log_prompt_cache_usage(self, response) -> None:
+        """Log how much of the prompt OpenAI served from its prompt cache."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        if usage and details:
+            logger.info(f"Prompt cache: {details.cached_tokens or 0}/{usage.prompt_tokens} prompt tokens cached")
+    
+    def _get_async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(api_key=self.api_key, max_retries=0)
+            self._async_clients[loop] = client
+        return client
+    
+    @retry_transient
+    async def _acreate_completion(self, prompt: str):
+        """One evaluation chat completion on the async client, retried on transient errors."""
+        return await self._get_async_client().chat.completions.create(
+            model=self.model,
+            messages=self._evaluation_messages(prompt),
+            timeout=120  # 120 second timeout
+        )
+    
+    @retry_transient
+    def _create_completion(self, prompt: str):
+        """One evaluation chat completion, retried on transient errors."""
+        return self.client.with_options(max_retries=0).chat.completions.create(
+            model=self.model,
+            messages=self._evaluation_messages(prompt),
+            timeout=120  # 120 second timeout
+        )
+    
+    async def _acall_gpt5(self, prompt: str) -> str:
+        """
+        Call GPT-5 API for evaluation on the async client.
+        
+        Args:
+            prompt: Evaluation prompt to send to GPT-5
+            
+        Returns:
+            GPT-5 evaluation response
+        """
+        try:
+            logger.info("Calling GPT-5 API for evaluation")
+            
+            response = await self._acreate_completion(prompt)
+            
+            evaluation_text = response.choices[0].message.content
+            logger.info("GPT-5 evaluation received successfully")
+            self._log_prompt_cache_usage(response)
+            
+            return evaluation_text
+            
+        except openai.APIError as e:
+            logger.error(f"OpenAI API error: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error calling GPT-5: {str(e)}")
+            raise
+    
     def _call_gpt5(self, prompt: str) -> str:
         """
         Call GPT-5 API for evaluation.
@@ -238,17 +386,11 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
         try:
             logger.info("Calling GPT-5 API for evaluation")
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.load_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                timeout=120  # 120 second timeout
-            )
+            response = self._create_completion(prompt)
             
             evaluation_text = response.choices[0].message.content
             logger.info("GPT-5 evaluation received successfully")
+            self._log_prompt_cache_usage(response)
             
             return evaluation_text
             
@@ -479,29 +621,191 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
         """
         Evaluate multiple agent responses in batch.
         
+        Runs abatch_evaluate on a fresh event loop; async callers must
+        await abatch_evaluate directly.
+        
         Args:
             evaluations: List of (agent_type, query, response, context) tuples
             
         Returns:
             List of EvaluationResult objects
+            
+        Raises:
+            RuntimeError: If called from a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.abatch_evaluate(evaluations))
+        raise RuntimeError(
+            "batch_evaluate cannot run inside a running event loop; await abatch_evaluate instead"
+        )
+    
+    async def abatch_evaluate(
+        self, 
+        evaluations: List[Tuple[str, str, str, Optional[Dict[str, Any]]]],
+        max_concurrency: int = BATCH_CONCURRENCY
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate multiple agent responses concurrently.
+        
+        Args:
+            evaluations: List of (agent_type, query, response, context) tuples
+            max_concurrency: Maximum evaluations in flight at once
+            
+        Returns:
+            List of successful EvaluationResult objects, in input order
         """
         logger.info(f"Starting batch evaluation of {len(evaluations)} responses")
-        results = []
+        unique, positions = self._deduplicate(evaluations)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def evaluate_one(i, agent_type, query, response, context):
+            async with semaphore:
+                logger.info(f"Evaluating response {i+1}/{len(unique)}: {agent_type}")
+                return await self.aevaluate_response(agent_type, query, response, context)
+        
+        outcomes = await asyncio.gather(
+            *[evaluate_one(i, *evaluation) for i, evaluation in enumerate(unique)],
+            return_exceptions=True
+        )
+        
+        results = self._fan_out(
+            {j: outcome for j, outcome in enumerate(outcomes) if not isinstance(outcome, Exception)},
+            positions
+        )
+        for j, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to evaluate response {j+1}: {str(outcome)}")
         
-        for i, (agent_type, query, response, context) in enumerate(evaluations):
+        logger.info(f"Batch evaluation completed: {len(results)}/{len(evaluations)} successful")
+        return results
+    
+    def batch_evaluate_via_batch_api(
+        self, 
+        evaluations: List[Tuple[str, str, str, Optional[Dict[str, Any]]]],
+        poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate multiple agent responses through the OpenAI Batch API.
+        
+        Requests are uploaded as one JSONL file and processed offline at
+        batch pricing (completion window up to 24h). Blocks, polling the
+        batch status, until it finishes.
+        
+        Args:
+            evaluations: List of (agent_type, query, response, context) tuples
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            List of successful EvaluationResult objects, in input order
+        """
+        unique, positions = self._deduplicate(evaluations)
+        logger.info(f"Submitting {len(unique)} evaluations to the Batch API")
+        
+        # One request line per evaluation; custom_id maps results back since output order is not guaranteed.
+        # Lines are grouped by agent type, so requests sharing the longest prompt prefix run back to back
+        request_lines = []
+        for i in sorted(range(len(unique)), key=lambda i: unique[i][0]):
+            agent_type, query, response, context = unique[i]
+            prompt = self._prepare_evaluation_prompt(agent_type, query, response, context)
+            request_lines.append(orjson.dumps({
+                "custom_id": f"evaluation-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": self.model, "messages": self._evaluation_messages(prompt)}
+            }))
+        
+        try:
+            batch_file = self.client.files.create(
+                file=("evaluations.jsonl", b"\n".join(request_lines)),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Batch {batch.id} submitted, polling every {poll_interval}s")
+            
+            while batch.status not in BATCH_TERMINAL_STATUSES:
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"Batch {batch.id} ended with status: {batch.status}")
+                return []
+            
+            output = self.client.files.content(batch.output_file_id).text
+            
+        except openai.APIError as e:
+            logger.error(f"Batch API error: {str(e)}")
+            raise
+        
+        # Map each output line back to its evaluation by custom_id
+        evaluation_texts = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            body = (record.get("response") or {}).get("body") or {}
+            if record.get("error") or not body.get("choices"):
+                logger.error(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            evaluation_texts[record["custom_id"]] = body["choices"][0]["message"]["content"]
+        
+        unique_results = {}
+        for i, (agent_type, query, response, _) in enumerate(unique):
+            evaluation_text = evaluation_texts.get(f"evaluation-{i}")
+            if evaluation_text is None:
+                continue
             try:
-                logger.info(f"Evaluating response {i+1}/{len(evaluations)}: {agent_type}")
-                result = self.evaluate_response(agent_type, query, response, context)
-                results.append(result)
-                
-                # Small delay to avoid rate limiting
-                time.sleep(1)
-                
+                result = self._parse_evaluation_result(evaluation_text, agent_type, query, response)
+                unique_results[i] = self._calculate_weighted_scores(result)
             except Exception as e:
-                logger.error(f"Failed to evaluate response {i+1}: {str(e)}")
-                # Continue with next evaluation
+                logger.error(f"Failed to parse batch evaluation {i+1}: {str(e)}")
+        results = self._fan_out(unique_results, positions)
         
-        logger.info(f"Batch evaluation completed: {len(results)}/{len(evaluations)} successful")
+        logger.info(f"Batch API evaluation completed: {len(results)}/{len(evaluations)} successful")
+        return results
+    
+    def _deduplicate(
+        self, 
+        evaluations: List[Tuple[str, str, str, Optional[Dict[str, Any]]]]
+    ) -> Tuple[List[Tuple[str, str, str, Optional[Dict[str, Any]]]], List[int]]:
+        """
+        Collapse identical evaluation requests so each is sent only once.
+        
+        Returns:
+            The unique evaluations, and for each input the index of its unique evaluation
+        """
+        unique_index: Dict[Tuple[str, str, str, bytes], int] = {}
+        unique = []
+        positions = []
+        for evaluation in evaluations:
+            agent_type, query, response, context = evaluation
+            # Context dicts are unhashable, so they are keyed by their canonical JSON
+            key = (agent_type, query, response,
+                   orjson.dumps(context, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str))
+            if key not in unique_index:
+                unique_index[key] = len(unique)
+                unique.append(evaluation)
+            positions.append(unique_index[key])
+        
+        if len(unique) < len(evaluations):
+            logger.info(f"Deduplicated {len(evaluations)} evaluations to {len(unique)} unique requests")
+        return unique, positions
+    
+    def _fan_out(self, unique_results: Dict[int, EvaluationResult], positions: List[int]) -> List[EvaluationResult]:
+        """Results in input order, with each duplicate getting its own copy of the shared result."""
+        results = []
+        used = set()
+        for position in positions:
+            result = unique_results.get(position)
+            if result is None:
+                continue
+            results.append(replace(result) if position in used else result)
+            used.add(position)
         return results
     
     def save_batch_evaluation_results(self, results: List[EvaluationResult], batch_name: str = None) -> str:
@@ -550,9 +854,10 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
                 }
             }
             
-            # Save the batch
-            with open(filepath, 'w') as f:
-                json.dump(batch_data, f, indent=2)
+            # Save the batch (orjson encodes straight to bytes in C)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(batch_data, option=orjson.OPT_INDENT_2))
+            self._append_to_index(batch_name, batch_data)
             
             logger.info(f"Batch evaluation results saved to {filepath}")
             return filepath
@@ -591,8 +896,10 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
             filepath = os.path.join(evaluation_dir, filename)
             
             # Save the result
-            with open(filepath, 'w') as f:
-                json.dump(result.to_dict(), f, indent=2)
+            data = result.to_dict()
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            self._append_to_index(filename, data)
             
             logger.info(f"Evaluation result saved to {filepath}")
             return filepath
@@ -661,43 +968,29 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
             if not os.path.exists(evaluation_dir):
                 return []
             
-            results = []
-            files = sorted(os.listdir(evaluation_dir), reverse=True)
+            if not os.path.exists(EVALUATION_INDEX_FILE):
+                self._rebuild_index(evaluation_dir)
             
-            for filename in files[:limit]:
-                if filename.endswith('.json'):
-                    filepath = os.path.join(evaluation_dir, filename)
-                    try:
-                        with open(filepath, 'r') as f:
-                            data = json.load(f)
-                        
-                        # Extract metadata
-                        if isinstance(data, dict):
-                            if 'batch_info' in data:
-                                # Batch evaluation file
-                                metadata = {
-                                    "filename": filename,
-                                    "type": "batch",
-                                    "timestamp": data.get('batch_info', {}).get('timestamp', ''),
-                                    "total_evaluations": data.get('batch_info', {}).get('total_evaluations', 0),
-                                    "batch_name": data.get('batch_info', {}).get('batch_name', ''),
-                                    "average_score": data.get('summary', {}).get('average_score', 0),
-                                    "filepath": filepath
-                                }
-                            else:
-                                # Individual evaluation file
-                                metadata = {
-                                    "filename": filename,
-                                    "type": "individual",
-                                    "timestamp": data.get('timestamp', ''),
-                                    "agent_type": data.get('agent_type', ''),
-                                    "total_score": data.get('total_score', 0),
-                                    "filepath": filepath
-                                }
-                            results.append(metadata)
-                    except Exception as e:
-                        logger.warning(f"Failed to read {filename}: {str(e)}")
-                        continue
+            with open(EVALUATION_INDEX_FILE, 'rb') as f:
+                lines = f.read().splitlines()
+            
+            # Newest saves are at the end; a re-saved filename keeps only its latest entry
+            results = []
+            seen = set()
+            for line in reversed(lines):
+                if len(results) >= limit:
+                    break
+                try:
+                    metadata = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                filename = metadata["filename"]
+                filepath = os.path.join(evaluation_dir, filename)
+                if filename in seen or not os.path.exists(filepath):
+                    continue
+                seen.add(filename)
+                metadata["filepath"] = filepath
+                results.append(metadata)
             
             return results
             
@@ -705,6 +998,59 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
             logger.error(f"Failed to list evaluation results: {str(e)}")
             return []
     
+    def _index_metadata(self, filename: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Listing metadata for a saved result file."""
+        if 'batch_info' in data:
+            # Batch evaluation file
+            return {
+                "filename": filename,
+                "type": "batch",
+                "timestamp": data.get('batch_info', {}).get('timestamp', ''),
+                "total_evaluations": data.get('batch_info', {}).get('total_evaluations', 0),
+                "batch_name": data.get('batch_info', {}).get('batch_name', ''),
+                "average_score": data.get('summary', {}).get('average_score', 0)
+            }
+        # Individual evaluation file
+        return {
+            "filename": filename,
+            "type": "individual",
+            "timestamp": data.get('timestamp', ''),
+            "agent_type": data.get('agent_type', ''),
+            "total_score": data.get('total_score', 0)
+        }
+    
+    def _append_to_index(self, filename: str, data: Dict[str, Any]) -> None:
+        """Record a saved result file in the listing index."""
+        # Without an index yet, the next listing rebuilds it from a full scan that includes this file
+        if not os.path.exists(EVALUATION_INDEX_FILE):
+            return
+        try:
+            with open(EVALUATION_INDEX_FILE, 'ab') as f:
+                f.write(orjson.dumps(self._index_metadata(filename, data), option=orjson.OPT_APPEND_NEWLINE))
+        except OSError as e:
+            logger.warning(f"Failed to update evaluation index: {str(e)}")
+    
+    def _rebuild_index(self, evaluation_dir: str) -> None:
+        """Write the listing index from a one-time scan of existing result files."""
+        entries = []
+        with os.scandir(evaluation_dir) as it:
+            # Oldest name first, so the newest-first listing matches the previous reverse name order
+            for entry in sorted((e for e in it if e.is_file() and e.name.endswith('.json')), key=lambda e: e.name):
+                try:
+                    with open(entry.path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                except Exception as e:
+                    logger.warning(f"Failed to read {entry.name}: {str(e)}")
+                    continue
+                if isinstance(data, dict):
+                    entries.append(orjson.dumps(self._index_metadata(entry.name, data), option=orjson.OPT_APPEND_NEWLINE))
+        
+        tmp_path = f"{EVALUATION_INDEX_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(b"".join(entries))
+        os.replace(tmp_path, EVALUATION_INDEX_FILE)
+        logger.info(f"Rebuilt evaluation index with {len(entries)} entries")
+    
     def get_evaluation_result(self, filename: str) -> Dict[str, Any]:
         """
         Retrieve a specific evaluation result by filename.
@@ -720,14 +1066,113 @@ Remember to use the 1-4 scale for each criterion and calculate the weighted 1-10
             if not os.path.exists(filepath):
                 raise FileNotFoundError(f"Evaluation file not found: {filename}")
             
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
                 
         except Exception as e:
             logger.error(f"Failed to retrieve evaluation result {filename}: {str(e)}")
             raise
 
 
+class CachedEvaluator(GPT5EvaluatorAgent):
+    """
+    GPT5 Evaluator Agent that reuses results for repeated evaluations.
+    
+    Results are stored on disk keyed by SHA-256 of (agent type, query,
+    response, context, model, rubric), so re-evaluating an identical response
+    costs no API call, while a changed system prompt or model starts fresh.
+    Set EVALUATION_CACHE=0 to always call GPT-5.
+    """
+    
+    def __init__(self, api_key: str, model: str = "gpt-5", cache_dir: str = EVALUATION_CACHE_DIR):
+        super().__init__(api_key, model)
+        self.cache_dir = cache_dir
+        self.cache_enabled = os.getenv("EVALUATION_CACHE", "1") != "0"
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    @cached_property
+    def _rubric_digest(self) -> str:
+        """SHA-256 of the evaluation system prompt, so rubric edits invalidate cached scores."""
+        return hashlib.sha256(self.system_prompt.encode()).hexdigest()
+    
+    def _cache_path(self, agent_type: str, query: str, response: str, context: Optional[Dict[str, Any]]) -> str:
+        """Cache file for an evaluation request."""
+        # JSON-encode the fields so different splits of the same text cannot collide
+        key_material = orjson.dumps([agent_type, query, response, context, self.model, self._rubric_digest],
+                                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        digest = hashlib.sha256(key_material).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def _load_cached(self, path: str) -> Optional[EvaluationResult]:
+        """Cached result at path, if present and readable."""
+        if not self.cache_enabled:
+            return None
+        try:
+            with open(path, "rb") as f:
+                result = EvaluationResult(**orjson.loads(f.read()))
+        except (OSError, ValueError, TypeError):
+            self.cache_misses += 1
+            return None
+        self.cache_hits += 1
+        logger.info(f"Evaluation cache hit ({self.cache_hit_rate:.0%} hit rate): {result.agent_type}")
+        return result
+    
+    def _store(self, path: str, result: EvaluationResult) -> None:
+        """Write a result atomically so concurrent readers never see a partial file."""
+        # Ratings run 1-4; a 0 means the reply was empty or unparseable, so the next call should retry
+        ratings = (result.factuality_rating, result.data_source_validation_rating,
+                   result.instruction_following_rating, result.conciseness_rating,
+                   result.completeness_rating)
+        if 0 in ratings:
+            logger.warning(f"Not caching evaluation with unparsed ratings: {result.agent_type}")
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(result.to_dict()))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache evaluation result: {str(e)}")
+    
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of cached lookups served from disk."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+    
+    def evaluate_response(
+        self, 
+        agent_type: str, 
+        query: str, 
+        response: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> EvaluationResult:
+        """Evaluate an agent response, serving identical requests from the cache."""
+        path = self._cache_path(agent_type, query, response, context)
+        result = self._load_cached(path)
+        if result is None:
+            result = super().evaluate_response(agent_type, query, response, context)
+            self._store(path, result)
+        return result
+    
+    async def aevaluate_response(
+        self, 
+        agent_type: str, 
+        query: str, 
+        response: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> EvaluationResult:
+        """Async evaluate_response, serving identical requests from the cache."""
+        path = self._cache_path(agent_type, query, response, context)
+        result = self._load_cached(path)
+        if result is None:
+            result = await super().aevaluate_response(agent_type, query, response, context)
+            self._store(path, result)
+        return result
+
+
 def main():
     """Main function for testing the GPT5 Evaluator Agent."""
     import os
@@ -130,6 +130,9 @@ class IntegrationTester:
             # Initialize Enhanced Workflow Engine
             workflow_engine = EnhancedWorkflowEngine(fast_mcp_client)
             
+            # Start the optimizer's background cleanup and monitoring tasks
+            await self.performance_optimizer.start()
+            
             # Store system components
             self.system = {
                 'fast_mcp_client': fast_mcp_client,
@@ -5,13 +5,19 @@ Phase 3: Enhanced with Real Claude-Powered Agents
 
 import asyncio
 import json
+import os
+from contextlib import aclosing
 from datetime import datetime
-from typing import TypedDict, Annotated, List, Dict, Any
+from typing import TypedDict, Annotated, List, Dict, Any, AsyncIterator, Tuple
 import operator
 from pathlib import Path
 
 # Import our real Claude agents
 from claude_agents import ClaudeAgentFactory
+from o3_orchestrator import O3Orchestrator
+
+# Agents allowed to call the LLM at once in parallel mode; provider rate limits flatten throughput beyond this
+MAX_PARALLEL_AGENTS = 48
 
 # Custom merge function for agent outputs
 def merge_agent_outputs(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
@@ -309,6 +315,76 @@ class LangGraphWorkflow:
             state["workflow_status"] = "failed"
             return state
     
+    async def _run_agent(self, agent_config: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Execute one agent from its spec entry, recording failures as its output"""
+        agent_id = agent_config["agent_id"]
+        try:
+            async with semaphore:
+                agent = self.agent_factory.create_agent(agent_id, self.fast_mcp_client)
+                result = await agent.execute(
+                    directives=agent_config["directives"],
+                    data_sources=agent_config["data_sources"]
+                )
+            print(f"✅ {agent_id} completed: {result.get('status', 'unknown')}")
+            return result
+        except Exception as error:
+            print(f"❌ {agent_id} failed: {error}")
+            return {
+                "error": str(error),
+                "status": "failed"
+            }
+    
+    async def execute_parallel(self, orchestration_spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute every agent of a spec batch by batch, then synthesize their outputs
+        
+        Args:
+            orchestration_spec: Orchestration specification
+            
+        Returns:
+            Final output of the synthesis agent
+        """
+        final_output = {}
+        async for agent_id, output in self.stream_parallel(orchestration_spec):
+            if agent_id == "synthesis_agent":
+                final_output = output
+        return final_output
+    
+    async def stream_parallel(self, orchestration_spec: Dict[str, Any]) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Execute every agent of a spec batch by batch, yielding outputs as agents finish
+        
+        Batches are run by O3Orchestrator.stream_dag: agents within one batch
+        are independent and run concurrently, at most MAX_PARALLEL_AGENTS at once.
+        
+        Args:
+            orchestration_spec: Orchestration specification
+            
+        Yields:
+            (agent_id, output) per agent in completion order, then ("synthesis_agent", final_output)
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_AGENTS)
+        
+        async def run(agent_config):
+            return await self._run_agent(agent_config, semaphore)
+        
+        agent_outputs = {}
+        # Closing the batch stream with this generator cancels agents still running
+        async with aclosing(O3Orchestrator.stream_dag(orchestration_spec, run)) as results:
+            async for agent_id, output in results:
+                agent_outputs[agent_id] = output
+                yield agent_id, output
+        
+        state = AgentState(
+            orchestration_spec=orchestration_spec,
+            agent_outputs=agent_outputs,
+            current_agent="",
+            workflow_status="agents_completed",
+            final_output=""
+        )
+        state = await self._synthesis_agent_worker(state)
+        yield "synthesis_agent", state["final_output"]
+    
     def _get_agent_config(self, orchestration_spec: Dict[str, Any], agent_id: str) -> Dict[str, Any]:
         """Get agent configuration from orchestration spec"""
         agents = orchestration_spec.get("workflow", {}).get("agents", [])
@@ -325,15 +401,19 @@ class WorkflowEngine:
         self.fast_mcp_client = fast_mcp_client
         self.workflow = LangGraphWorkflow(fast_mcp_client)
         self.workflow_graph = self.workflow._build_workflow()
+        # WORKFLOW_PARALLEL=1 runs independent agents concurrently instead of through the graph
+        self.parallel = os.getenv("WORKFLOW_PARALLEL") == "1"
         
         print("🚀 Workflow Engine initialized with Claude agents")
     
-    async def execute_orchestration(self, orchestration_file: str) -> Dict[str, Any]:
+    async def execute_orchestration(self, orchestration_file: str,
+                                    orchestration_spec: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Execute orchestration using real Claude agents
         
         Args:
             orchestration_file: Path to orchestration specification file
+            orchestration_spec: Already-loaded specification; skips reading the file
             
         Returns:
             Final output from the workflow execution
@@ -342,8 +422,15 @@ class WorkflowEngine:
         
         try:
             # Load orchestration specification
-            with open(orchestration_file, 'r') as file:
-                orchestration_spec = json.load(file)
+            if orchestration_spec is None:
+                with open(orchestration_file, 'r') as file:
+                    orchestration_spec = json.load(file)
+            
+            if self.parallel:
+                print("🚀 Starting parallel workflow execution with Claude agents...")
+                final_output = await self.workflow.execute_parallel(orchestration_spec)
+                print(f"✅ Workflow execution completed: {final_output.get('status', 'unknown')}")
+                return final_output
             
             # Initialize workflow state
             initial_state = AgentState(
@@ -372,6 +459,51 @@ class WorkflowEngine:
                 "timestamp": datetime.utcnow().isoformat()
             }
     
+    async def stream_orchestration(self, orchestration_file: str,
+                                   orchestration_spec: Dict[str, Any] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Execute orchestration, yielding each agent's output as soon as it finishes
+        
+        Args:
+            orchestration_file: Path to orchestration specification file
+            orchestration_spec: Already-loaded specification; skips reading the file
+            
+        Yields:
+            (agent_id, output) per worker agent, then ("synthesis_agent", final_output)
+        """
+        print(f"🔄 Streaming orchestration: {orchestration_file}")
+        
+        if orchestration_spec is None:
+            with open(orchestration_file, 'r') as file:
+                orchestration_spec = json.load(file)
+        
+        if self.parallel:
+            async for event in self.workflow.stream_parallel(orchestration_spec):
+                yield event
+            return
+        
+        initial_state = AgentState(
+            orchestration_spec=orchestration_spec,
+            agent_outputs={},
+            current_agent="",
+            workflow_status="initialized",
+            final_output=""
+        )
+        
+        # Worker nodes return the whole outputs dict, so only the agents not yet seen are new
+        seen = set()
+        async for update in self.workflow_graph.astream(initial_state, stream_mode="updates"):
+            for node, node_state in update.items():
+                if not node_state:
+                    continue
+                if node == "synthesis_agent_worker":
+                    yield "synthesis_agent", node_state.get("final_output", {})
+                    continue
+                for agent_id, output in (node_state.get("agent_outputs") or {}).items():
+                    if agent_id not in seen:
+                        seen.add(agent_id)
+                        yield agent_id, output
+    
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get workflow engine status"""
         return {
@@ -4,10 +4,9 @@ Phase 1: Foundation Setup - Main Integration
 """
 
 import asyncio
-import json
-from datetime import datetime
 from pathlib import Path
 import os
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -17,6 +16,28 @@ load_dotenv()
 from fast_mcp_connectors import FastMCPClient
 from o3_orchestrator import O3Orchestrator
 from langgraph_workflow import WorkflowEngine
+from timestamps import utc_iso
+
+# Static part of the orchestration used to smoke-test the workflow engine; the
+# timestamp is added each time the test file is written
+_INIT_TEST_ORCHESTRATION = {
+    "orchestration_id": "init-test",
+    "user_query": "Test initialization",
+    "workflow": {
+        "agents": [
+            {
+                "agent_id": "operations_summary_agent",
+                "directives": ["Test agent"],
+                "data_sources": ["installed_assets"]
+            }
+        ],
+        "execution_order": ["operations_summary_agent"],
+        "final_synthesis": {
+            "agent_id": "synthesis_agent",
+            "directives": ["Test synthesis"]
+        }
+    }
+}
 
 class EnergyPropertyAISystem:
     """Main AI System Integration"""
@@ -51,29 +72,9 @@ class EnergyPropertyAISystem:
             )
             
             # Test workflow engine
-            test_orchestration = {
-                "orchestration_id": "init-test",
-                "timestamp": datetime.utcnow().isoformat(),
-                "user_query": "Test initialization",
-                "workflow": {
-                    "agents": [
-                        {
-                            "agent_id": "operations_summary_agent",
-                            "directives": ["Test agent"],
-                            "data_sources": ["installed_assets"]
-                        }
-                    ],
-                    "execution_order": ["operations_summary_agent"],
-                    "final_synthesis": {
-                        "agent_id": "synthesis_agent",
-                        "directives": ["Test synthesis"]
-                    }
-                }
-            }
-            
-            # Save test orchestration
-            with open("init_test_orchestration.json", 'w') as file:
-                json.dump(test_orchestration, file, indent=2)
+            Path("init_test_orchestration.json").write_bytes(
+                orjson.dumps({**_INIT_TEST_ORCHESTRATION, "timestamp": utc_iso()}, option=orjson.OPT_INDENT_2)
+            )
             
             # Test workflow execution
             test_result = await self.workflow_engine.execute_orchestration(
@@ -141,7 +142,7 @@ class EnergyPropertyAISystem:
         """Get system status and component health"""
         status = {
             "initialized": self.initialized,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_iso(),
             "components": {
                 "fast_mcp_client": "ready" if self.initialized else "not_initialized",
                 "o3_orchestrator": "ready" if self.initialized else "not_initialized",
@@ -5,8 +5,37 @@ Model Test
 Test different models to see what's working.
 """
 
+import asyncio
 import os
-from openai import OpenAI
+import time
+from pathlib import Path
+
+import orjson
+from openai import AsyncOpenAI, NotFoundError, PermissionDeniedError
+
+from shared_openai_client import get_client
+
+# Models that failed recently are skipped until the TTL expires
+FAILURE_CACHE_PATH = Path.home() / ".cache" / "energy_property" / "model_availability.json"
+FAILURE_CACHE_TTL = 24 * 60 * 60
+
+# Only errors saying the model is unavailable to this key are cached; rate limits,
+# timeouts and connection errors are transient and probed again on the next run
+PERMANENT_ERRORS = (NotFoundError, PermissionDeniedError)
+
+
+def load_failure_cache() -> dict:
+    """Load the persisted model failure cache."""
+    try:
+        return orjson.loads(FAILURE_CACHE_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def save_failure_cache(cache: dict) -> None:
+    """Persist the model failure cache."""
+    FAILURE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    FAILURE_CACHE_PATH.write_bytes(orjson.dumps(cache))
 
 
 def test_models():
@@ -25,8 +54,6 @@ def test_models():
     if not api_key:
         return
     
-    client = OpenAI(api_key=api_key)
-    
     # Test different models
     models_to_test = [
         "gpt-4o",
@@ -36,23 +63,54 @@ def test_models():
         "gpt-5-nano"
     ]
     
+    cache = load_failure_cache()
+    cutoff = time.time() - FAILURE_CACHE_TTL
+    
+    pending = []
     for model in models_to_test:
-        print(f"\n🔍 Testing {model}...")
-        try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "user", "content": "Say 'Hello'"}
-                ],
-                max_completion_tokens=10
-            )
-            
-            result = response.choices[0].message.content
-            print(f"✅ {model}: '{result}'")
-            
-        except Exception as e:
-            print(f"❌ {model}: {str(e)}")
-            print(f"   Error type: {type(e).__name__}")
+        if cache.get(model, {}).get("failed_at", 0) > cutoff:
+            print(f"\n⏭️ Skipping {model} (cached failure: {cache[model].get('error')})")
+        else:
+            pending.append(model)
+    
+    if not pending:
+        print("\n⏭️ All models have cached failures; nothing to test")
+        return
+    
+    print(f"\n🔍 Testing {', '.join(pending)}...")
+    results = asyncio.run(probe_models(pending))
+    
+    for model, ok, detail, permanent in results:
+        if ok:
+            print(f"✅ {model}: '{detail}'")
+            cache.pop(model, None)
+        else:
+            print(f"❌ {model}: {detail}")
+            if permanent:
+                cache[model] = {"failed_at": time.time(), "error": detail}
+    
+    save_failure_cache(cache)
+
+
+async def probe_model(client: AsyncOpenAI, model: str):
+    """Send a minimal completion to a single model; failures report whether they are permanent."""
+    try:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "user", "content": "Say 'Hello'"}
+            ],
+            max_completion_tokens=10
+        )
+        return model, True, response.choices[0].message.content, False
+    except Exception as e:
+        return model, False, f"{type(e).__name__}: {e}", isinstance(e, PERMANENT_ERRORS)
+
+
+async def probe_models(models: list):
+    """Probe all models concurrently over the shared client."""
+    client = get_client()
+    return await asyncio.gather(*(probe_model(client, model) for model in models))
 
 
 if __name__ == "__main__":
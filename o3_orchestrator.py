@@ -3,14 +3,215 @@ o3 Orchestrator for Energy & Property Tech Inc.
 Phase 2: Enhanced with AI-powered orchestration generation
 """
 
-import json
-import uuid
-from datetime import datetime
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import secrets
+import struct
+import time
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, FrozenSet, Tuple, Callable, Awaitable, AsyncIterator
 
-# Import our AI service for intelligent orchestration
-from ai_service import AIService
+import aiofiles
+import aiofiles.tempfile
+import orjson
+import ormsgpack
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from typing_extensions import NotRequired, TypedDict
+
+from timestamps import utc_iso
+
+logger = logging.getLogger(__name__)
+
+class AgentDefinition(TypedDict):
+    """Agent entry of an orchestration workflow"""
+    __pydantic_config__ = ConfigDict(extra="allow")
+    agent_id: str
+    directives: List[str]
+    data_sources: List[str]
+    dependencies: NotRequired[List[str]]
+
+class WorkflowDefinition(TypedDict):
+    """Workflow section of an orchestration specification"""
+    __pydantic_config__ = ConfigDict(extra="allow")
+    agents: List[AgentDefinition]
+    execution_order: NotRequired[List[str]]
+    final_synthesis: NotRequired[Dict[str, Any]]
+
+class OrchestrationSpec(TypedDict):
+    """Fields the workflow engines require from an orchestration specification"""
+    __pydantic_config__ = ConfigDict(extra="allow")
+    orchestration_id: str
+    workflow: WorkflowDefinition
+
+# Structural spec check, compiled once into a pydantic-core validator. Unlisted keys are
+# kept, so validate_json also parses raw spec JSON without losing any fields.
+SPEC_VALIDATOR = TypeAdapter(OrchestrationSpec)
+
+# Keyword categories used to classify queries. The basic fallback orchestration
+# matches these as substrings, so "profitability" still counts as "profit".
+CATEGORY_KEYWORDS = {
+    "operations": ("performance", "analysis", "summary", "report"),
+    "upsell": ("upsell", "opportunity", "sales", "revenue"),
+    "campaign": ("campaign", "marketing", "strategy"),
+    "financial": ("financial", "roi", "revenue", "profit"),
+}
+CATEGORY_NAMES = tuple(CATEGORY_KEYWORDS)
+
+# Extra keywords recognized only by the fast path
+FAST_PATH_KEYWORDS = {
+    "financial": ("balance sheet",),
+}
+
+# Category bitmask per fast-path keyword; a keyword may belong to several categories
+KEYWORD_MASKS: Dict[str, int] = {}
+for _bit, _name in enumerate(CATEGORY_NAMES):
+    for _keyword in CATEGORY_KEYWORDS[_name] + FAST_PATH_KEYWORDS.get(_name, ()):
+        KEYWORD_MASKS[_keyword] = KEYWORD_MASKS.get(_keyword, 0) | (1 << _bit)
+
+# All keywords in one alternation, longest first, so a query is scanned once. Matches
+# whole words only (plus a plural "s"), so "roi" does not fire on "Detroit".
+KEYWORD_PATTERN = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, KEYWORD_MASKS), key=len, reverse=True)) + r")s?\b"
+)
+
+# Fallback agent definitions per keyword category. Inner sequences are tuples so the
+# shallow copy taken per spec cannot leak mutations back into the templates.
+AGENT_TEMPLATES = {
+    "operations": {
+        "agent_id": "operations_summary_agent",
+        "activation_trigger": "always",
+        "directives": (
+            "Generate operational summary",
+            "Identify key performance metrics",
+            "Highlight critical issues"
+        ),
+        "data_sources": ("installed_assets", "lead_funnel"),
+        "output_format": "json",
+        "dependencies": ()
+    },
+    "upsell": {
+        "agent_id": "upsell_discovery_agent",
+        "activation_trigger": "always",
+        "directives": (
+            "Find upsell opportunities",
+            "Prioritize by potential value",
+            "Include customer context"
+        ),
+        "data_sources": ("installed_assets", "products"),
+        "output_format": "json",
+        "dependencies": ()
+    },
+    "campaign": {
+        "agent_id": "campaign_planner_agent",
+        "activation_trigger": "after_upsell_discovery",
+        "directives": (
+            "Create marketing campaign plan",
+            "Define target audience",
+            "Calculate projected revenue"
+        ),
+        "data_sources": ("lead_funnel", "products"),
+        "output_format": "json",
+        "dependencies": ("upsell_discovery_agent",)
+    },
+    "financial": {
+        "agent_id": "financial_impact_agent",
+        "activation_trigger": "after_campaign_planner",
+        "directives": (
+            "Calculate financial impact",
+            "Analyze ROI projections",
+            "Provide quarterly forecasts"
+        ),
+        "data_sources": ("income_statement", "balance_sheet", "cash_flow"),
+        "output_format": "json",
+        "dependencies": ("campaign_planner_agent",)
+    },
+}
+
+# Used when no keyword category matches
+DEFAULT_AGENT_TEMPLATE = {
+    "agent_id": "operations_summary_agent",
+    "activation_trigger": "always",
+    "directives": (
+        "Analyze operational data",
+        "Generate summary report",
+        "Identify key insights"
+    ),
+    "data_sources": ("installed_assets", "lead_funnel"),
+    "output_format": "json",
+    "dependencies": ()
+}
+
+# Opt-in: short queries whose keywords name a single category skip the AI service.
+# Keywords are a coarse intent signal, so by default every query goes to the AI.
+FAST_PATH_ENABLED = os.getenv("ORCHESTRATOR_FAST_PATH") == "1"
+
+# Only queries of at most this many words are eligible for the fast path
+FAST_PATH_MAX_WORDS = 12
+
+# Multi-question queries are split on sentence boundaries into at most this many
+# marked rows, all answered by the single analysis call
+MAX_QUERY_ROWS = 5
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.?!])\s+")
+
+# Encoding of the orchestration log: "json" (NDJSON) or "msgpack" (length-prefixed frames).
+# Each format has its own file, so switching rebuilds the log from the spec files.
+ORCH_FORMAT = os.getenv("ORCH_FORMAT", "json").lower()
+LOG_FILENAMES = {
+    "json": "orchestrations.ndjson",
+    "msgpack": "orchestrations.msgpack",
+}
+_FRAME_HEADER = struct.Struct(">I")
+
+def _encode_log_entry(spec: Dict[str, Any]) -> bytes:
+    """Encode a spec as a single orchestration log entry"""
+    if ORCH_FORMAT == "msgpack":
+        packed = ormsgpack.packb(spec)
+        return _FRAME_HEADER.pack(len(packed)) + packed
+    return orjson.dumps(spec) + b"\n"
+
+def _decode_log_entries(data: bytes) -> List[bytes]:
+    """Split raw log contents into encoded entries"""
+    if ORCH_FORMAT != "msgpack":
+        return data.splitlines()
+    entries = []
+    offset = 0
+    while offset + _FRAME_HEADER.size <= len(data):
+        (length,) = _FRAME_HEADER.unpack_from(data, offset)
+        offset += _FRAME_HEADER.size
+        entries.append(data[offset:offset + length])
+        offset += length
+    return entries
+
+_decode_spec = ormsgpack.unpackb if ORCH_FORMAT == "msgpack" else orjson.loads
+
+# Log entries queued within this many seconds are appended together
+LOG_BATCH_WINDOW = 0.05
+
+# Maximum number of log entries appended in one write
+LOG_BATCH_SIZE = 64
+
+# Number of validation results memoized per orchestrator
+VALIDATION_CACHE_SIZE = 1024
+
+# Upper bound on spec files read concurrently when scanning the orchestrations directory
+MAX_CONCURRENT_READS = 16
+
+# Generated specs are reused for identical queries until they are a day old
+SPEC_CACHE_DIRNAME = "cache"
+SPEC_CACHE_TTL = 24 * 60 * 60
+
+@lru_cache(maxsize=1024)
+def _classify_normalized(query: str) -> FrozenSet[str]:
+    """Match a lowercased, whitespace-normalized query against the keyword categories"""
+    mask = 0
+    for match in KEYWORD_PATTERN.finditer(query):
+        mask |= KEYWORD_MASKS[match.group(1)]
+    return frozenset(name for bit, name in enumerate(CATEGORY_NAMES) if mask >> bit & 1)
 
 class O3Orchestrator:
     """Enhanced o3 Orchestrator with AI-powered orchestration generation"""
@@ -18,152 +219,322 @@ class O3Orchestrator:
     def __init__(self, fast_mcp_client):
         """Initialize the o3 orchestrator with AI service"""
         self.fast_mcp_client = fast_mcp_client
-        self.ai_service = AIService()
         
         # Create orchestrations directory if it doesn't exist
         self.orchestrations_dir = Path("orchestrations")
         self.orchestrations_dir.mkdir(exist_ok=True)
         
-        print("🎯 Enhanced o3 Orchestrator initialized with AI service")
+        # Append-only log with one entry per spec, used for listing and status
+        self.orchestration_log = self.orchestrations_dir / LOG_FILENAMES.get(ORCH_FORMAT, LOG_FILENAMES["json"])
+        
+        # (mtime_ns, size) of the log alongside the listing built from it
+        self._list_cache: Optional[Tuple[int, int, List[Dict[str, Any]]]] = None
+        
+        # Validation results keyed by spec content hash
+        self._validation_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        
+        # Write-behind queue coalescing log appends, drained by a background task
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_writer_task: Optional[asyncio.Task] = None
+        
+        # Serializes building the log from the spec files; asyncio locks bind to one loop
+        self._backfill_lock: Optional[asyncio.Lock] = None
+        self._backfill_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        logger.debug("🎯 Enhanced o3 Orchestrator initialized (AI service loads on first use)")
+    
+    @cached_property
+    def ai_service(self):
+        """AI service for intelligent orchestration, created on first use"""
+        from ai_service import AIService
+        return AIService()
     
-    async def generate_orchestration_spec(self, user_query: str) -> Dict[str, Any]:
+    async def generate_orchestration_spec(self, user_query: str,
+                                          skeleton: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate orchestration specification using AI-powered analysis
         
         Args:
             user_query: The user's business query
+            skeleton: Precomputed analysis for a known query, in the shape
+                analyze_query returns; skips the AI analysis step
             
         Returns:
             Complete orchestration specification
         """
-        print(f"🤖 Phase 2: AI-powered orchestration generation for: {user_query[:50]}...")
+        # Single-intent queries are served from the agent templates
+        if skeleton is None and FAST_PATH_ENABLED and len(user_query.split()) <= FAST_PATH_MAX_WORDS:
+            categories = self._fast_classify(user_query)
+            if len(categories) == 1:
+                return await self._generate_fast_path_orchestration(user_query, categories)
+        
+        logger.debug("🤖 Phase 2: AI-powered orchestration generation for: %s...", user_query[:50])
         
         try:
-            # Step 1: AI analyzes the query
-            print("🧠 Step 1: AI query analysis...")
-            analysis_result = await self.ai_service.analyze_query(user_query)
+            # Step 1: AI analyzes the query, assigning each sub-question to an agent
+            logger.debug("🧠 Step 1: AI query analysis...")
+            if skeleton is not None:
+                analysis_result = skeleton
+            else:
+                rows = self._split_rows(user_query)
+                analysis_result = await self.ai_service.analyze_query(user_query, rows if len(rows) > 1 else None)
+                self._apply_rows(analysis_result, rows)
             
             # Step 2: AI generates orchestration specification
-            print("🎯 Step 2: AI orchestration generation...")
+            logger.debug("🎯 Step 2: AI orchestration generation...")
             orchestration_spec = await self.ai_service.generate_orchestration_spec(
                 user_query, analysis_result
             )
             
             # Step 3: AI validates the orchestration
-            print("🔍 Step 3: AI orchestration validation...")
+            logger.debug("🔍 Step 3: AI orchestration validation...")
             validation_result = await self.ai_service.validate_orchestration(orchestration_spec)
             
             # Add validation results to the specification
             orchestration_spec["validation"] = validation_result
             
+            # Any step served by an AIService fallback makes the whole spec a fallback
+            if any(step.get("fallback_used") for step in (analysis_result, orchestration_spec, validation_result)):
+                orchestration_spec["fallback_used"] = True
+            
+            # Derive execution order and parallel batches from agent dependencies;
+            # a malformed graph keeps the AI's own order instead of discarding the spec
+            try:
+                self._apply_dag(orchestration_spec)
+            except (KeyError, TypeError, ValueError) as error:
+                logger.warning("⚠️ Could not derive agent batches, keeping AI execution order: %s", error)
+            
+            # Let later validate_orchestration_spec calls reuse this result
+            self._cache_validation(orchestration_spec, validation_result)
+            
             # Step 4: Save the orchestration
             await self.save_orchestration_spec(orchestration_spec)
             
-            print(f"✅ AI-powered orchestration completed successfully!")
-            print(f"📊 Analysis: {analysis_result.get('analysis', {}).get('query_type', 'unknown')} query")
-            print(f"🔍 Validation: {'Valid' if validation_result.get('is_valid', False) else 'Issues found'}")
-            print(f"🤖 Agents: {len(orchestration_spec.get('workflow', {}).get('agents', []))}")
+            logger.debug(
+                "✅ AI-powered orchestration completed: %s query, %s, %d agents",
+                analysis_result.get('analysis', {}).get('query_type', 'unknown'),
+                'valid' if validation_result.get('is_valid', False) else 'issues found',
+                len(orchestration_spec.get('workflow', {}).get('agents', []))
+            )
             
             return orchestration_spec
             
         except Exception as error:
-            print(f"❌ AI orchestration failed: {error}")
-            print("🔄 Falling back to basic orchestration...")
+            logger.warning("❌ AI orchestration failed, falling back to basic orchestration: %s", error)
             
             # Fallback to basic orchestration
             return await self._generate_basic_orchestration(user_query)
     
+    async def generate_cached_orchestration_spec(self, user_query: str,
+                                                 skeleton: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Generate an orchestration specification, reusing a fresh cached spec for the same query
+        
+        Args:
+            user_query: The user's business query
+            skeleton: Precomputed analysis passed on to generate_orchestration_spec
+            
+        Returns:
+            Orchestration specification
+        """
+        key = user_query.encode()
+        if skeleton is not None:
+            key += orjson.dumps(skeleton, option=orjson.OPT_SORT_KEYS)
+        cache_dir = self.orchestrations_dir / SPEC_CACHE_DIRNAME
+        cache_file = cache_dir / f"{hashlib.sha256(key).hexdigest()}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime < SPEC_CACHE_TTL:
+                async with aiofiles.open(cache_file, 'rb') as file:
+                    # Parse and structurally check in one pass; a broken entry is regenerated
+                    spec = SPEC_VALIDATOR.validate_json(await file.read())
+                logger.debug("♻️ Reusing cached orchestration: %s", cache_file)
+                return spec
+        except (OSError, ValidationError):
+            pass
+        
+        spec = await self.generate_orchestration_spec(user_query, skeleton)
+        # A fallback spec stands in for a failed AI call and must not outlive it
+        if spec and not spec.get("fallback_used"):
+            # Write under a unique temporary name so concurrent writers and readers never
+            # see a partial spec
+            cache_dir.mkdir(exist_ok=True)
+            async with aiofiles.tempfile.NamedTemporaryFile('wb', dir=cache_dir, suffix=".tmp",
+                                                            delete=False) as file:
+                await file.write(orjson.dumps(spec))
+            os.replace(file.name, cache_file)
+        return spec
+    
+    async def generate_and_execute(
+        self,
+        user_query: str,
+        workflow_engine,
+        on_spec: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        use_cache: bool = False,
+        skeleton: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Generate an orchestration and run it through a workflow engine in one call
+        
+        The generated spec is handed to the engine in memory instead of being
+        read back from its saved file.
+        
+        Args:
+            user_query: The user's business query
+            workflow_engine: Engine whose execute_orchestration runs the spec
+            on_spec: Called with the spec before execution starts, e.g. to
+                schedule side-effect writes that overlap the workflow
+            use_cache: Reuse a cached spec for the same query (see
+                generate_cached_orchestration_spec)
+            skeleton: Precomputed analysis for a known query (see
+                generate_orchestration_spec)
+            
+        Returns:
+            The orchestration specification and the workflow result
+        """
+        generate = self.generate_cached_orchestration_spec if use_cache else self.generate_orchestration_spec
+        orchestration_spec = await generate(user_query, skeleton)
+        if on_spec is not None:
+            on_spec(orchestration_spec)
+        
+        result = await workflow_engine.execute_orchestration(self._spec_path(orchestration_spec), orchestration_spec)
+        return orchestration_spec, result
+    
+    async def generate_and_stream(
+        self,
+        user_query: str,
+        workflow_engine,
+        on_spec: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        use_cache: bool = False,
+        skeleton: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Generate an orchestration and stream its agents' outputs as they finish
+        
+        Args:
+            user_query: The user's business query
+            workflow_engine: Engine whose stream_orchestration runs the spec
+            on_spec: Called with the spec before execution starts
+            use_cache: Reuse a cached spec for the same query
+            skeleton: Precomputed analysis for a known query
+            
+        Yields:
+            (agent_id, output) events from workflow_engine.stream_orchestration
+        """
+        generate = self.generate_cached_orchestration_spec if use_cache else self.generate_orchestration_spec
+        orchestration_spec = await generate(user_query, skeleton)
+        if on_spec is not None:
+            on_spec(orchestration_spec)
+        
+        async for event in workflow_engine.stream_orchestration(self._spec_path(orchestration_spec), orchestration_spec):
+            yield event
+    
+    def _spec_path(self, spec: Dict[str, Any]) -> str:
+        """Path save_orchestration_spec writes a spec to"""
+        return str(self.orchestrations_dir / f"orchestration_{spec['orchestration_id']}.json")
+    
+    @staticmethod
+    def _split_rows(user_query: str) -> List[str]:
+        """
+        Split a query into sub-question rows on sentence boundaries
+        
+        Sentences beyond MAX_QUERY_ROWS are merged into neighbouring rows so
+        every row still carries a similar share of the query.
+        """
+        sentences = [sentence for sentence in SENTENCE_BOUNDARY.split(user_query.strip()) if sentence]
+        if len(sentences) <= MAX_QUERY_ROWS:
+            return sentences
+        per_row, extra = divmod(len(sentences), MAX_QUERY_ROWS)
+        rows, start = [], 0
+        for index in range(MAX_QUERY_ROWS):
+            end = start + per_row + (index < extra)
+            rows.append(" ".join(sentences[start:end]))
+            start = end
+        return rows
+    
+    @staticmethod
+    def _apply_rows(analysis_result: Dict[str, Any], rows: List[str]) -> None:
+        """Add each answered row to the directives of the agent it was assigned to"""
+        agents = {agent.get("agent_id"): agent for agent in analysis_result.get("agents", [])}
+        for entry in analysis_result.get("rows", []):
+            if not isinstance(entry, dict):
+                continue
+            row, agent = entry.get("row"), agents.get(entry.get("agent_id"))
+            if agent is None or not isinstance(row, int) or not 1 <= row <= len(rows):
+                continue
+            agent.setdefault("directives", []).append(f"Answer: {rows[row - 1]}")
+    
+    @staticmethod
+    def _fast_classify(user_query: str) -> FrozenSet[str]:
+        """
+        Classify a query into keyword categories without calling the AI service
+        
+        Args:
+            user_query: The user's business query
+            
+        Returns:
+            Names of the categories whose keywords appear as whole words
+        """
+        return _classify_normalized(" ".join(user_query.lower().split()))
+    
+    async def _generate_fast_path_orchestration(self, user_query: str,
+                                                categories: FrozenSet[str]) -> Dict[str, Any]:
+        """Generate a templated orchestration for an unambiguous single-intent query"""
+        logger.debug("⚡ Fast path: %s query, skipping AI orchestration", ", ".join(sorted(categories)))
+        
+        return await self._build_template_orchestration(
+            user_query,
+            categories,
+            {"fallback_used": False, "fast_path": True},
+            {
+                "is_valid": True,
+                "issues": [],
+                "suggestions": ["Keyword fast path used; the spec was not validated by the AI service"]
+            }
+        )
+    
     async def _generate_basic_orchestration(self, user_query: str) -> Dict[str, Any]:
         """Generate basic orchestration when AI fails (fallback)"""
-        print("🔄 Generating basic orchestration as fallback...")
+        logger.debug("🔄 Generating basic orchestration as fallback...")
         
         # Simple keyword-based analysis (Phase 1 approach)
         query_lower = user_query.lower()
+        categories = frozenset(
+            name for name, keywords in CATEGORY_KEYWORDS.items()
+            if any(keyword in query_lower for keyword in keywords)
+        )
         
+        return await self._build_template_orchestration(
+            user_query,
+            categories,
+            {"fallback_used": True},
+            {
+                "is_valid": True,
+                "issues": ["Fallback orchestration used"],
+                "suggestions": ["Consider using AI-powered orchestration for better results"],
+                "confidence_score": 0.6
+            }
+        )
+    
+    async def _build_template_orchestration(self, user_query: str, categories: FrozenSet[str],
+                                            flags: Dict[str, Any],
+                                            validation: Dict[str, Any]) -> Dict[str, Any]:
+        """Assemble and save an orchestration from the agent templates of the given categories"""
         # Determine agents based on keywords
-        agents = []
-        
-        if any(word in query_lower for word in ['performance', 'analysis', 'summary', 'report']):
-            agents.append({
-                "agent_id": "operations_summary_agent",
-                "activation_trigger": "always",
-                "directives": [
-                    "Generate operational summary",
-                    "Identify key performance metrics",
-                    "Highlight critical issues"
-                ],
-                "data_sources": ["installed_assets", "lead_funnel"],
-                "output_format": "json",
-                "dependencies": []
-            })
-        
-        if any(word in query_lower for word in ['upsell', 'opportunity', 'sales', 'revenue']):
-            agents.append({
-                "agent_id": "upsell_discovery_agent",
-                "activation_trigger": "after_operations_summary",
-                "directives": [
-                    "Find upsell opportunities",
-                    "Prioritize by potential value",
-                    "Include customer context"
-                ],
-                "data_sources": ["installed_assets", "products"],
-                "output_format": "json",
-                "dependencies": ["operations_summary_agent"]
-            })
-        
-        if any(word in query_lower for word in ['campaign', 'marketing', 'strategy']):
-            agents.append({
-                "agent_id": "campaign_planner_agent",
-                "activation_trigger": "after_upsell_discovery",
-                "directives": [
-                    "Create marketing campaign plan",
-                    "Define target audience",
-                    "Calculate projected revenue"
-                ],
-                "data_sources": ["lead_funnel", "products"],
-                "output_format": "json",
-                "dependencies": ["upsell_discovery_agent"]
-            })
-        
-        if any(word in query_lower for word in ['financial', 'roi', 'revenue', 'profit']):
-            agents.append({
-                "agent_id": "financial_impact_agent",
-                "activation_trigger": "after_campaign_planner",
-                "directives": [
-                    "Calculate financial impact",
-                    "Analyze ROI projections",
-                    "Provide quarterly forecasts"
-                ],
-                "data_sources": ["income_statement", "balance_sheet", "cash_flow"],
-                "output_format": "json",
-                "dependencies": ["campaign_planner_agent"]
-            })
+        agents = [dict(template) for name, template in AGENT_TEMPLATES.items() if name in categories]
         
         # If no specific agents identified, use default
         if not agents:
-            agents = [{
-                "agent_id": "operations_summary_agent",
-                "activation_trigger": "always",
-                "directives": [
-                    "Analyze operational data",
-                    "Generate summary report",
-                    "Identify key insights"
-                ],
-                "data_sources": ["installed_assets", "lead_funnel"],
-                "output_format": "json",
-                "dependencies": []
-            }]
+            agents = [dict(DEFAULT_AGENT_TEMPLATE)]
         
         # Create orchestration specification
         orchestration_spec = {
-            "orchestration_id": str(uuid.uuid4()),
-            "timestamp": datetime.utcnow().isoformat(),
+            "orchestration_id": secrets.token_hex(16),
+            "timestamp": utc_iso(),
             "user_query": user_query,
             "ai_generated": False,
-            "fallback_used": True,
+            **flags,
             "workflow": {
                 "agents": agents,
-                "execution_order": [agent["agent_id"] for agent in agents],
                 "final_synthesis": {
                     "agent_id": "synthesis_agent",
                     "directives": [
@@ -173,21 +544,150 @@ class O3Orchestrator:
                     ]
                 }
             },
-            "validation": {
-                "is_valid": True,
-                "issues": ["Fallback orchestration used"],
-                "suggestions": ["Consider using AI-powered orchestration for better results"],
-                "confidence_score": 0.6
-            }
+            "validation": validation
         }
         
+        self._apply_dag(orchestration_spec)
+        
         await self.save_orchestration_spec(orchestration_spec)
         return orchestration_spec
     
+    @staticmethod
+    def _build_dag(agents: List[Dict[str, Any]]) -> Dict[str, Set[str]]:
+        """
+        Build the agent dependency graph
+        
+        Dependencies on agents that are not part of the workflow are dropped,
+        since there is nothing to wait for. A single dependency given as a
+        string is treated as a one-element list.
+        
+        Args:
+            agents: Agent definitions from the workflow
+            
+        Returns:
+            Mapping of agent_id to the set of agent_ids it depends on
+            
+        Raises:
+            KeyError: If an agent has no agent_id
+        """
+        agent_ids = {agent["agent_id"] for agent in agents}
+        dag = {}
+        for agent in agents:
+            dependencies = agent.get("dependencies") or []
+            if isinstance(dependencies, str):
+                dependencies = [dependencies]
+            dag[agent["agent_id"]] = {str(dependency) for dependency in dependencies} & agent_ids
+        return dag
+    
+    @staticmethod
+    def _execution_batches(dag: Dict[str, Set[str]]) -> List[List[str]]:
+        """
+        Group agents into batches that can run concurrently
+        
+        Args:
+            dag: Dependency graph from _build_dag
+            
+        Returns:
+            Batches in execution order; agents within a batch are independent
+            
+        Raises:
+            ValueError: If the dependency graph contains a cycle
+        """
+        remaining = {agent_id: set(deps) for agent_id, deps in dag.items()}
+        done: Set[str] = set()
+        batches = []
+        
+        while remaining:
+            ready = [agent_id for agent_id, deps in remaining.items() if deps <= done]
+            if not ready:
+                raise ValueError(f"Cyclic agent dependencies: {sorted(remaining)}")
+            batches.append(ready)
+            done.update(ready)
+            for agent_id in ready:
+                del remaining[agent_id]
+        
+        return batches
+    
+    def _apply_dag(self, spec: Dict[str, Any]) -> None:
+        """
+        Set execution_batches on a spec from its agent dependencies
+        
+        An existing execution_order is kept when it names the same agents and
+        respects their dependencies; otherwise it is replaced by the batch order.
+        """
+        workflow = spec.get("workflow", {})
+        dag = self._build_dag(workflow.get("agents", []))
+        batches = self._execution_batches(dag)
+        workflow["execution_batches"] = batches
+        
+        order = workflow.get("execution_order")
+        position = {agent_id: index for index, agent_id in enumerate(order)} if isinstance(order, list) else {}
+        keep_order = len(position) == len(dag) == len(order or []) and all(
+            agent_id in position and all(position[dep] < position[agent_id] for dep in deps)
+            for agent_id, deps in dag.items()
+        )
+        if not keep_order:
+            workflow["execution_order"] = [agent_id for batch in batches for agent_id in batch]
+    
+    @staticmethod
+    async def stream_dag(spec: Dict[str, Any],
+                         run_agent: Callable[[Dict[str, Any]], Awaitable[Any]]) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Execute the agents of a spec batch by batch, yielding results as agents finish
+        
+        Agents within a batch are independent and run concurrently. The spec's
+        execution_batches are used when present, otherwise they are derived
+        from the agent dependencies.
+        
+        Args:
+            spec: Orchestration specification
+            run_agent: Coroutine function executing a single agent definition
+            
+        Yields:
+            (agent_id, result of run_agent) per agent, in completion order within each batch
+        """
+        workflow = spec["workflow"]
+        agents = {agent["agent_id"]: agent for agent in workflow["agents"]}
+        batches = workflow.get("execution_batches") or O3Orchestrator._execution_batches(
+            O3Orchestrator._build_dag(list(agents.values()))
+        )
+        
+        async def run(agent_id):
+            return agent_id, await run_agent(agents[agent_id])
+        
+        for batch in batches:
+            logger.debug("⚡ Running %d agent(s) concurrently: %s", len(batch), ", ".join(batch))
+            tasks = [asyncio.create_task(run(agent_id)) for agent_id in batch]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                # A consumer that stops early should not leave agents running
+                for task in tasks:
+                    task.cancel()
+    
+    async def execute_dag(self, spec: Dict[str, Any],
+                          run_agent: Callable[[Dict[str, Any]], Awaitable[Any]]) -> Dict[str, Any]:
+        """
+        Execute the agents of a spec, running independent agents concurrently
+        
+        Args:
+            spec: Orchestration specification
+            run_agent: Coroutine function executing a single agent definition
+            
+        Returns:
+            Mapping of agent_id to the result of run_agent
+        """
+        return {agent_id: result async for agent_id, result in self.stream_dag(spec, run_agent)}
+    
     async def save_orchestration_spec(self, spec: Dict[str, Any]) -> str:
         """
         Save orchestration specification to file
         
+        The spec is written to its own file for the workflow engines before
+        returning. Its orchestration log entry is queued and appended in a
+        batch by the background writer; call flush() to wait for it.
+        
         Args:
             spec: Orchestration specification to save
             
@@ -197,12 +697,55 @@ class O3Orchestrator:
         filename = f"orchestration_{spec['orchestration_id']}.json"
         filepath = self.orchestrations_dir / filename
         
-        with open(filepath, 'w') as file:
-            json.dump(spec, file, indent=2)
+        async with aiofiles.open(filepath, 'wb') as file:
+            await file.write(orjson.dumps(spec, option=orjson.OPT_INDENT_2))
+        
+        # The first save backfills the log, which then already includes this spec
+        if self.orchestration_log.exists() or not await self._ensure_log():
+            self._enqueue_log_entry(_encode_log_entry(spec))
         
-        print(f"💾 Saved orchestration spec to: {filepath}")
+        self._list_cache = None
+        
+        logger.debug("💾 Saved orchestration spec to: %s", filepath)
         return str(filepath)
     
+    def _enqueue_log_entry(self, entry: bytes) -> None:
+        """Queue a log entry, starting the writer task for the running loop if needed"""
+        if self._log_writer_task is None or self._log_writer_task.done():
+            self._log_queue = asyncio.Queue()
+            self._log_writer_task = asyncio.create_task(self._log_writer(self._log_queue))
+        self._log_queue.put_nowait(entry)
+    
+    async def _log_writer(self, queue: asyncio.Queue) -> None:
+        """Append queued log entries in batches, one write per batch"""
+        batch = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                # Give concurrent saves a moment to join this batch
+                await asyncio.sleep(LOG_BATCH_WINDOW)
+                while not queue.empty() and len(batch) < LOG_BATCH_SIZE:
+                    batch.append(queue.get_nowait())
+                
+                async with aiofiles.open(self.orchestration_log, 'ab') as log:
+                    await log.write(b"".join(batch))
+                
+                for _ in batch:
+                    queue.task_done()
+                batch = []
+        finally:
+            # Loop shutdown cancels the writer; persist whatever is still pending
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            if batch:
+                with open(self.orchestration_log, 'ab') as log:
+                    log.write(b"".join(batch))
+    
+    async def flush(self) -> None:
+        """Wait until all queued log entries have been written"""
+        if self._log_queue is not None and self._log_writer_task and not self._log_writer_task.done():
+            await self._log_queue.join()
+    
     async def load_orchestration_spec(self, orchestration_id: str) -> Optional[Dict[str, Any]]:
         """
         Load orchestration specification from file
@@ -217,12 +760,83 @@ class O3Orchestrator:
         filepath = self.orchestrations_dir / filename
         
         if filepath.exists():
-            with open(filepath, 'r') as file:
-                return json.load(file)
+            async with aiofiles.open(filepath, 'rb') as file:
+                return orjson.loads(await file.read())
         else:
-            print(f"❌ Orchestration file not found: {filepath}")
+            logger.warning("❌ Orchestration file not found: %s", filepath)
             return None
     
+    def _spec_file_paths(self) -> List[str]:
+        """List spec file paths with a single scandir pass, without building Path objects"""
+        with os.scandir(self.orchestrations_dir) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.name.startswith("orchestration_") and entry.name.endswith(".json")
+            ]
+    
+    async def _ensure_log(self) -> bool:
+        """Backfill the log unless it exists; True if this call built it"""
+        loop = asyncio.get_running_loop()
+        if self._backfill_lock is None or self._backfill_lock_loop is not loop:
+            self._backfill_lock, self._backfill_lock_loop = asyncio.Lock(), loop
+        async with self._backfill_lock:
+            # A concurrent caller may have built it while this one waited
+            if self.orchestration_log.exists():
+                return False
+            await self._backfill_log()
+            return True
+    
+    async def _backfill_log(self) -> None:
+        """Build the orchestration log from the individual spec files"""
+        filepaths = self._spec_file_paths()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+        
+        async def read_spec(filepath: str) -> Dict[str, Any]:
+            async with semaphore:
+                async with aiofiles.open(filepath, 'rb') as file:
+                    return orjson.loads(await file.read())
+        
+        specs = await asyncio.gather(*(read_spec(filepath) for filepath in filepaths), return_exceptions=True)
+        
+        entries = []
+        for filepath, spec in zip(filepaths, specs):
+            if isinstance(spec, Exception):
+                logger.error("❌ Error loading orchestration %s: %s", filepath, spec)
+            else:
+                entries.append(_encode_log_entry(spec))
+        
+        # Appear under the final name only once complete, so appends never land in a partial log
+        async with aiofiles.tempfile.NamedTemporaryFile('wb', dir=self.orchestrations_dir, suffix=".tmp",
+                                                        delete=False) as log:
+            await log.write(b"".join(entries))
+        os.replace(log.name, self.orchestration_log)
+    
+    @staticmethod
+    def _parse_log(data: bytes) -> List[Dict[str, Any]]:
+        """Parse raw log contents into specs, keeping the latest entry per orchestration_id"""
+        specs = {}
+        for entry in _decode_log_entries(data):
+            try:
+                spec = _decode_spec(entry)
+            except (orjson.JSONDecodeError, ormsgpack.MsgpackDecodeError) as error:
+                logger.error("❌ Skipping corrupt orchestration log entry: %s", error)
+                continue
+            specs[spec.get("orchestration_id")] = spec
+        return list(specs.values())
+    
+    @staticmethod
+    def _spec_metadata(spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a spec for listing"""
+        return {
+            "orchestration_id": spec.get("orchestration_id"),
+            "timestamp": spec.get("timestamp"),
+            "user_query": spec.get("user_query"),
+            "ai_generated": spec.get("ai_generated", False),
+            "fallback_used": spec.get("fallback_used", False),
+            "agent_count": len(spec.get("workflow", {}).get("agents", [])),
+            "validation_score": spec.get("validation", {}).get("confidence_score", 0.0)
+        }
+    
     async def list_orchestrations(self) -> List[Dict[str, Any]]:
         """
         List all available orchestrations
@@ -230,25 +844,20 @@ class O3Orchestrator:
         Returns:
             List of orchestration metadata
         """
-        orchestrations = []
+        await self.flush()
+        await self._ensure_log()
         
-        for filepath in self.orchestrations_dir.glob("orchestration_*.json"):
-            try:
-                with open(filepath, 'r') as file:
-                    spec = json.load(file)
-                    orchestrations.append({
-                        "orchestration_id": spec.get("orchestration_id"),
-                        "timestamp": spec.get("timestamp"),
-                        "user_query": spec.get("user_query"),
-                        "ai_generated": spec.get("ai_generated", False),
-                        "fallback_used": spec.get("fallback_used", False),
-                        "agent_count": len(spec.get("workflow", {}).get("agents", [])),
-                        "validation_score": spec.get("validation", {}).get("confidence_score", 0.0)
-                    })
-            except Exception as error:
-                print(f"❌ Error loading orchestration {filepath}: {error}")
-        
-        return orchestrations
+        log_stat = self.orchestration_log.stat()
+        key = (log_stat.st_mtime_ns, log_stat.st_size)
+        if self._list_cache and self._list_cache[:2] == key:
+            return list(self._list_cache[2])
+        
+        async with aiofiles.open(self.orchestration_log, 'rb') as log:
+            specs = self._parse_log(await log.read())
+        
+        orchestrations = [self._spec_metadata(spec) for spec in specs]
+        self._list_cache = (*key, orchestrations)
+        return list(orchestrations)
     
     async def validate_orchestration_spec(self, spec: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -260,11 +869,33 @@ class O3Orchestrator:
         Returns:
             Validation result
         """
+        spec_hash = self._spec_hash(spec)
+        cached = self._validation_cache.get(spec_hash) if spec_hash is not None else None
+        if cached is not None:
+            self._validation_cache.move_to_end(spec_hash)
+            return cached
+        
+        # Structurally broken specs are rejected without an AI round-trip
+        try:
+            SPEC_VALIDATOR.validate_python(spec)
+        except ValidationError as error:
+            return {
+                "is_valid": False,
+                "issues": [
+                    f"{'.'.join(str(part) for part in issue['loc'])}: {issue['msg']}"
+                    for issue in error.errors()
+                ],
+                "suggestions": ["Check orchestration format"],
+                "confidence_score": 0.0
+            }
+        
         try:
             # Use AI service for validation
-            return await self.ai_service.validate_orchestration(spec)
+            validation_result = await self.ai_service.validate_orchestration(spec)
+            self._cache_validation(spec, validation_result, spec_hash)
+            return validation_result
         except Exception as error:
-            print(f"❌ Validation failed: {error}")
+            logger.error("❌ Validation failed: %s", error)
             return {
                 "is_valid": False,
                 "issues": [f"Validation error: {error}"],
@@ -272,25 +903,38 @@ class O3Orchestrator:
                 "confidence_score": 0.0
             }
     
-    def get_orchestrator_status(self) -> Dict[str, Any]:
+    @staticmethod
+    def _spec_hash(spec: Dict[str, Any]) -> Optional[bytes]:
+        """Hash spec content, ignoring any validation result already attached to it; None if it cannot be encoded"""
+        content = {key: value for key, value in spec.items() if key != "validation"}
+        try:
+            encoded = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            return None
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+    
+    def _cache_validation(self, spec: Dict[str, Any], validation_result: Dict[str, Any],
+                          spec_hash: Optional[bytes] = None) -> None:
+        """Memoize a validation result, evicting the least recently used entry when full"""
+        # A fallback result stands in for a failed AI call and must not outlive it
+        if validation_result.get("fallback_used"):
+            return
+        spec_hash = spec_hash or self._spec_hash(spec)
+        if spec_hash is None:
+            return
+        self._validation_cache[spec_hash] = validation_result
+        if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
+    
+    async def get_orchestrator_status(self) -> Dict[str, Any]:
         """Get orchestrator status and statistics"""
         try:
-            orchestrations = list(self.orchestrations_dir.glob("orchestration_*.json"))
+            # Read through the listing, which flushes queued log entries first
+            orchestrations = await self.list_orchestrations()
             
             # Count AI-generated vs fallback orchestrations
-            ai_generated = 0
-            fallback_used = 0
-            
-            for filepath in orchestrations:
-                try:
-                    with open(filepath, 'r') as file:
-                        spec = json.load(file)
-                        if spec.get("ai_generated", False):
-                            ai_generated += 1
-                        if spec.get("fallback_used", False):
-                            fallback_used += 1
-                except:
-                    pass
+            ai_generated = sum(1 for spec in orchestrations if spec["ai_generated"])
+            fallback_used = sum(1 for spec in orchestrations if spec["fallback_used"])
             
             return {
                 "service": "o3_orchestrator",
@@ -300,14 +944,14 @@ class O3Orchestrator:
                 "ai_generated": ai_generated,
                 "fallback_used": fallback_used,
                 "success_rate": (ai_generated / len(orchestrations)) if orchestrations else 0.0,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
         except Exception as error:
             return {
                 "service": "o3_orchestrator",
                 "status": "error",
                 "error": str(error),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
 
 # Test function for Phase 2
@@ -346,7 +990,7 @@ async def test_enhanced_o3_orchestrator():
             print(f"❌ Test failed: {error}")
     
     # Get orchestrator status
-    status = orchestrator.get_orchestrator_status()
+    status = await orchestrator.get_orchestrator_status()
     print(f"\n📊 Orchestrator Status: {status}")
 
 if __name__ == "__main__":
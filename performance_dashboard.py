@@ -5,16 +5,20 @@ Real-time monitoring of agent performance, system metrics, and business insights
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import json
+import gc
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import orjson
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import psutil
-import threading
 
 # Page configuration
 st.set_page_config(
@@ -24,6 +28,293 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Maximum points per line trace sent to the browser; longer series are min/max decimated server-side
+MAX_CHART_POINTS = 2000
+
+# Worker threads used to overlap report file reads
+LOAD_WORKERS = 8
+
+# Columnar cache of rows already parsed from the report JSON files
+PARSED_CACHE_PATH = Path("performance_reports") / "_parsed_cache.parquet"
+
+# Compact shared figure layout and a modebar-free config keep each chart payload small
+CHART_LAYOUT = dict(height=260, margin=dict(l=20, r=10, t=30, b=20))
+CHART_CONFIG = {'displayModeBar': False, 'staticPlot': False}
+
+# Run a full garbage collection every this many live-section refreshes
+GC_EVERY_N_REFRESHES = 20
+
+# Newest executions kept in each session's ring buffer
+MAX_BUFFERED_EXECUTIONS = 5000
+
+# Seconds between automatic reruns of the live dashboard sections
+REFRESH_INTERVAL = 30
+
+# On Linux, metrics are read straight from procfs/statvfs; psutil covers other platforms
+USE_PROCFS = os.path.exists('/proc/stat') and os.path.exists('/proc/meminfo')
+
+def _read_cpu_times():
+    """(total, idle) jiffies from the aggregate cpu line of /proc/stat"""
+    with open('/proc/stat') as f:
+        values = [int(v) for v in f.readline().split()[1:9]]
+    return sum(values), values[3] + values[4]  # idle + iowait
+
+def _cpu_percent():
+    """CPU utilisation since the previous call, without sleeping"""
+    global _previous_cpu_times
+    if not USE_PROCFS:
+        return psutil.cpu_percent(interval=None)
+    total, idle = _read_cpu_times()
+    previous_total, previous_idle = _previous_cpu_times
+    _previous_cpu_times = (total, idle)
+    elapsed = total - previous_total
+    return 100.0 * (1 - (idle - previous_idle) / elapsed) if elapsed else 0.0
+
+def _memory_usage():
+    """(percent used, bytes available) from /proc/meminfo"""
+    if not USE_PROCFS:
+        memory = psutil.virtual_memory()
+        return memory.percent, memory.available
+    with open('/proc/meminfo') as f:
+        fields = f.read().split()
+    meminfo = dict(zip(fields[0::3], fields[1::3]))
+    total = int(meminfo['MemTotal:']) * 1024
+    available = int(meminfo['MemAvailable:']) * 1024
+    return 100.0 * (total - available) / total, available
+
+# Prime the CPU counter so later non-blocking reads return the delta since the previous call
+if USE_PROCFS:
+    _previous_cpu_times = _read_cpu_times()
+else:
+    psutil.cpu_percent(interval=None)
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _get_disk_usage():
+    """Disk stats change slowly, so they are cached longer than CPU/memory"""
+    if not hasattr(os, 'statvfs'):
+        disk = psutil.disk_usage('/')
+        return disk.percent, disk.free
+    stats = os.statvfs('/')
+    used = (stats.f_blocks - stats.f_bfree) * stats.f_frsize
+    free = stats.f_bavail * stats.f_frsize
+    return 100.0 * used / (used + free) if used + free else 0.0, free
+
+@st.cache_data(ttl=1, show_spinner=False)
+def _get_system_metrics():
+    """Get real-time system metrics without blocking the script thread"""
+    cpu_percent = _cpu_percent()
+    memory_percent, memory_available = _memory_usage()
+    disk_percent, disk_free = _get_disk_usage()
+    
+    return {
+        'cpu_usage': f"{cpu_percent:.1f}%",
+        'memory_usage': f"{memory_percent:.1f}%",
+        'memory_available': f"{memory_available / (1024**3):.1f} GB",
+        'disk_usage': f"{disk_percent:.1f}%",
+        'disk_free': f"{disk_free / (1024**3):.1f} GB"
+    }
+
+def _iter_reports(roots):
+    """Yield (kind, name, mtime_ns, size) for each JSON file under the roots, one scandir per root"""
+    for kind, root in roots.items():
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        stat = entry.stat()
+                        yield kind, entry.name, stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            continue
+
+def _scan_signatures(roots):
+    """Cheap fingerprint per root: sorted (name, mtime_ns, size) of its JSON files"""
+    signatures = {kind: [] for kind in roots}
+    for kind, name, mtime_ns, size in _iter_reports(roots):
+        signatures[kind].append((name, mtime_ns, size))
+    return {kind: tuple(sorted(entries)) for kind, entries in signatures.items()}
+
+def _dir_signature(directory):
+    """Fingerprint of a single directory's JSON files"""
+    return _scan_signatures({'dir': directory})['dir']
+
+def _read_rows(path, parse_rows):
+    """Parse one JSON file and extract its rows, returning the exception instead of raising it"""
+    try:
+        return path, parse_rows(path, orjson.loads(path.read_bytes()))
+    except Exception as e:
+        return path, e
+
+def _read_json_files(directory, dir_sig, parse_rows):
+    """Extract rows from every file in a directory signature concurrently"""
+    # Rows are pulled out inside the worker so each parsed document is freed right away
+    # instead of every report being held in memory at once
+    paths = [directory / name for name, _, _ in dir_sig]
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(paths))) as executor:
+        return list(executor.map(_read_rows, paths, [parse_rows] * len(paths)))
+
+def _execution_rows(file, result):
+    """Raw execution fields from one test result file; conversion happens vectorized after loading"""
+    if 'execution_time' not in result:
+        return []
+    return [{
+        'execution_time': str(result['execution_time']),
+        'orchestration_id': result.get('orchestration_id', 'N/A'),
+        'has_results': 'results' in result
+    }]
+
+def _agent_rows(file, report):
+    """Per-agent timing rows contributed by one performance report"""
+    return [
+        {
+            'agent_id': agent_id,
+            'duration': timing.get('duration', 0),
+            'status': timing.get('status', 'unknown'),
+            'timestamp': report.get('timestamp', 'N/A')
+        }
+        for agent_id, timing in report.get('agent_timings', {}).items()
+    ]
+
+def _read_parsed_cache():
+    """Load the parquet cache of already-parsed rows, or an empty frame"""
+    if PARSED_CACHE_PATH.exists():
+        try:
+            return pd.read_parquet(PARSED_CACHE_PATH, engine='pyarrow')
+        except Exception:
+            pass  # A corrupt cache is simply rebuilt from the JSON files
+    return pd.DataFrame(columns=['kind', 'source', 'mtime_ns'])
+
+def _load_rows(kind, directory, dir_sig, parse_rows, columns, full_scan=True):
+    """
+    Return rows of one kind, parsing only files that are new or changed since the parquet cache
+    
+    With full_scan, dir_sig lists the whole directory and cached rows of files missing
+    from it are pruned as deleted. Otherwise dir_sig is only a subset of the directory
+    (e.g. the files changed since the last refresh), and cached rows of every other
+    file are left in place.
+    """
+    cached = _read_parsed_cache()
+    current = {name: mtime_ns for name, mtime_ns, _ in dir_sig}
+    
+    own = cached[cached['kind'] == kind]
+    if not set(columns).issubset(cached.columns):
+        own = own.iloc[0:0]  # Cache written with an older row layout; re-parse this kind
+    keep = own[own['source'].map(current) == own['mtime_ns']]
+    # Rows of files outside a partial signature are neither returned nor pruned
+    untouched = own.iloc[0:0] if full_scan else own[~own['source'].isin(current)]
+    cached_sources = set(keep['source'])
+    delta = tuple(entry for entry in dir_sig if entry[0] not in cached_sources)
+    
+    new_rows, errors = [], []
+    for file, rows in _read_json_files(directory, delta, parse_rows):
+        if isinstance(rows, Exception):
+            errors.append(f"Error loading {file}: {rows}")
+            continue
+        # Files without rows still get an empty marker row so they are not re-read next time
+        for row in rows or [{}]:
+            new_rows.append({**row, 'kind': kind, 'source': file.name, 'mtime_ns': current[file.name]})
+    
+    new_frame = pd.DataFrame(new_rows, columns=['kind', 'source', 'mtime_ns', *columns])
+    frame = pd.concat([keep, new_frame], ignore_index=True)
+    if new_rows or len(keep) + len(untouched) != len(own):
+        try:
+            PARSED_CACHE_PATH.parent.mkdir(exist_ok=True)
+            # Written under a per-process, per-session-thread name and swapped in, so concurrent
+            # readers never see a partial file
+            tmp_path = PARSED_CACHE_PATH.with_name(
+                f"{PARSED_CACHE_PATH.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            try:
+                pd.concat([cached[cached['kind'] != kind], untouched, frame], ignore_index=True).to_parquet(
+                    tmp_path, engine='pyarrow', index=False
+                )
+                os.replace(tmp_path, PARSED_CACHE_PATH)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        except Exception as e:
+            errors.append(f"Error updating {PARSED_CACHE_PATH}: {e}")
+    
+    frame = frame.dropna(how='all', subset=columns)
+    return frame[['source', *columns]].reset_index(drop=True), errors
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_executions(test_results_dir, test_dir_sig, full_scan=True):
+    """Load executions from test results as a DataFrame, cached on the directory signature"""
+    frame, errors = _load_rows('execution', test_results_dir, test_dir_sig, _execution_rows,
+                               ['execution_time', 'orchestration_id', 'has_results'], full_scan)
+    executions = pd.DataFrame({
+        'source': frame['source'],
+        'timestamp': pd.to_datetime(frame['source'].str.extract(r'(\d{8}_\d{6})', expand=False),
+                                    format='%Y%m%d_%H%M%S', errors='coerce'),
+        'execution_time': pd.to_numeric(frame['execution_time'].str.removesuffix(' seconds'),
+                                        errors='coerce'),
+        'orchestration_id': frame['orchestration_id'],
+        'status': pd.Categorical(np.where(frame['has_results'].astype(bool), 'success', 'failed'))
+    })
+    return executions, errors
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_agent_performance(performance_reports_dir, report_dir_sig):
+    """Load per-agent timings from performance reports as a DataFrame, cached on the directory signature"""
+    frame, errors = _load_rows('agent', performance_reports_dir, report_dir_sig, _agent_rows,
+                               ['agent_id', 'duration', 'status', 'timestamp'])
+    # Low-cardinality labels as categoricals: integer-coded groupby and far less memory per row
+    agents = frame.drop(columns='source').astype({'agent_id': 'category', 'status': 'category'})
+    return agents, errors
+
+def _execution_aggregates(df_executions):
+    """Summary scalars for the execution section"""
+    return {
+        'success_rate': (df_executions['status'] == 'success').mean() * 100,
+        'avg_time': df_executions['execution_time'].mean()
+    }
+
+def _aggregate_agent_arrays(ids, durations, statuses):
+    """Per-agent mean durations and status counts from parallel (SoA) numpy arrays"""
+    durations = np.asarray(durations, dtype=np.float32)
+    agent_ids, inverse = np.unique(np.asarray(ids, dtype=str), return_inverse=True)
+    means = np.bincount(inverse, weights=durations) / np.bincount(inverse)
+    
+    status_names, status_totals = np.unique(np.asarray(statuses, dtype=str), return_counts=True)
+    order = np.argsort(-status_totals, kind='stable')
+    return {
+        'agent_means': pd.DataFrame({'agent_id': agent_ids, 'duration': means.astype(np.float32)}),
+        'status_counts': pd.Series(status_totals[order], index=status_names[order], name='count')
+    }
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _agent_aggregates(performance_reports_dir, report_dir_sig):
+    """Per-agent mean durations and status counts, read columnar from the parquet cache"""
+    try:
+        # Only the three aggregated columns of agent rows are read from disk
+        table = pq.read_table(PARSED_CACHE_PATH, columns=['agent_id', 'duration', 'status'],
+                              filters=[('kind', '==', 'agent')])
+        table = table.filter(pc.is_valid(table['agent_id']))
+        columns = [table[name].to_numpy() for name in ('agent_id', 'duration', 'status')]
+    except Exception:
+        # No usable parquet cache (e.g. it could not be written); aggregate the loaded rows instead
+        df_agents, _ = _load_agent_performance(performance_reports_dir, report_dir_sig)
+        columns = [df_agents[name].to_numpy() for name in ('agent_id', 'duration', 'status')]
+    return _aggregate_agent_arrays(*columns)
+
+def _downsample_minmax(x, y, max_points=MAX_CHART_POINTS):
+    """Keep the min and max of each bucket so spikes survive while the payload stays bounded"""
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    
+    edges = np.linspace(0, n, max_points // 2 + 1, dtype=np.int64)
+    keep = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        bucket = y[start:end]
+        lo, hi = start + int(np.argmin(bucket)), start + int(np.argmax(bucket))
+        keep.extend(sorted({lo, hi}))
+    keep = np.asarray(keep)
+    return x[keep], y[keep]
+
 class PerformanceDashboard:
     def __init__(self):
         self.logs_dir = Path("logs")
@@ -33,69 +324,120 @@ class PerformanceDashboard:
         
     def get_system_metrics(self):
         """Get real-time system metrics"""
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        return _get_system_metrics()
+    
+    def load_executions(self):
+        """Load the executions DataFrame and load errors from test results"""
+        return _load_executions(self.test_results_dir, _dir_signature(self.test_results_dir))
+    
+    def load_recent_executions(self, test_dir_sig=None):
+        """Session ring buffer of the newest executions, extended only with files not seen yet"""
+        if test_dir_sig is None:
+            test_dir_sig = _dir_signature(self.test_results_dir)
+        state = st.session_state
+        seen = state.setdefault('seen_files', {})
+        delta = tuple(entry for entry in test_dir_sig if seen.get(entry[0]) != entry[1])
+        if not delta and 'executions_df' in state:
+            return state.executions_df, []
         
-        return {
-            'cpu_usage': f"{cpu_percent:.1f}%",
-            'memory_usage': f"{memory.percent:.1f}%",
-            'memory_available': f"{memory.available / (1024**3):.1f} GB",
-            'disk_usage': f"{disk.percent:.1f}%",
-            'disk_free': f"{disk.free / (1024**3):.1f} GB"
-        }
+        # The delta is only part of the directory, so it must not prune the parquet cache
+        new_executions, errors = _load_executions(self.test_results_dir, delta, full_scan=False)
+        # Files that failed to load or had no rows stay unseen and are retried next refresh
+        mtimes = {name: mtime_ns for name, mtime_ns, _ in delta}
+        seen.update((source, mtimes[source]) for source in new_executions['source'])
+        
+        buffer = pd.concat([state.get('executions_df'), new_executions], ignore_index=True)
+        # Rows whose filename carried no parseable timestamp cannot be ordered or plotted,
+        # so they must not take ring-buffer slots from the newest executions
+        buffer = buffer.dropna(subset=['timestamp'])
+        # A rewritten file replaces its earlier rows rather than duplicating them
+        buffer = buffer.drop_duplicates('source', keep='last').sort_values('timestamp')
+        state.executions_df = buffer.tail(MAX_BUFFERED_EXECUTIONS).astype({'status': 'category'})
+        # Computed once per buffer change rather than hashing the frame on every rerun
+        state.execution_aggregates = _execution_aggregates(state.executions_df)
+        return state.executions_df, errors
+    
+    def load_agent_performance(self, report_dir_sig=None):
+        """Load the agent timings DataFrame and load errors from performance reports"""
+        if report_dir_sig is None:
+            report_dir_sig = _dir_signature(self.performance_reports_dir)
+        return _load_agent_performance(self.performance_reports_dir, report_dir_sig)
+    
+    def get_agent_aggregates(self, report_dir_sig=None):
+        """Per-agent mean durations and status counts for the agent section"""
+        if report_dir_sig is None:
+            report_dir_sig = _dir_signature(self.performance_reports_dir)
+        return _agent_aggregates(self.performance_reports_dir, report_dir_sig)
     
     def load_performance_data(self):
         """Load performance data from files"""
-        data = {
-            'executions': [],
-            'agent_performance': [],
-            'errors': []
+        executions, execution_errors = self.load_executions()
+        agent_performance, agent_errors = self.load_agent_performance()
+        return {
+            'executions': executions.to_dict('records'),
+            'agent_performance': agent_performance.to_dict('records'),
+            'errors': execution_errors + agent_errors
         }
-        
-        # Load test results
-        if self.test_results_dir.exists():
-            for file in self.test_results_dir.glob("*.json"):
-                try:
-                    with open(file, 'r') as f:
-                        result = json.load(f)
-                        if 'execution_time' in result:
-                            data['executions'].append({
-                                'timestamp': file.stem.split('_')[-1],
-                                'execution_time': float(result['execution_time'].replace(' seconds', '')),
-                                'orchestration_id': result.get('orchestration_id', 'N/A'),
-                                'status': 'success' if 'results' in result else 'failed'
-                            })
-                except Exception as e:
-                    st.error(f"Error loading {file}: {e}")
-        
-        # Load performance reports
-        if self.performance_reports_dir.exists():
-            for file in self.performance_reports_dir.glob("*.json"):
-                try:
-                    with open(file, 'r') as f:
-                        report = json.load(f)
-                        if 'agent_timings' in report:
-                            for agent_id, timing in report['agent_timings'].items():
-                                data['agent_performance'].append({
-                                    'agent_id': agent_id,
-                                    'duration': timing.get('duration', 0),
-                                    'status': timing.get('status', 'unknown'),
-                                    'timestamp': report.get('timestamp', 'N/A')
-                                })
-                except Exception as e:
-                    st.error(f"Error loading {file}: {e}")
-        
-        return data
+    
+    def lazy_section(self, section, label):
+        """Collapsed expander whose content is only built once its toggle is switched on"""
+        open_sections = st.session_state.setdefault('open_sections', set())
+        container = st.expander(label, expanded=section in open_sections)
+        with container:
+            is_open = st.toggle("Load section", key=f"open_{section}")
+        if is_open:
+            open_sections.add(section)
+        else:
+            open_sections.discard(section)
+        return container, is_open
+    
+    def get_figure(self, chart_id, build, **trace_data):
+        """Return the session's figure for chart_id, updating its first trace in place on reruns"""
+        figs = st.session_state.setdefault('figs', {})
+        fig = figs.get(chart_id)
+        if fig is None:
+            fig = figs[chart_id] = build()
+            fig.update_layout(**CHART_LAYOUT)
+            fig.update_traces(hovertemplate=None)
+        else:
+            with fig.batch_update():
+                fig.data[0].update(**trace_data)
+        return fig
     
     def render_dashboard(self):
         """Render the main dashboard"""
         st.title("🚀 AI System Performance Dashboard")
         st.markdown("Real-time monitoring of Energy & Property Tech Inc AI System")
         
-        # Auto-refresh every 30 seconds
-        if st.button("🔄 Refresh Data") or 'last_refresh' not in st.session_state:
-            st.session_state.last_refresh = time.time()
+        st.sidebar.markdown(f"Auto-refresh every {REFRESH_INTERVAL} seconds")
+        
+        # Each section is a fragment: timers and widget clicks rerun only that section,
+        # while the static header and system info render once per full run
+        self.render_system_health()
+        self.render_executions()
+        self.render_agent_performance()
+        self.render_recent_activity()
+        
+        # System Information
+        with st.expander("ℹ️ System Information", expanded=False):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Current Models")
+                st.write("**Orchestrator**: OpenAI o3")
+                st.write("**Claude Agents**: Claude 3.5 Sonnet (Ready for Opus upgrade)")
+                st.write("**Workflow Engine**: LangGraph")
+            
+            with col2:
+                st.subheader("Data Sources")
+                st.write("**Financial**: 3 sources (Income, Balance, Cash Flow)")
+                st.write("**Operational**: 3 sources (Assets, Leads, Products)")
+                st.write("**Total Records**: 87+ business data points")
+    
+    @st.fragment(run_every=REFRESH_INTERVAL)
+    def render_system_health(self):
+        """Render system metrics; reruns on its own timer"""
+        st.caption(f"Last refresh: {time.strftime('%H:%M:%S')}")
         
         # System Metrics Section
         st.header("📊 System Health")
@@ -113,117 +455,105 @@ class PerformanceDashboard:
             st.metric("Disk Usage", metrics['disk_usage'])
         with col5:
             st.metric("Disk Free", metrics['disk_free'])
-        
-        # Performance Data
-        data = self.load_performance_data()
+    
+    @st.fragment(run_every=REFRESH_INTERVAL)
+    def render_executions(self):
+        """Render execution performance and recent activity; reruns on its own timer"""
+        executions, errors = self.load_recent_executions()
+        for error in errors:
+            st.error(error)
         
         # Execution Performance
         st.header("⚡ Execution Performance")
-        if data['executions']:
-            df_executions = pd.DataFrame(data['executions'])
-            
-            # Fix timestamp parsing - handle different formats gracefully
-            try:
-                # Try to parse timestamps, but handle errors gracefully
-                df_executions['timestamp'] = pd.to_datetime(
-                    df_executions['timestamp'], 
-                    format='%Y%m%d_%H%M%S', 
-                    errors='coerce'
-                )
-                
-                # If parsing failed, try alternative formats
-                if df_executions['timestamp'].isna().any():
-                    # Try to parse as Unix timestamp or other formats
-                    df_executions['timestamp'] = pd.to_datetime(
-                        df_executions['timestamp'], 
-                        errors='coerce'
-                    )
-                
-                # Filter out rows where timestamp parsing failed
-                df_executions = df_executions.dropna(subset=['timestamp'])
-                
-            except Exception as e:
-                st.warning(f"⚠️ Timestamp parsing issue: {e}")
-                # Continue without timestamp conversion
-                df_executions['timestamp'] = df_executions['timestamp'].astype(str)
+        if not executions.empty:
+            # Rows whose filename carried no parseable timestamp cannot be plotted
+            df_executions = executions.dropna(subset=['timestamp'])
             
             if not df_executions.empty:
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    # Execution time trend (only if we have valid timestamps)
-                    if pd.api.types.is_datetime64_any_dtype(df_executions['timestamp']):
-                        fig_time = px.line(df_executions, x='timestamp', y='execution_time', 
-                                         title="Execution Time Trend",
-                                         labels={'execution_time': 'Time (seconds)', 'timestamp': 'Date'})
-                        st.plotly_chart(fig_time, use_container_width=True)
-                    else:
-                        st.info("📊 Execution time trend chart requires valid timestamps")
+                    # Execution time trend
+                    trend = df_executions.sort_values('timestamp')
+                    x, y = _downsample_minmax(trend['timestamp'].to_numpy(),
+                                              trend['execution_time'].to_numpy(dtype=float))
+                    # WebGL trace keeps rendering cheap as the run history grows
+                    def build_time_figure():
+                        fig = go.Figure(go.Scattergl(x=x, y=y, mode='lines', name='Execution Time'))
+                        fig.update_layout(title="Execution Time Trend",
+                                          xaxis_title='Date', yaxis_title='Time (seconds)')
+                        return fig
+                    fig_time = self.get_figure("exec_time", build_time_figure, x=x, y=y)
+                    st.plotly_chart(fig_time, use_container_width=True, key="exec_time",
+                                    config=CHART_CONFIG)
                 
                 with col2:
-                    # Success rate
-                    success_rate = (df_executions['status'] == 'success').mean() * 100
-                    st.metric("Success Rate", f"{success_rate:.1f}%")
-                    
-                    # Average execution time
-                    avg_time = df_executions['execution_time'].mean()
-                    st.metric("Average Execution Time", f"{avg_time:.2f} seconds")
+                    aggregates = st.session_state.execution_aggregates
+                    st.metric("Success Rate", f"{aggregates['success_rate']:.1f}%")
+                    st.metric("Average Execution Time", f"{aggregates['avg_time']:.2f} seconds")
             else:
                 st.info("📊 No valid execution data available for charts")
         
-        # Agent Performance
-        st.header("🤖 Agent Performance")
-        if data['agent_performance']:
-            df_agents = pd.DataFrame(data['agent_performance'])
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Agent duration comparison
-                fig_agents = px.bar(df_agents.groupby('agent_id')['duration'].mean().reset_index(),
-                                   x='agent_id', y='duration',
-                                   title="Average Agent Execution Time",
-                                   labels={'duration': 'Time (seconds)', 'agent_id': 'Agent'})
-                st.plotly_chart(fig_agents, use_container_width=True)
-            
-            with col2:
-                # Agent status distribution
-                status_counts = df_agents['status'].value_counts()
-                fig_status = px.pie(values=status_counts.values, names=status_counts.index,
-                                   title="Agent Status Distribution")
-                st.plotly_chart(fig_status, use_container_width=True)
-        
+        # Periodically reclaim superseded chart and frame objects in the long-lived server process
+        st.session_state.refresh_count = st.session_state.get('refresh_count', 0) + 1
+        if st.session_state.refresh_count % GC_EVERY_N_REFRESHES == 0:
+            gc.collect()
+    
+    @st.fragment
+    def render_agent_performance(self):
+        """Render agent performance; toggling the section reruns only this fragment"""
+        # Agent Performance (reports are only scanned once the section is opened)
+        agents_section, show_agents = self.lazy_section('agents', "🤖 Agent Performance")
+        if show_agents:
+            with agents_section:
+                report_dir_sig = _dir_signature(self.performance_reports_dir)
+                agent_performance, agent_errors = self.load_agent_performance(report_dir_sig)
+                for error in agent_errors:
+                    st.error(error)
+                
+                if not agent_performance.empty:
+                    aggregates = self.get_agent_aggregates(report_dir_sig)
+                    
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        # Agent duration comparison
+                        agent_means = aggregates['agent_means']
+                        fig_agents = self.get_figure(
+                            "agent_durations",
+                            lambda: px.bar(agent_means, x='agent_id', y='duration',
+                                           title="Average Agent Execution Time",
+                                           labels={'duration': 'Time (seconds)', 'agent_id': 'Agent'}),
+                            x=agent_means['agent_id'], y=agent_means['duration']
+                        )
+                        st.plotly_chart(fig_agents, use_container_width=True, key="agent_durations",
+                                        config=CHART_CONFIG)
+                    
+                    with col2:
+                        # Agent status distribution
+                        status_counts = aggregates['status_counts']
+                        st.subheader("Agent Status Distribution")
+                        if not status_counts.empty:
+                            status_cols = st.columns(len(status_counts))
+                            for col, (status, count) in zip(status_cols, status_counts.items()):
+                                col.metric(str(status).title(), int(count))
+    
+    @st.fragment(run_every=REFRESH_INTERVAL)
+    def render_recent_activity(self):
+        """Render the newest executions; reruns on its own timer"""
         # Recent Activity
-        st.header("📝 Recent Activity")
-        if data['executions']:
-            recent_executions = df_executions.sort_values('timestamp', ascending=False).head(10)
-            st.dataframe(recent_executions, use_container_width=True)
-        
-        # System Information
-        st.header("ℹ️ System Information")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Current Models")
-            st.write("**Orchestrator**: OpenAI o3")
-            st.write("**Claude Agents**: Claude 3.5 Sonnet (Ready for Opus upgrade)")
-            st.write("**Workflow Engine**: LangGraph")
-        
-        with col2:
-            st.subheader("Data Sources")
-            st.write("**Financial**: 3 sources (Income, Balance, Cash Flow)")
-            st.write("**Operational**: 3 sources (Assets, Leads, Products)")
-            st.write("**Total Records**: 87+ business data points")
-        
-        # Auto-refresh indicator
-        if 'last_refresh' in st.session_state:
-            time_since_refresh = time.time() - st.session_state.last_refresh
-            st.sidebar.markdown(f"**Last Refresh**: {time_since_refresh:.0f}s ago")
-            st.sidebar.markdown("Auto-refresh every 30 seconds")
+        activity_section, show_activity = self.lazy_section('activity', "📝 Recent Activity")
+        if show_activity:
+            executions, _ = self.load_recent_executions()
+            with activity_section:
+                # Partial sort: only the newest 10 rows are ordered
+                recent_executions = executions.nlargest(10, 'timestamp')
+                st.dataframe(recent_executions, use_container_width=True, hide_index=True,
+                             column_order=['timestamp', 'orchestration_id', 'execution_time', 'status'])
 
 def main():
     dashboard = PerformanceDashboard()
     dashboard.render_dashboard()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
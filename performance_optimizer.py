@@ -17,17 +17,24 @@ Features:
 """
 
 import asyncio
-import json
+import atexit
 import logging
+import os
 import time
 import hashlib
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Callable
+import heapq
+import itertools
+import random
+import sys
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple, Callable, Hashable
 from dataclasses import dataclass, asdict
 from enum import Enum
-import statistics
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +43,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of recent executions kept in the metrics ring buffer
+METRICS_WINDOW = 100
+
+# Number of most recent executions averaged for parallel efficiency
+EFFICIENCY_WINDOW = 10
+
+# Independently locked cache shards (must be a power of two for mask routing)
+CACHE_SHARDS = 16
+
+# Base execution times for known agent types; the trailing slot is the default for unknown agents
+AGENT_ID_TO_IDX = {
+    'upsell_discovery_agent': 0,
+    'campaign_planner_agent': 1,
+    'financial_impact_agent': 2,
+    'operations_summary_agent': 3,
+    'synthesis_agent': 4
+}
+AGENT_BASE_TIMES = (15.0, 20.0, 25.0, 10.0, 5.0, 15.0)
+
+# Concurrency limits indexed by usage in tenths (0.0-1.0 -> 0-10); the lower of the two wins
+MEMORY_CONCURRENCY = (6, 6, 6, 6, 6, 6, 4, 4, 2, 2, 2)
+CPU_CONCURRENCY = (6, 6, 6, 6, 6, 6, 6, 4, 4, 2, 2)
+
 class CacheStrategy(Enum):
     """Cache strategy types"""
     LRU = "lru"  # Least Recently Used
@@ -52,13 +82,13 @@ class ExecutionMode(Enum):
 @dataclass
 class CacheEntry:
     """Cache entry with metadata"""
-    key: str
+    key: Hashable
     value: Any
-    created_at: datetime
-    accessed_at: datetime
+    created_at: float  # time.monotonic() seconds
+    accessed_at: float  # time.monotonic() seconds
     access_count: int = 0
     ttl: Optional[int] = None  # Time to live in seconds
-    size: Optional[int] = None  # Size in bytes
+    size: Optional[int] = None  # Approximate in-memory size in bytes
 
 @dataclass
 class PerformanceMetrics:
@@ -71,40 +101,165 @@ class PerformanceMetrics:
     cost_per_execution: float
     throughput: float
 
+class CacheShard:
+    """One independently locked slice of the optimizer cache"""
+    
+    def __init__(self):
+        # Kept in recency order: hits move to the end, so the LRU entry is always first
+        self.entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self.lock = threading.Lock()
+        # Flat key list (plus each key's index) so eviction can sample keys in O(1)
+        self.keys: List[Hashable] = []
+        self.positions: Dict[Hashable, int] = {}
+        # (expiry, seq, key) min-heap so cleanup touches only expired entries; stale records are skipped lazily
+        self.ttl_heap: List[Tuple[float, int, Hashable]] = []
+        self._heap_seq = itertools.count()
+        # Per-shard counters avoid contention on one shared stats dict
+        self.stats: Counter = Counter()
+    
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        """Insert or replace an entry as the most recently used"""
+        if key not in self.positions:
+            self.positions[key] = len(self.keys)
+            self.keys.append(key)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if entry.ttl:
+            heapq.heappush(self.ttl_heap, (entry.created_at + entry.ttl, next(self._heap_seq), key))
+            # Evicted and replaced entries leave stale records; rebuild once they dominate
+            if len(self.ttl_heap) > 2 * len(self.entries) + 16:
+                self.ttl_heap = [(e.created_at + e.ttl, next(self._heap_seq), k)
+                                 for k, e in self.entries.items() if e.ttl]
+                heapq.heapify(self.ttl_heap)
+    
+    def discard(self, key: Hashable) -> None:
+        """Remove an entry, swapping the last key into its slot of the key list"""
+        del self.entries[key]
+        index = self.positions.pop(key)
+        last = self.keys.pop()
+        if last != key:
+            self.keys[index] = last
+            self.positions[last] = index
+    
+    def pop_expired(self, now: float) -> int:
+        """Remove entries whose expiry has passed; returns how many were removed"""
+        removed = 0
+        while self.ttl_heap and self.ttl_heap[0][0] < now:
+            expiry, _, key = heapq.heappop(self.ttl_heap)
+            entry = self.entries.get(key)
+            # Only the record matching the live entry's current expiry counts
+            if entry is not None and entry.ttl and entry.created_at + entry.ttl == expiry:
+                self.discard(key)
+                removed += 1
+        return removed
+    
+    def sample(self, k: int = 2) -> List[Hashable]:
+        """Up to k distinct keys chosen uniformly at random"""
+        if len(self.keys) <= k:
+            return list(self.keys)
+        return [self.keys[i] for i in random.sample(range(len(self.keys)), k)]
+
+async def _run_one(semaphore: asyncio.Semaphore, agent_id: str, task_func: Callable,
+                   metrics_cb: Callable[[str, float, bool], None]) -> Tuple[str, Any]:
+    """Run one parallel task under the semaphore; failures are logged and reported as None"""
+    async with semaphore:
+        start_time = time.time()
+        try:
+            result = await task_func()
+            execution_time = time.time() - start_time
+            
+            # Track performance metrics
+            metrics_cb(agent_id, execution_time, True)
+            
+            return agent_id, result
+        except Exception as e:
+            execution_time = time.time() - start_time
+            metrics_cb(agent_id, execution_time, False)
+            logger.error(f"❌ Parallel task {agent_id} failed: {e}")
+            return agent_id, None
+
 class PerformanceOptimizer:
     """Advanced performance optimization system"""
     
     def __init__(self, max_cache_size: int = 1000, max_memory_usage: float = 0.8):
-        self.cache: Dict[str, CacheEntry] = {}
+        self._shards = [CacheShard() for _ in range(CACHE_SHARDS)]
         self.max_cache_size = max_cache_size
+        # Each shard evicts on its own once it holds its share of the total capacity
+        self._shard_capacity = max(1, -(-max_cache_size // CACHE_SHARDS))
         self.max_memory_usage = max_memory_usage
         self.parallel_execution_config: Dict[str, bool] = {}
-        self.performance_metrics: List[PerformanceMetrics] = []
+        # Bounded history: appends evict the oldest sample, so no truncation pass is needed
+        self.performance_metrics: "deque[PerformanceMetrics]" = deque(maxlen=METRICS_WINDOW)
+        # SoA ring buffer of recent execution samples so aggregates are single vectorized passes
+        self._exec_times = np.zeros(METRICS_WINDOW, dtype=np.float32)
+        self._memory_samples = np.zeros(METRICS_WINDOW, dtype=np.float32)
+        self._cpu_samples = np.zeros(METRICS_WINDOW, dtype=np.float32)
+        self._throughputs = np.zeros(METRICS_WINDOW, dtype=np.float32)
+        self._metrics_index = 0  # Next slot to overwrite
+        self._metrics_count = 0  # Number of filled slots
+        # Rolling sum over the last EFFICIENCY_WINDOW execution times, updated per append
+        self._recent_exec_times: "deque[float]" = deque(maxlen=EFFICIENCY_WINDOW)
+        self._recent_exec_sum = 0.0
         self.cache_strategy = CacheStrategy.LRU
         self.execution_mode = ExecutionMode.HYBRID
-        self.thread_pool = ThreadPoolExecutor(max_workers=10)
-        self.cache_stats = {
-            'hits': 0,
-            'misses': 0,
-            'evictions': 0,
-            'size': 0
-        }
+        # Created on first use by _pool(); most runs never offload work to threads
+        self.thread_pool: Optional[ThreadPoolExecutor] = None
         self.resource_monitor = ResourceMonitor()
+        # (memory, cpu, monotonic time) as of the last monitoring tick, read on the hot path
+        self._last_resource_snapshot = self.resource_monitor.snapshot()
         self.cost_tracker = CostTracker()
         
-        # Start background tasks
-        self._start_background_tasks()
-    
-    def _start_background_tasks(self):
-        """Start background optimization tasks"""
-        # Cache cleanup task
-        asyncio.create_task(self._cache_cleanup_task())
+        # Cache counters as of the last periodic summary, so idle periods stay quiet
+        self._last_summary_stats: Dict[str, int] = {}
         
-        # Resource monitoring task
-        asyncio.create_task(self._resource_monitoring_task())
+        # Long-lived parallel-task semaphore, rebuilt only when its limit or event loop changes
+        self._worker_sem: Optional[asyncio.Semaphore] = None
+        self._worker_sem_limit = 0
+        self._worker_sem_loop: Optional[asyncio.AbstractEventLoop] = None
         
-        # Performance metrics collection task
-        asyncio.create_task(self._metrics_collection_task())
+        # Background tasks start lazily on the first async call, so sync construction is safe
+        self._bg_tasks: List[asyncio.Task] = []
+    
+    async def start(self) -> None:
+        """Start background optimization tasks on the running loop (idempotent)"""
+        loop = asyncio.get_running_loop()
+        if self._bg_tasks and all(not task.done() and task.get_loop() is loop for task in self._bg_tasks):
+            return
+        # Restart after a finished asyncio.run or a crashed task; tasks of another loop died with it
+        for task in self._bg_tasks:
+            if not task.done() and task.get_loop() is loop:
+                task.cancel()
+        self._bg_tasks = [
+            # Cache cleanup task
+            asyncio.create_task(self._cache_cleanup_task()),
+            # Resource monitoring task
+            asyncio.create_task(self._resource_monitoring_task()),
+            # Performance metrics collection task
+            asyncio.create_task(self._metrics_collection_task()),
+        ]
+    
+    async def close(self) -> None:
+        """Cancel background tasks and release the thread pool"""
+        loop = asyncio.get_running_loop()
+        # Tasks bound to an earlier, closed loop can no longer be cancelled or awaited
+        tasks = [task for task in self._bg_tasks if not task.done() and task.get_loop() is loop]
+        self._bg_tasks = []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=False)
+            self.thread_pool = None
+    
+    def _pool(self) -> ThreadPoolExecutor:
+        """Thread pool sized to the host, created on first use"""
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix='perf-opt'
+            )
+            atexit.register(self.thread_pool.shutdown, wait=False)
+        return self.thread_pool
     
     async def _cache_cleanup_task(self):
         """Background task for cache cleanup"""
@@ -121,6 +276,7 @@ class PerformanceOptimizer:
         while True:
             try:
                 await self.resource_monitor.update_metrics()
+                self._last_resource_snapshot = self.resource_monitor.snapshot()
                 await asyncio.sleep(10)  # Run every 10 seconds
             except Exception as e:
                 logger.error(f"Resource monitoring error: {e}")
@@ -148,53 +304,83 @@ class PerformanceOptimizer:
             self.parallel_execution_config[agent_id] = False
         logger.info(f"❌ Parallel execution disabled for {len(agent_ids)} agents")
     
-    def cache_agent_output(self, agent_id: str, output: dict, ttl: int = 3600) -> str:
-        """Cache agent output with TTL"""
-        cache_key = self._generate_cache_key(agent_id, output)
-        
-        # Check if cache is full
-        if len(self.cache) >= self.max_cache_size:
-            self._evict_cache_entry()
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Cache counters summed across shards"""
+        totals = Counter()
+        for shard in self._shards:
+            totals.update(shard.stats)
+        return {
+            'hits': totals['hits'],
+            'misses': totals['misses'],
+            'evictions': totals['evictions'],
+            'size': self.cache_size
+        }
+    
+    @property
+    def cache_size(self) -> int:
+        """Number of entries across all shards"""
+        return sum(len(shard.entries) for shard in self._shards)
+    
+    def _shard_for(self, cache_key: Hashable) -> CacheShard:
+        """Route a key to its shard"""
+        return self._shards[hash(cache_key) & (CACHE_SHARDS - 1)]
+    
+    def cache_agent_output(self, agent_id: str, output: dict, ttl: int = 3600,
+                           inputs: Optional[dict] = None, cache_key: Optional[str] = None) -> Hashable:
+        """Cache agent output with TTL, keyed on cache_key, inputs, or (by default) the output itself"""
+        cache_key = self._resolve_cache_key(agent_id, output, inputs, cache_key)
+        shard = self._shard_for(cache_key)
         
         # Create cache entry
+        now = time.monotonic()
         entry = CacheEntry(
             key=cache_key,
             value=output,
-            created_at=datetime.now(timezone.utc),
-            accessed_at=datetime.now(timezone.utc),
+            created_at=now,
+            accessed_at=now,
             ttl=ttl,
             size=self._estimate_size(output)
         )
         
-        self.cache[cache_key] = entry
-        self.cache_stats['size'] = len(self.cache)
+        with shard.lock:
+            # Check if shard is full
+            if cache_key not in shard.entries and len(shard.entries) >= self._shard_capacity:
+                self._evict_cache_entry(shard)
+            
+            shard.put(cache_key, entry)
         
-        logger.info(f"💾 Cached output for agent {agent_id} with key {cache_key}")
+        logger.debug("💾 Cached output for agent %s with key %s", agent_id, cache_key)
         return cache_key
     
-    def get_cached_output(self, agent_id: str, output: dict) -> Optional[dict]:
-        """Get cached output for agent"""
-        cache_key = self._generate_cache_key(agent_id, output)
+    def get_cached_output(self, agent_id: str, output: Optional[dict] = None,
+                          inputs: Optional[dict] = None, cache_key: Optional[str] = None) -> Optional[dict]:
+        """Get cached output for agent, looked up the same way it was cached"""
+        cache_key = self._resolve_cache_key(agent_id, output, inputs, cache_key)
+        shard = self._shard_for(cache_key)
         
-        if cache_key in self.cache:
-            entry = self.cache[cache_key]
+        with shard.lock:
+            entry = shard.entries.get(cache_key)
+            if entry is None:
+                shard.stats['misses'] += 1
+                return None
+            
+            now = time.monotonic()
             
             # Check TTL
-            if entry.ttl and (datetime.now(timezone.utc) - entry.created_at).total_seconds() > entry.ttl:
-                del self.cache[cache_key]
-                self.cache_stats['misses'] += 1
+            if entry.ttl and now - entry.created_at > entry.ttl:
+                shard.discard(cache_key)
+                shard.stats['misses'] += 1
                 return None
             
             # Update access statistics
-            entry.accessed_at = datetime.now(timezone.utc)
+            entry.accessed_at = now
             entry.access_count += 1
-            self.cache_stats['hits'] += 1
-            
-            logger.info(f"🎯 Cache hit for agent {agent_id}")
-            return entry.value
-        else:
-            self.cache_stats['misses'] += 1
-            return None
+            shard.entries.move_to_end(cache_key)
+            shard.stats['hits'] += 1
+        
+        logger.debug("🎯 Cache hit for agent %s", agent_id)
+        return entry.value
     
     def optimize_workflow_order(self, orchestration_spec: dict) -> dict:
         """Optimize agent execution order for maximum efficiency"""
@@ -209,10 +395,16 @@ class PerformanceOptimizer:
         # Optimize execution order
         optimized_agents = self._optimize_execution_order(agents, agent_analysis)
         
-        # Update orchestration spec
-        optimized_spec = orchestration_spec.copy()
-        optimized_spec["workflow"]["agents"] = optimized_agents
-        optimized_spec["workflow"]["execution_order"] = [agent["agent_id"] for agent in optimized_agents]
+        # Build a new spec around the reordered agents; the caller's spec and workflow dicts are left untouched
+        execution_order = [agent["agent_id"] for agent in optimized_agents]
+        optimized_spec = {
+            **orchestration_spec,
+            "workflow": {
+                **orchestration_spec["workflow"],
+                "agents": optimized_agents,
+                "execution_order": execution_order
+            }
+        }
         
         logger.info(f"🔧 Optimized workflow order for {len(agents)} agents")
         return optimized_spec
@@ -222,6 +414,8 @@ class PerformanceOptimizer:
         if not agent_tasks:
             return {}
         
+        await self.start()
+        
         # Group tasks by execution mode
         parallel_tasks = []
         sequential_tasks = []
@@ -232,61 +426,51 @@ class PerformanceOptimizer:
             else:
                 sequential_tasks.append((agent_id, task_func))
         
-        results = {}
-        
-        # Execute parallel tasks
+        # Run the parallel batch and the sequential chain side by side: the split is a
+        # per-agent config flag, not a dependency, so neither batch waits on the other
+        batches = []
         if parallel_tasks:
-            parallel_results = await self._execute_parallel_tasks(parallel_tasks)
-            results.update(parallel_results)
-        
-        # Execute sequential tasks
+            batches.append(self._execute_parallel_tasks(parallel_tasks))
         if sequential_tasks:
-            sequential_results = await self._execute_sequential_tasks(sequential_tasks)
-            results.update(sequential_results)
+            batches.append(self._execute_sequential_tasks(sequential_tasks))
+        
+        results = {}
+        for batch_results in await asyncio.gather(*batches):
+            results.update(batch_results)
         
         return results
     
     async def _execute_parallel_tasks(self, tasks: List[Tuple[str, Callable]]) -> Dict[str, Any]:
         """Execute tasks in parallel with resource management"""
-        results = {}
-        
         # Limit concurrent executions based on resource availability
-        max_concurrent = min(len(tasks), self._get_max_concurrent_tasks())
-        
-        # Create semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def execute_task(agent_id: str, task_func: Callable):
-            async with semaphore:
-                start_time = time.time()
-                try:
-                    result = await task_func()
-                    execution_time = time.time() - start_time
-                    
-                    # Track performance metrics
-                    self._track_execution_metrics(agent_id, execution_time, True)
-                    
-                    return agent_id, result
-                except Exception as e:
-                    execution_time = time.time() - start_time
-                    self._track_execution_metrics(agent_id, execution_time, False)
-                    logger.error(f"❌ Parallel task {agent_id} failed: {e}")
-                    return agent_id, None
-        
-        # Execute tasks concurrently
-        task_coroutines = [execute_task(agent_id, task_func) for agent_id, task_func in tasks]
-        completed_tasks = await asyncio.gather(*task_coroutines, return_exceptions=True)
-        
-        # Process results
-        for result in completed_tasks:
-            if isinstance(result, tuple):
-                agent_id, task_result = result
-                if task_result is not None:
-                    results[agent_id] = task_result
+        resource_limit = self._get_max_concurrent_tasks()
+        max_concurrent = min(len(tasks), resource_limit)
+        
+        # Reuse the optimizer-wide semaphore that limits concurrency; it is sized by resources
+        # alone, so batches of different lengths share it
+        semaphore = self._get_worker_semaphore(resource_limit)
+        track = self._track_execution_metrics
+        
+        # Execute tasks concurrently; _run_one never raises, so every result is an (agent_id, result) tuple
+        task_coroutines = [_run_one(semaphore, agent_id, task_func, track) for agent_id, task_func in tasks]
+        completed_tasks = await asyncio.gather(*task_coroutines)
+        
+        # Failed tasks report None and are left out
+        results = {agent_id: task_result for agent_id, task_result in completed_tasks if task_result is not None}
         
         logger.info(f"⚡ Executed {len(tasks)} parallel tasks with {max_concurrent} concurrent")
         return results
     
+    def _get_worker_semaphore(self, limit: int) -> asyncio.Semaphore:
+        """Semaphore allowing `limit` concurrent tasks, replaced only when the limit or loop changes"""
+        loop = asyncio.get_running_loop()
+        if self._worker_sem is None or limit != self._worker_sem_limit or loop is not self._worker_sem_loop:
+            # Tasks still holding the previous semaphore release it normally; new tasks use this one
+            self._worker_sem = asyncio.Semaphore(limit)
+            self._worker_sem_limit = limit
+            self._worker_sem_loop = loop
+        return self._worker_sem
+    
     async def _execute_sequential_tasks(self, tasks: List[Tuple[str, Callable]]) -> Dict[str, Any]:
         """Execute tasks sequentially"""
         results = {}
@@ -313,14 +497,16 @@ class PerformanceOptimizer:
     def get_performance_metrics(self) -> dict:
         """Get comprehensive performance metrics"""
         # Calculate cache hit rate
-        total_requests = self.cache_stats['hits'] + self.cache_stats['misses']
-        cache_hit_rate = (self.cache_stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+        cache_stats = self.cache_stats
+        total_requests = cache_stats['hits'] + cache_stats['misses']
+        cache_hit_rate = (cache_stats['hits'] / total_requests * 100) if total_requests > 0 else 0
         
         # Calculate average execution time
-        if self.performance_metrics:
-            avg_execution_time = statistics.mean([m.execution_time for m in self.performance_metrics])
-            avg_memory_usage = statistics.mean([m.memory_usage for m in self.performance_metrics])
-            avg_cpu_usage = statistics.mean([m.cpu_usage for m in self.performance_metrics])
+        count = self._metrics_count
+        if count:
+            avg_execution_time = float(self._exec_times[:count].mean())
+            avg_memory_usage = float(self._memory_samples[:count].mean())
+            avg_cpu_usage = float(self._cpu_samples[:count].mean())
         else:
             avg_execution_time = avg_memory_usage = avg_cpu_usage = 0
         
@@ -333,9 +519,8 @@ class PerformanceOptimizer:
         
         return {
             'cache_metrics': {
-                **self.cache_stats,
+                **cache_stats,
                 'hit_rate': cache_hit_rate,
-                'size': len(self.cache),
                 'max_size': self.max_cache_size
             },
             'execution_metrics': {
@@ -359,65 +544,83 @@ class PerformanceOptimizer:
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
     
-    def _generate_cache_key(self, agent_id: str, output: dict) -> str:
-        """Generate cache key for agent output"""
-        # Create a hash of the agent ID and output content
-        content = f"{agent_id}:{json.dumps(output, sort_keys=True)}"
-        return hashlib.md5(content.encode()).hexdigest()
-    
-    def _estimate_size(self, obj: Any) -> int:
-        """Estimate size of object in bytes"""
-        try:
-            return len(json.dumps(obj))
-        except:
-            return 0
-    
-    def _evict_cache_entry(self) -> None:
-        """Evict cache entry based on strategy"""
-        if not self.cache:
+    def _resolve_cache_key(self, agent_id: str, output: Optional[dict],
+                           inputs: Optional[dict], cache_key: Optional[str]) -> Hashable:
+        """Pick the cheapest available key: caller-supplied, structural on inputs, else an output hash"""
+        if cache_key is not None:
+            # Stable caller identifiers (request IDs, query hashes) skip hashing entirely
+            return agent_id, cache_key
+        if inputs is not None:
+            try:
+                # Tuple keys hash in O(fields) with no serialization
+                key = (agent_id, tuple(sorted(inputs.items())))
+                hash(key)
+                return key
+            except TypeError:
+                # Mixed-type input keys cannot be sorted and nested values cannot be hashed;
+                # both fall back to a (namespaced) serialized hash
+                return self._generate_cache_key(agent_id, b'inputs:' + self._serialize_output(inputs))
+        if output is None:
+            raise ValueError("cache lookups need an output, inputs, or cache_key")
+        return self._generate_cache_key(agent_id, self._serialize_output(output))
+    
+    @staticmethod
+    def _serialize_output(output: dict) -> bytes:
+        """Canonical (key-sorted) JSON bytes of an agent output; only hashed, so odd types fall back to str"""
+        return orjson.dumps(output, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    
+    def _generate_cache_key(self, agent_id: str, blob: bytes) -> str:
+        """Generate cache key from an agent ID and its serialized output"""
+        # Hash the agent ID and output bytes incrementally; BLAKE2b outpaces MD5 on large outputs
+        digest = hashlib.blake2b(agent_id.encode(), digest_size=16)
+        digest.update(b':')
+        digest.update(blob)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _estimate_size(output: dict) -> int:
+        """Approximate in-memory size of an output: the dict plus its top-level values"""
+        # A one-level walk is O(fields), independent of how large the payload is once serialized
+        return sys.getsizeof(output) + sum(sys.getsizeof(v) for v in output.values())
+    
+    @staticmethod
+    def _expiry(entry: CacheEntry) -> float:
+        """Absolute expiry time of an entry on the monotonic clock"""
+        return entry.created_at + entry.ttl
+    
+    def _evict_cache_entry(self, shard: CacheShard) -> None:
+        """Evict an entry from a shard based on strategy; the caller holds the shard lock"""
+        if not shard.entries:
             return
         
-        if self.cache_strategy == CacheStrategy.LRU:
-            # Remove least recently used
-            oldest_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k].accessed_at)
-        elif self.cache_strategy == CacheStrategy.LFU:
-            # Remove least frequently used
-            oldest_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k].access_count)
+        # LFU and TTL approximate the strict choice by comparing two random samples
+        if self.cache_strategy == CacheStrategy.LFU:
+            # Remove the less frequently used of the pair
+            oldest_key = min(shard.sample(), key=lambda k: shard.entries[k].access_count)
         elif self.cache_strategy == CacheStrategy.TTL:
-            # Remove expired entries first, then oldest
-            current_time = datetime.now(timezone.utc)
-            expired_keys = [k for k, v in self.cache.items() 
-                          if v.ttl and (current_time - v.created_at).total_seconds() > v.ttl]
-            
-            if expired_keys:
-                oldest_key = expired_keys[0]
-            else:
-                oldest_key = min(self.cache.keys(), 
-                               key=lambda k: self.cache[k].created_at)
+            # Remove whichever of the pair expires sooner; entries without a TTL go last
+            oldest_key = min(shard.sample(),
+                             key=lambda k: self._expiry(shard.entries[k]) if shard.entries[k].ttl else float('inf'))
         else:
-            # Random eviction
-            oldest_key = list(self.cache.keys())[0]
+            # LRU (and the default for every other strategy): the front of the recency order
+            oldest_key = next(iter(shard.entries))
         
-        del self.cache[oldest_key]
-        self.cache_stats['evictions'] += 1
-        logger.info(f"🗑️ Evicted cache entry: {oldest_key}")
+        shard.discard(oldest_key)
+        shard.stats['evictions'] += 1
+        logger.debug("🗑️ Evicted cache entry: %s", oldest_key)
     
     async def _cleanup_cache(self) -> None:
         """Clean up expired cache entries"""
-        current_time = datetime.now(timezone.utc)
-        expired_keys = []
-        
-        for key, entry in self.cache.items():
-            if entry.ttl and (current_time - entry.created_at).total_seconds() > entry.ttl:
-                expired_keys.append(key)
+        now = time.monotonic()
+        cleaned = 0
         
-        for key in expired_keys:
-            del self.cache[key]
+        # Shards are swept one at a time, so cleanup never locks the whole cache
+        for shard in self._shards:
+            with shard.lock:
+                cleaned += shard.pop_expired(now)
         
-        if expired_keys:
-            logger.info(f"🧹 Cleaned up {len(expired_keys)} expired cache entries")
+        if cleaned:
+            logger.info(f"🧹 Cleaned up {cleaned} expired cache entries")
     
     def _analyze_agents(self, agents: List[dict]) -> Dict[str, dict]:
         """Analyze agents for optimization"""
@@ -445,25 +648,19 @@ class PerformanceOptimizer:
     def _optimize_execution_order(self, agents: List[dict], analysis: Dict[str, dict]) -> List[dict]:
         """Optimize agent execution order"""
         # Sort agents by dependencies and estimated time
-        sorted_agents = sorted(agents, key=lambda agent: (
-            len(analysis[agent["agent_id"]]["dependencies"]),  # Fewer dependencies first
-            -analysis[agent["agent_id"]]["estimated_time"]  # Longer tasks first
-        ))
+        stats = [analysis[agent["agent_id"]] for agent in agents]
+        dependency_counts = np.fromiter((len(a["dependencies"]) for a in stats), dtype=np.int64, count=len(stats))
+        estimated_times = np.fromiter((a["estimated_time"] for a in stats), dtype=np.float64, count=len(stats))
         
-        return sorted_agents
+        # lexsort orders by the last key first: fewer dependencies first, then longer tasks first
+        order = np.lexsort((-estimated_times, dependency_counts))
+        
+        return [agents[i] for i in order]
     
     def _estimate_agent_execution_time(self, agent_id: str) -> float:
         """Estimate execution time for agent"""
         # Base execution times for different agent types
-        base_times = {
-            'upsell_discovery_agent': 15.0,
-            'campaign_planner_agent': 20.0,
-            'financial_impact_agent': 25.0,
-            'operations_summary_agent': 10.0,
-            'synthesis_agent': 5.0
-        }
-        
-        return base_times.get(agent_id, 15.0)
+        return AGENT_BASE_TIMES[AGENT_ID_TO_IDX.get(agent_id, -1)]
     
     def _estimate_agent_complexity(self, agent: dict) -> str:
         """Estimate agent complexity"""
@@ -481,23 +678,19 @@ class PerformanceOptimizer:
     
     def _get_max_concurrent_tasks(self) -> int:
         """Get maximum concurrent tasks based on resource availability"""
-        memory_usage = self.resource_monitor.get_memory_usage()
-        cpu_usage = self.resource_monitor.get_cpu_usage()
+        memory_usage, cpu_usage, _ = self._last_resource_snapshot
         
         # Base on available resources
-        if memory_usage > 0.8 or cpu_usage > 0.9:
-            return 2
-        elif memory_usage > 0.6 or cpu_usage > 0.7:
-            return 4
-        else:
-            return 6
+        return min(MEMORY_CONCURRENCY[min(int(memory_usage * 10), 10)],
+                   CPU_CONCURRENCY[min(int(cpu_usage * 10), 10)])
     
     def _track_execution_metrics(self, agent_id: str, execution_time: float, success: bool):
         """Track execution metrics"""
+        memory_usage, cpu_usage, _ = self._last_resource_snapshot
         metrics = PerformanceMetrics(
             execution_time=execution_time,
-            memory_usage=self.resource_monitor.get_memory_usage(),
-            cpu_usage=self.resource_monitor.get_cpu_usage(),
+            memory_usage=memory_usage,
+            cpu_usage=cpu_usage,
             cache_hit_rate=self._get_cache_hit_rate(),
             parallel_efficiency=self._calculate_parallel_efficiency(),
             cost_per_execution=self.cost_tracker.get_cost_per_execution(),
@@ -506,9 +699,19 @@ class PerformanceOptimizer:
         
         self.performance_metrics.append(metrics)
         
-        # Keep only recent metrics
-        if len(self.performance_metrics) > 100:
-            self.performance_metrics = self.performance_metrics[-50:]
+        recent = self._recent_exec_times
+        if len(recent) == EFFICIENCY_WINDOW:
+            self._recent_exec_sum -= recent[0]
+        recent.append(execution_time)
+        self._recent_exec_sum += execution_time
+        
+        slot = self._metrics_index
+        self._exec_times[slot] = metrics.execution_time
+        self._memory_samples[slot] = metrics.memory_usage
+        self._cpu_samples[slot] = metrics.cpu_usage
+        self._throughputs[slot] = metrics.throughput
+        self._metrics_index = (slot + 1) % METRICS_WINDOW
+        self._metrics_count = min(self._metrics_count + 1, METRICS_WINDOW)
     
     def _get_cache_hit_rate(self) -> float:
         """Get current cache hit rate"""
@@ -517,12 +720,11 @@ class PerformanceOptimizer:
     
     def _calculate_parallel_efficiency(self) -> float:
         """Calculate parallel execution efficiency"""
-        if not self.performance_metrics:
+        if not self._recent_exec_times:
             return 0.0
         
         # Calculate efficiency based on execution time vs expected time
-        recent_metrics = self.performance_metrics[-10:]
-        avg_execution_time = statistics.mean([m.execution_time for m in recent_metrics])
+        avg_execution_time = self._recent_exec_sum / len(self._recent_exec_times)
         
         # Assume ideal parallel execution would be 50% faster
         expected_time = avg_execution_time * 0.5
@@ -534,7 +736,16 @@ class PerformanceOptimizer:
         """Collect and store performance metrics"""
         # This method can be extended to store metrics in a database
         # or send them to a monitoring system
-        pass
+        
+        # Per-entry cache logs are DEBUG only; summarize cache activity here instead
+        stats = self.cache_stats
+        if stats != self._last_summary_stats:
+            logger.info(
+                "💾 Cache: %d hits, %d misses, %d evictions, %d entries (%.1f%% hit rate)",
+                stats['hits'], stats['misses'], stats['evictions'], stats['size'],
+                self._get_cache_hit_rate()
+            )
+            self._last_summary_stats = stats
 
 class ResourceMonitor:
     """Resource usage monitoring"""
@@ -543,18 +754,29 @@ class ResourceMonitor:
         self.memory_usage = 0.0
         self.cpu_usage = 0.0
         self.last_update = datetime.now(timezone.utc)
+        
+        try:
+            import psutil
+            
+            # Prime the CPU counter so later non-blocking reads return the delta since this call
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
     
     async def update_metrics(self):
         """Update resource metrics"""
         try:
             import psutil
             
+            # psutil calls run in the default executor so they never stall the event loop
+            loop = asyncio.get_running_loop()
+            
             # Get memory usage
-            memory = psutil.virtual_memory()
+            memory = await loop.run_in_executor(None, psutil.virtual_memory)
             self.memory_usage = memory.percent / 100.0
             
-            # Get CPU usage
-            self.cpu_usage = psutil.cpu_percent(interval=1) / 100.0
+            # Get CPU usage since the previous sample (non-blocking)
+            self.cpu_usage = await loop.run_in_executor(None, psutil.cpu_percent, None) / 100.0
             
             self.last_update = datetime.now(timezone.utc)
             
@@ -570,6 +792,10 @@ class ResourceMonitor:
     def get_cpu_usage(self) -> float:
         """Get current CPU usage"""
         return self.cpu_usage
+    
+    def snapshot(self) -> Tuple[float, float, float]:
+        """Current (memory, cpu, monotonic time) readings as one tuple"""
+        return self.memory_usage, self.cpu_usage, time.monotonic()
 
 class CostTracker:
     """Cost tracking and optimization"""
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Query Retry Helpers
+===================
+
+Exponential-backoff retry for the end-to-end test scripts, so a single rate
+limit or transient API failure does not fail a whole run.
+
+process_user_query reports failures as {"error": ...} results rather than
+raising, so both raised OpenAI errors and error results whose message looks
+transient are retried. Concurrent retried calls share one semaphore to avoid
+stampeding the API while it is already throttling.
+
+Usage:
+    result = await process_query_with_retry(system, query)
+    spec = await call_with_retry(orchestrator.generate_orchestration_spec, query)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+# Retry budget: up to 5 attempts, waiting a jittered 1s, 2s, 4s, ... capped at 16s
+MAX_ATTEMPTS = 5
+BACKOFF_MIN = 1
+BACKOFF_MAX = 16
+
+# Calls allowed in flight at once through the retry helpers
+MAX_CONCURRENT_CALLS = 4
+
+# Exceptions worth another attempt
+TRANSIENT_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# Substrings of an {"error": ...} message that indicate a transient failure
+TRANSIENT_MARKERS = ("rate limit", "429", "timeout", "timed out", "connection error", "502", "503", "overloaded")
+
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _call_semaphore() -> asyncio.Semaphore:
+    """Semaphore bounding concurrent retried calls, created on first use"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+    return _semaphore
+
+
+def is_transient_result(result: Any) -> bool:
+    """Whether a process_user_query-style result is an error worth retrying"""
+    if not isinstance(result, dict) or "error" not in result:
+        return False
+    message = str(result["error"]).lower()
+    return any(marker in message for marker in TRANSIENT_MARKERS)
+
+
+async def call_with_retry(func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """Await func(*args, **kwargs), retrying transient failures with jittered exponential backoff"""
+    retrying = AsyncRetrying(
+        wait=wait_random_exponential(min=BACKOFF_MIN, max=BACKOFF_MAX),
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        retry=retry_if_exception_type(TRANSIENT_ERRORS) | retry_if_result(is_transient_result),
+        # Out of attempts: surface the last exception, or hand back the last error result
+        retry_error_callback=lambda state: state.outcome.result(),
+    )
+    async with _call_semaphore():
+        return await retrying(func, *args, **kwargs)
+
+
+async def process_query_with_retry(system, query: str) -> dict:
+    """system.process_user_query(query) with transient-failure retry"""
+    return await call_with_retry(system.process_user_query, query)
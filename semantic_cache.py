@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Semantic Query Cache
+====================
+
+Embedding-similarity cache for the test scripts' business queries, so a
+paraphrase of an already-answered query reuses its response instead of
+running the full pipeline again.
+
+Queries are embedded with text-embedding-3-small and compared by cosine
+similarity against every cached query (a flat inner-product search over
+normalized vectors). Hits above SIMILARITY_THRESHOLD return the stored
+response. Entries persist under .cache/semantic/ and are shared by all
+test scripts.
+
+Usage:
+    cache = SemanticCache()
+    embedding = await cache.embed(query)
+    response = await cache.lookup(query, embedding)
+    if response is None:
+        response = await system.process_user_query(query)
+        await cache.store(query, response, embedding)
+
+Passing the same embedding to lookup and store embeds each query only once.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import orjson
+
+from console_log import get_logger
+from shared_openai_client import get_client
+
+log = get_logger(__name__)
+
+# Shared on-disk store: normalized embeddings plus the responses they map to
+CACHE_DIR = Path(".cache") / "semantic"
+EMBEDDINGS_FILE = CACHE_DIR / "embeddings.npy"
+ENTRIES_FILE = CACHE_DIR / "entries.json"
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Minimum cosine similarity for a cached response to stand in for a new query
+SIMILARITY_THRESHOLD = 0.92
+
+
+def semantic_cache_enabled() -> bool:
+    """Whether SEMANTIC_CACHE=1 opts the benchmarks into similarity reuse"""
+    return os.getenv("SEMANTIC_CACHE") == "1"
+
+
+class SemanticCache:
+    """Cosine-similarity cache over embedded queries"""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._lock = asyncio.Lock()
+        try:
+            self.embeddings = np.load(EMBEDDINGS_FILE)
+            self.entries = orjson.loads(ENTRIES_FILE.read_bytes())
+        except (OSError, ValueError):
+            self.embeddings = np.empty((0, 0), dtype=np.float32)
+            self.entries = []
+        if len(self.entries) != len(self.embeddings):
+            # A torn write left the two files out of step; start over rather than mismatch
+            self.embeddings = np.empty((0, 0), dtype=np.float32)
+            self.entries = []
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Unit-length embedding of a query"""
+        response = await get_client().embeddings.create(model=EMBEDDING_MODEL, input=text)
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    async def lookup(self, query: str, embedding: Optional[np.ndarray] = None) -> Optional[Any]:
+        """Cached response for the closest earlier query, if it is similar enough"""
+        if not self.entries:
+            return None
+        vector = embedding if embedding is not None else await self.embed(query)
+        # Inner product of unit vectors is their cosine similarity
+        scores = self.embeddings @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        entry = self.entries[best]
+        log.info("♻️ Semantic cache hit (%.3f) for: %s...", scores[best], entry['query'][:60])
+        return entry["response"]
+
+    async def store(self, query: str, response: Any, embedding: Optional[np.ndarray] = None) -> None:
+        """Add a query's response to the cache and persist it, reusing the lookup's embedding if given"""
+        vector = embedding if embedding is not None else await self.embed(query)
+        async with self._lock:
+            # Entry first: a concurrent lookup only indexes rows that already have an entry
+            self.entries.append({"query": query, "response": response})
+            if self.embeddings.size:
+                self.embeddings = np.vstack([self.embeddings, vector])
+            else:
+                self.embeddings = vector[np.newaxis, :]
+            await asyncio.to_thread(self._persist)
+
+    def _persist(self) -> None:
+        """Write both files via temporary names so readers never see a partial file"""
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        embeddings_tmp = EMBEDDINGS_FILE.with_suffix(".tmp.npy")
+        entries_tmp = ENTRIES_FILE.with_suffix(".tmp")
+        np.save(embeddings_tmp, self.embeddings)
+        entries_tmp.write_bytes(orjson.dumps(self.entries, default=str, option=orjson.OPT_NON_STR_KEYS))
+        os.replace(embeddings_tmp, EMBEDDINGS_FILE)
+        os.replace(entries_tmp, ENTRIES_FILE)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Shared OpenAI Client
+====================
+
+One AsyncOpenAI client per event loop for the API test scripts, backed by a
+long-lived httpx keepalive pool so successive requests reuse warm TLS
+connections instead of each script opening its own.
+
+Usage:
+    client = get_client()
+    response = await client.chat.completions.create(...)
+"""
+
+import asyncio
+import os
+import weakref
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+# Connection pool shared by every request made through the client
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+
+# httpx async pools are bound to the loop that opened them, so clients are cached per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+
+def get_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """Shared AsyncOpenAI client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key or os.getenv('OPENAI_API_KEY'),
+            http_client=httpx.AsyncClient(limits=HTTP_LIMITS)
+        )
+        _clients[loop] = client
+    return client
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Shared Test System
+==================
+
+One initialized EnergyPropertyAISystemV2 per event loop for the end-to-end
+test scripts, so the expensive startup (MCP client, orchestrator, workflow
+engine) runs once however many tests in the process ask for it.
+
+Usage:
+    system = await get_system()
+    if system is None:
+        ...  # initialization failed
+"""
+
+import asyncio
+import weakref
+from typing import Optional
+
+from main_integration_v2 import EnergyPropertyAISystemV2
+
+# The system's async clients are bound to the loop that created them, so systems are cached per loop
+_systems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = weakref.WeakKeyDictionary()
+
+
+async def _initialize() -> Optional[EnergyPropertyAISystemV2]:
+    """Create and initialize a system, or None if initialization fails"""
+    system = EnergyPropertyAISystemV2()
+    return system if await system.initialize_system() else None
+
+
+async def get_system() -> Optional[EnergyPropertyAISystemV2]:
+    """Shared initialized system for the running event loop"""
+    loop = asyncio.get_running_loop()
+    task = _systems.get(loop)
+    if task is None:
+        # Concurrent callers await the same initialization instead of starting their own
+        task = _systems[loop] = loop.create_task(_initialize())
+    try:
+        system = await task
+    except Exception:
+        _systems.pop(loop, None)
+        raise
+    if system is None:
+        # Let a later caller retry rather than caching the failure
+        _systems.pop(loop, None)
+    return system
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Smoke Test Response Cache
+=========================
+
+On-disk cache of chat completion responses for the API smoke tests.
+
+Requests that explicitly set temperature=0 are replayed from a local shelve
+store keyed by sha256 of the request parameters, so reruns skip the network
+round-trip. A request without a temperature samples at the model default and
+is only replayed when SMOKE_TEST_CACHE=1 opts in. A replayed run did not
+probe the API, and the helpers here say so on the console.
+
+Usage:
+    client.chat.completions.create = cached_create(client.chat.completions.create)
+
+Set SMOKE_TEST_CACHE=0 to always call the API.
+"""
+
+import hashlib
+import json
+import os
+import shelve
+import threading
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+
+from console_log import get_logger
+
+# Shelve store shared by all smoke tests (dbm may add its own file extensions)
+CACHE_PATH = Path("test_results") / "smoke_cache"
+
+# Completions are only replayed for requests whose sampling is deterministic
+DETERMINISTIC_TEMPERATURE = 0
+
+_store_lock = threading.Lock()
+
+log = get_logger(__name__)
+
+
+def cache_enabled() -> bool:
+    """Whether SMOKE_TEST_CACHE allows serving cached responses"""
+    return os.getenv("SMOKE_TEST_CACHE") != "0"
+
+
+def cache_sampled() -> bool:
+    """Whether SMOKE_TEST_CACHE=1 opts requests without an explicit temperature=0 into the cache"""
+    return os.getenv("SMOKE_TEST_CACHE") == "1"
+
+
+def cache_key(params: Dict[str, Any]) -> Optional[str]:
+    """sha256 of the request parameters, or None when the request is not cacheable"""
+    if params.get("stream"):
+        return None
+    if "temperature" in params:
+        if params["temperature"] != DETERMINISTIC_TEMPERATURE:
+            return None
+    elif not cache_sampled():
+        return None
+    payload = {name: params.get(name) for name in ("model", "messages", "max_completion_tokens", "response_format", "temperature")}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _load(key: str) -> Optional[str]:
+    """Cached content for a key, memoized in process after the first disk read"""
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    with _store_lock, shelve.open(str(CACHE_PATH)) as store:
+        return store.get(key)
+
+
+def lookup(params: Dict[str, Any]) -> Optional[str]:
+    """Cached completion text for these request parameters, if any"""
+    key = cache_key(params)
+    if key is None or not cache_enabled():
+        return None
+    return _load(key)
+
+
+def store(params: Dict[str, Any], content: str) -> None:
+    """Persist the completion text for these request parameters"""
+    key = cache_key(params)
+    if key is None or content is None:
+        return
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    with _store_lock, shelve.open(str(CACHE_PATH)) as store:
+        store[key] = content
+    _load.cache_clear()
+
+
+def cached_response(content: str) -> SimpleNamespace:
+    """Minimal stand-in for a ChatCompletion exposing choices[0].message.content"""
+    message = SimpleNamespace(role="assistant", content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(index=0, message=message, finish_reason="stop")], cached=True)
+
+
+def cached_create(create: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a sync chat.completions.create so deterministic requests are served from the cache"""
+    def create_with_cache(**params):
+        content = lookup(params)
+        if content is not None:
+            log.warning("♻️ Served %s from the smoke-test cache; the API was not called", params.get("model"))
+            return cached_response(content)
+        response = create(**params)
+        store(params, response.choices[0].message.content)
+        return response
+    return create_with_cache
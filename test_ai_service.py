@@ -4,23 +4,31 @@ Test AI Service for debugging
 
 import asyncio
 from ai_service import AIService
+from smoke_cache import cached_create
+from console_log import get_logger
+
+log = get_logger(__name__)
 
 async def test_ai_service():
     """Test the AI service"""
-    print("🧪 Testing AI Service...")
+    log.info("🧪 Testing AI Service...")
     
     try:
         # Initialize AI service
         ai_service = AIService()
-        print("✅ AI Service initialized")
+        log.info("✅ AI Service initialized")
+        
+        # Serve repeated runs of the same prompt from the local smoke-test cache
+        completions = ai_service.client.chat.completions
+        completions.create = cached_create(completions.create)
         
         # Test query analysis
-        print("\n🧠 Testing query analysis...")
+        log.info("\n🧠 Testing query analysis...")
         result = await ai_service.analyze_query("Analyze Q2 2025 performance")
-        print(f"✅ Analysis result: {result}")
+        log.info("✅ Analysis result: %s", result)
         
     except Exception as error:
-        print(f"❌ Error: {error}")
+        log.error("❌ Error: %s", error)
         import traceback
         traceback.print_exc()
 
@@ -12,170 +12,186 @@ Test the Phase 4 system with a complex business query that requires:
 """
 
 import asyncio
-import json
 import time
 from datetime import datetime
 from pathlib import Path
 
-# Import our Phase 4 system
-from main_integration_v2 import EnergyPropertyAISystemV2
+import orjson
+
+# Shared Phase 4 system, initialized once per process
+from shared_system import get_system
+from query_retry import process_query_with_retry
+from console_log import get_logger
+
+log = get_logger(__name__)
+
+# Every run appends one line here instead of writing its own indented file
+RESULTS_FILE = Path("test_results") / "comprehensive_query_results.ndjson"
+
+# Sections of the final output that the report displays
+DISPLAYED_SECTIONS = ("execution_summary", "recommendations", "agent_outputs")
 
 async def test_comprehensive_query():
     """Test the comprehensive business query with Phase 4 system"""
     
-    print("🎯 Testing Phase 4 System with Comprehensive Business Query")
-    print("=" * 80)
+    log.info("🎯 Testing Phase 4 System with Comprehensive Business Query")
+    log.info("=" * 80)
     
     # Initialize Phase 4 system
-    print("🚀 Initializing Phase 4 system...")
-    system = EnergyPropertyAISystemV2()
+    log.info("🚀 Initializing Phase 4 system...")
+    system = await get_system()
     
-    if not await system.initialize_system():
-        print("❌ System initialization failed!")
+    if system is None:
+        log.error("❌ System initialization failed!")
         return
     
-    print("✅ Phase 4 system initialized successfully!")
+    log.info("✅ Phase 4 system initialized successfully!")
     
     # Define the comprehensive business query
     comprehensive_query = """I need to know which region is the most interesting one to focus on with regards to gross margin. Can you look at where to focus on and which are the top three selling assets that I should focus on? Make sure that in that region and for those potential accounts, those assets are not yet sold, so there's truly an upsell opportunity. After you've done that, can you come up with an explanation as to why we should focus on that region, those products, those assets, and those accounts? From there, I'm going to have to come up with a communication strategy - which marketing campaign can we aspire for and what is the best channel of communication. And why?"""
     
-    print(f"\n📝 Comprehensive Business Query:")
-    print(f"Query: {comprehensive_query}")
-    print("-" * 80)
+    log.info("\n📝 Comprehensive Business Query:")
+    log.info("Query: %s", comprehensive_query)
+    log.info("-" * 80)
     
     # Process the query
-    print("\n🔄 Processing comprehensive business query...")
+    log.info("\n🔄 Processing comprehensive business query...")
     start_time = time.time()
     
     try:
-        result = await system.process_user_query(comprehensive_query)
+        result = await process_query_with_retry(system, comprehensive_query)
         
         execution_time = time.time() - start_time
         
-        print(f"\n✅ Query processing completed in {execution_time:.2f}s")
+        log.info("\n✅ Query processing completed in %.2fs", execution_time)
         
         # Display results
         if "error" not in result:
-            print("\n📊 Results Analysis:")
-            print("=" * 50)
+            log.info("\n📊 Results Analysis:")
+            log.info("=" * 50)
             
             # Show orchestration details
             if "orchestration_id" in result:
-                print(f"🤖 Orchestration ID: {result['orchestration_id']}")
+                log.info("🤖 Orchestration ID: %s", result['orchestration_id'])
             
             # Show system version
             if "system_version" in result:
-                print(f"🔧 System Version: {result['system_version']}")
+                log.info("🔧 System Version: %s", result['system_version'])
             
             # Show workflow result
             if "workflow_result" in result:
                 workflow_result = result["workflow_result"]
-                print(f"\n🔄 Workflow Status: {workflow_result.get('workflow_status', 'unknown')}")
+                log.info("\n🔄 Workflow Status: %s", workflow_result.get('workflow_status', 'unknown'))
                 
                 # Show agent outputs if available
                 if "agent_outputs" in workflow_result:
                     agent_outputs = workflow_result["agent_outputs"]
-                    print(f"🤖 Agents Executed: {len(agent_outputs)}")
+                    log.info("🤖 Agents Executed: %d", len(agent_outputs))
                     
                     for agent_id, output in agent_outputs.items():
-                        print(f"  • {agent_id}: {output.get('status', 'unknown')}")
+                        log.info("  • %s: %s", agent_id, output.get('status', 'unknown'))
             
             # Show performance metrics
             if "performance_metrics" in result:
                 metrics = result["performance_metrics"]
                 if "overall_metrics" in metrics:
                     overall = metrics["overall_metrics"]
-                    print(f"\n📈 Performance Metrics:")
-                    print(f"  • Success Rate: {overall.get('success_rate', 0):.1f}%")
-                    print(f"  • Average Execution Time: {overall.get('average_execution_time', 0):.2f}s")
-                    print(f"  • Total Executions: {overall.get('total_executions', 0)}")
+                    log.info("\n📈 Performance Metrics:")
+                    log.info("  • Success Rate: %.1f%%", overall.get('success_rate', 0))
+                    log.info("  • Average Execution Time: %.2fs", overall.get('average_execution_time', 0))
+                    log.info("  • Total Executions: %s", overall.get('total_executions', 0))
             
             # Show optimization metrics
             if "optimization_metrics" in result:
                 opt_metrics = result["optimization_metrics"]
-                print(f"\n⚡ Optimization Metrics:")
+                log.info("\n⚡ Optimization Metrics:")
                 if "cache_metrics" in opt_metrics:
                     cache = opt_metrics["cache_metrics"]
-                    print(f"  • Cache Hit Rate: {cache.get('hit_rate', 0):.1f}%")
-                    print(f"  • Cache Size: {cache.get('size', 0)}/{cache.get('max_size', 0)}")
+                    log.info("  • Cache Hit Rate: %.1f%%", cache.get('hit_rate', 0))
+                    log.info("  • Cache Size: %s/%s", cache.get('size', 0), cache.get('max_size', 0))
                 
                 if "execution_metrics" in opt_metrics:
                     exec_metrics = opt_metrics["execution_metrics"]
-                    print(f"  • Parallel Efficiency: {exec_metrics.get('parallel_efficiency', 0):.1f}%")
-                    print(f"  • Total Executions: {exec_metrics.get('total_executions', 0)}")
+                    log.info("  • Parallel Efficiency: %.1f%%", exec_metrics.get('parallel_efficiency', 0))
+                    log.info("  • Total Executions: %s", exec_metrics.get('total_executions', 0))
             
             # Show final output if available
             if "workflow_result" in result and "final_output" in result["workflow_result"]:
                 final_output = result["workflow_result"]["final_output"]
-                print(f"\n📋 Final Output:")
-                print("-" * 30)
+                log.info("\n📋 Final Output:")
+                log.info("-" * 30)
                 
                 try:
-                    # Try to parse and display JSON output
-                    if isinstance(final_output, str):
-                        output_data = json.loads(final_output)
+                    # Try to parse and display JSON output; only the displayed sections are kept
+                    if isinstance(final_output, (str, bytes)):
+                        parsed = orjson.loads(final_output)
+                        output_data = {key: parsed[key] for key in DISPLAYED_SECTIONS if key in parsed}
+                        del parsed
                     else:
                         output_data = final_output
                     
                     # Display key sections
                     if "execution_summary" in output_data:
                         summary = output_data["execution_summary"]
-                        print(f"📊 Execution Summary:")
-                        print(f"  • Total Agents: {summary.get('total_agents', 0)}")
-                        print(f"  • Successful Agents: {summary.get('successful_agents', 0)}")
-                        print(f"  • Success Rate: {summary.get('success_rate', 0):.1f}%")
-                        print(f"  • Execution Time: {summary.get('execution_time', 0):.2f}s")
+                        log.info("📊 Execution Summary:")
+                        log.info("  • Total Agents: %s", summary.get('total_agents', 0))
+                        log.info("  • Successful Agents: %s", summary.get('successful_agents', 0))
+                        log.info("  • Success Rate: %.1f%%", summary.get('success_rate', 0))
+                        log.info("  • Execution Time: %.2fs", summary.get('execution_time', 0))
                     
                     if "recommendations" in output_data:
                         recommendations = output_data["recommendations"]
-                        print(f"\n💡 Recommendations:")
+                        log.info("\n💡 Recommendations:")
                         if isinstance(recommendations, list):
                             for i, rec in enumerate(recommendations[:5], 1):
-                                print(f"  {i}. {rec}")
+                                log.info("  %s. %s", i, rec)
                         else:
-                            print(f"  • {recommendations}")
+                            log.info("  • %s", recommendations)
                     
                     if "agent_outputs" in output_data:
-                        print(f"\n🤖 Agent Outputs:")
+                        log.info("\n🤖 Agent Outputs:")
                         for agent_id, agent_output in output_data["agent_outputs"].items():
-                            print(f"  • {agent_id}: {agent_output.get('status', 'unknown')}")
+                            log.info("  • %s: %s", agent_id, agent_output.get('status', 'unknown'))
                             if "output" in agent_output:
                                 output_content = agent_output["output"]
                                 if isinstance(output_content, dict):
                                     # Show key insights from agent output
                                     if "insights" in output_content:
-                                        print(f"    - Insights: {output_content['insights']}")
+                                        log.info("    - Insights: %s", output_content['insights'])
                                     if "recommendations" in output_content:
-                                        print(f"    - Recommendations: {output_content['recommendations']}")
+                                        log.info("    - Recommendations: %s", output_content['recommendations'])
                 
                 except Exception as e:
-                    print(f"  • Raw output: {final_output[:200]}...")
-            
-            # Save detailed results
-            results_file = f"test_results/comprehensive_query_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            Path("test_results").mkdir(exist_ok=True)
+                    log.info("  • Raw output: %s...", final_output[:200])
             
-            with open(results_file, 'w') as f:
-                json.dump(result, f, indent=2)
+            # Save detailed results as one NDJSON record, appended without touching earlier runs
+            RESULTS_FILE.parent.mkdir(exist_ok=True)
+            record = {"timestamp": datetime.now().isoformat(), "result": result}
+            with RESULTS_FILE.open("ab") as f:
+                f.write(orjson.dumps(
+                    record,
+                    default=str,
+                    option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
             
-            print(f"\n💾 Detailed results saved to: {results_file}")
+            log.info("\n💾 Detailed results appended to: %s", RESULTS_FILE)
             
         else:
-            print(f"❌ Query processing failed: {result['error']}")
+            log.error("❌ Query processing failed: %s", result['error'])
     
     except Exception as e:
         execution_time = time.time() - start_time
-        print(f"❌ Error during query processing: {e}")
-        print(f"⏱️ Execution time: {execution_time:.2f}s")
+        log.error("❌ Error during query processing: %s", e)
+        log.info("⏱️ Execution time: %.2fs", execution_time)
     
     # Get system status
-    print(f"\n📊 System Status:")
+    log.info("\n📊 System Status:")
     status = system.get_system_status()
-    print(f"  • Status: {status['status']}")
-    print(f"  • System Health: {status['system_health']}")
+    log.info("  • Status: %s", status['status'])
+    log.info("  • System Health: %s", status['system_health'])
     
-    print(f"\n🎉 Comprehensive Query Test Completed!")
-    print("=" * 80)
+    log.info("\n🎉 Comprehensive Query Test Completed!")
+    log.info("=" * 80)
 
 if __name__ == "__main__":
     asyncio.run(test_comprehensive_query()) 
\ No newline at end of file
@@ -3,84 +3,104 @@
 Test script for Performance Dashboard functionality
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-def test_dashboard_components():
+from console_log import get_logger
+
+log = get_logger(__name__)
+
+@lru_cache(maxsize=1)
+def _get_dashboard():
+    """Shared PerformanceDashboard, constructed on first use"""
+    from performance_dashboard import PerformanceDashboard
+    return PerformanceDashboard()
+
+@lru_cache(maxsize=1)
+def _get_launcher():
+    """Shared DemoLauncher, constructed on first use"""
+    from demo_launcher import DemoLauncher
+    return DemoLauncher()
+
+def test_dashboard_components(out=None):
     """Test dashboard components without Streamlit"""
     try:
-        from performance_dashboard import PerformanceDashboard
-        print("✅ Performance Dashboard class imported successfully")
-        
-        # Test dashboard initialization
-        dashboard = PerformanceDashboard()
-        print("✅ Dashboard instance created successfully")
+        # Test dashboard import and initialization (memoized across tests)
+        dashboard = _get_dashboard()
+        print("✅ Performance Dashboard class imported successfully", file=out)
+        print("✅ Dashboard instance created successfully", file=out)
         
         # Test system metrics
         metrics = dashboard.get_system_metrics()
-        print("✅ System metrics retrieved successfully")
-        print(f"   CPU: {metrics['cpu_usage']}")
-        print(f"   Memory: {metrics['memory_usage']}")
-        print(f"   Disk: {metrics['disk_usage']}")
+        print("✅ System metrics retrieved successfully", file=out)
+        print(f"   CPU: {metrics['cpu_usage']}", file=out)
+        print(f"   Memory: {metrics['memory_usage']}", file=out)
+        print(f"   Disk: {metrics['disk_usage']}", file=out)
         
         # Test data loading
         data = dashboard.load_performance_data()
-        print("✅ Performance data loaded successfully")
-        print(f"   Executions: {len(data['executions'])}")
-        print(f"   Agent Performance: {len(data['agent_performance'])}")
+        print("✅ Performance data loaded successfully", file=out)
+        print(f"   Executions: {len(data['executions'])}", file=out)
+        print(f"   Agent Performance: {len(data['agent_performance'])}", file=out)
         
-        print("\n🎉 All dashboard components working correctly!")
+        print("\n🎉 All dashboard components working correctly!", file=out)
         return True
         
     except Exception as e:
-        print(f"❌ Error testing dashboard: {e}")
+        print(f"❌ Error testing dashboard: {e}", file=out)
         return False
 
-def test_demo_launcher():
+def test_demo_launcher(out=None):
     """Test demo launcher components without Streamlit"""
     try:
-        from demo_launcher import DemoLauncher
-        print("✅ Demo Launcher class imported successfully")
-        
-        # Test launcher initialization
-        launcher = DemoLauncher()
-        print("✅ Demo Launcher instance created successfully")
+        # Test launcher import and initialization (memoized across tests)
+        launcher = _get_launcher()
+        print("✅ Demo Launcher class imported successfully", file=out)
+        print("✅ Demo Launcher instance created successfully", file=out)
         
         # Test demo queries
-        print(f"✅ Demo queries loaded: {len(launcher.demo_queries)}")
+        print(f"✅ Demo queries loaded: {len(launcher.demo_queries)}", file=out)
         for name, info in launcher.demo_queries.items():
-            print(f"   - {name}: {info['description']}")
+            print(f"   - {name}: {info['description']}", file=out)
         
-        print("\n🎉 All demo launcher components working correctly!")
+        print("\n🎉 All demo launcher components working correctly!", file=out)
         return True
         
     except Exception as e:
-        print(f"❌ Error testing demo launcher: {e}")
+        print(f"❌ Error testing demo launcher: {e}", file=out)
         return False
 
 def main():
     """Run all tests"""
-    print("🧪 Testing Dashboard Components")
-    print("=" * 50)
-    
-    dashboard_ok = test_dashboard_components()
-    print("\n" + "=" * 50)
+    # The suites touch disjoint modules, so their imports and checks run side by side;
+    # each buffers its output so the report still prints in order
+    dashboard_out, launcher_out = io.StringIO(), io.StringIO()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dashboard_future = executor.submit(test_dashboard_components, dashboard_out)
+        launcher_future = executor.submit(test_demo_launcher, launcher_out)
+        dashboard_ok, launcher_ok = dashboard_future.result(), launcher_future.result()
     
-    print("🧪 Testing Demo Launcher Components")
-    print("=" * 50)
+    log.info("🧪 Testing Dashboard Components")
+    log.info("=" * 50)
+    # A failed suite reports its buffered output at error level
+    log.log(logging.INFO if dashboard_ok else logging.ERROR, "%s", dashboard_out.getvalue().rstrip("\n"))
+    log.info("\n" + "=" * 50)
     
-    launcher_ok = test_demo_launcher()
-    print("\n" + "=" * 50)
+    log.info("🧪 Testing Demo Launcher Components")
+    log.info("=" * 50)
+    log.log(logging.INFO if launcher_ok else logging.ERROR, "%s", launcher_out.getvalue().rstrip("\n"))
+    log.info("\n" + "=" * 50)
     
     if dashboard_ok and launcher_ok:
-        print("🎉 ALL TESTS PASSED! Dashboard and Demo Launcher ready for use.")
-        print("\n📱 To launch the dashboard:")
-        print("   streamlit run performance_dashboard.py")
-        print("\n🎯 To launch the demo interface:")
-        print("   streamlit run demo_launcher.py")
+        log.info("🎉 ALL TESTS PASSED! Dashboard and Demo Launcher ready for use.")
+        log.info("\n📱 To launch the dashboard:")
+        log.info("   streamlit run performance_dashboard.py")
+        log.info("\n🎯 To launch the demo interface:")
+        log.info("   streamlit run demo_launcher.py")
     else:
-        print("❌ Some tests failed. Please check the errors above.")
+        log.error("❌ Some tests failed. Please check the errors above.")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
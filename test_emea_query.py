@@ -16,43 +16,75 @@ from pathlib import Path
 from fast_mcp_connectors import FastMCPClient
 from o3_orchestrator import O3Orchestrator
 from langgraph_workflow import WorkflowEngine
+from query_retry import call_with_retry
+from console_log import get_logger
+
+log = get_logger(__name__)
+
+def write_spec(path: str, spec) -> None:
+    """Save an orchestration spec as indented JSON (run in a worker thread)"""
+    with open(path, 'w') as f:
+        json.dump(spec, f, indent=2)
+
+def log_agent_output(agent_id: str, output):
+    """Log the top insights and recommendations from one agent's output"""
+    log.info("\n🔍 %s:", agent_id)
+    if isinstance(output, dict):
+        analysis = output.get('analysis', {})
+        if isinstance(analysis, dict):
+            # Extract key insights
+            insights = analysis.get('key_insights', [])
+            recommendations = analysis.get('recommendations', [])
+            
+            if insights:
+                log.info("  📈 Key Insights:")
+                for insight in insights[:3]:  # Show top 3
+                    log.info("    • %s", insight)
+            
+            if recommendations:
+                log.info("  🎯 Recommendations:")
+                for rec in recommendations[:3]:  # Show top 3
+                    log.info("    • %s", rec)
+        else:
+            log.info("    %s...", str(analysis)[:200])
+    else:
+        log.info("    %s...", str(output)[:200])
 
 async def test_emea_query():
     """Test the EMEA opportunities and pipeline uplift query"""
     
-    print("🎯 Testing Phase 3: EMEA Opportunities and Pipeline Uplift")
-    print("=" * 60)
+    log.info("🎯 Testing Phase 3: EMEA Opportunities and Pipeline Uplift")
+    log.info("=" * 60)
     
     # Initialize components
-    print("🚀 Initializing Phase 3 components...")
+    log.info("🚀 Initializing Phase 3 components...")
     
-    # Initialize Fast MCP Client
+    # The orchestrator and workflow engine only hold the client, so they are built
+    # (in worker threads) while the Fast MCP Client warms its data connectors
     fast_mcp_client = FastMCPClient()
-    await fast_mcp_client.initialize()
-    print("✅ Fast MCP Client initialized")
-    
-    # Initialize o3 Orchestrator
-    orchestrator = O3Orchestrator(fast_mcp_client)
-    print("✅ o3 Orchestrator initialized")
-    
-    # Initialize Workflow Engine
-    workflow_engine = WorkflowEngine(fast_mcp_client)
-    print("✅ Workflow Engine initialized")
+    _, orchestrator, workflow_engine = await asyncio.gather(
+        fast_mcp_client.initialize(),
+        asyncio.to_thread(O3Orchestrator, fast_mcp_client),
+        asyncio.to_thread(WorkflowEngine, fast_mcp_client)
+    )
+    log.info("✅ Fast MCP Client initialized")
+    log.info("✅ o3 Orchestrator initialized")
+    log.info("✅ Workflow Engine initialized")
     
     # Define the EMEA query
     emea_query = "I need to know which opportunities I should focus on in EMEA. Which assets would be ideal to push? I need to uplift pipeline for about +25%. Can you help me make a plan for this and identify which accounts to focus on?"
     
-    print(f"\n📝 Processing EMEA Query:")
-    print(f"Query: {emea_query}")
-    print("-" * 60)
+    log.info("\n📝 Processing EMEA Query:")
+    log.info("Query: %s", emea_query)
+    log.info("-" * 60)
     
     try:
         # Step 1: Generate orchestration specification
-        print("🤖 Step 1: Generating AI-powered orchestration...")
-        orchestration_spec = await orchestrator.generate_orchestration_spec(emea_query)
+        log.info("🤖 Step 1: Generating AI-powered orchestration...")
+        orchestration_spec = await call_with_retry(orchestrator.generate_cached_orchestration_spec, emea_query)
         
         if orchestration_spec:
-            print(f"✅ Orchestration generated with {len(orchestration_spec.get('workflow', {}).get('agents', []))} agents")
+            log.info("✅ Orchestration generated with %d agents", len(orchestration_spec.get('workflow', {}).get('agents', [])))
             
             # Save orchestration for reference
             orchestration_id = orchestration_spec.get('orchestration_id', 'emea_test')
@@ -61,107 +93,59 @@ async def test_emea_query():
             # Ensure orchestrations directory exists
             Path("orchestrations").mkdir(exist_ok=True)
             
-            with open(orchestration_file, 'w') as f:
-                json.dump(orchestration_spec, f, indent=2)
-            
-            print(f"💾 Saved orchestration to: {orchestration_file}")
-            
-            # Step 2: Execute the workflow
-            print("\n🔄 Step 2: Executing workflow with Claude agents...")
+            # The workflow runs from the in-memory spec, so the save overlaps its API calls
+            write_task = asyncio.create_task(asyncio.to_thread(write_spec, orchestration_file, orchestration_spec))
             
-            # Execute workflow and get full result
-            result = await workflow_engine.execute_orchestration(orchestration_file)
+            # Step 2: Execute the workflow, showing each agent's insights as it finishes
+            log.info("\n🔄 Step 2: Executing workflow with Claude agents...")
+            log.info("\n📊 EMEA Analysis Results:")
+            log.info("=" * 40)
             
-            # Also get the raw workflow result for debugging
+            agent_outputs = {}
+            result = None
             try:
-                with open(orchestration_file, 'r') as file:
-                    orchestration_spec = json.load(file)
-                
-                # Initialize workflow state
-                from langgraph_workflow import AgentState
-                initial_state = AgentState(
-                    orchestration_spec=orchestration_spec,
-                    agent_outputs={},
-                    current_agent="",
-                    workflow_status="initialized",
-                    final_output=""
-                )
-                
-                # Execute workflow directly to get full state
-                workflow_result = await workflow_engine.workflow_graph.ainvoke(initial_state)
-                print(f"🔍 Full workflow result keys: {list(workflow_result.keys())}")
-                
-            except Exception as e:
-                print(f"⚠️ Could not get full workflow result: {e}")
+                async for agent_id, output in workflow_engine.stream_orchestration(orchestration_file, orchestration_spec):
+                    if agent_id == "synthesis_agent":
+                        result = output
+                    else:
+                        agent_outputs[agent_id] = output
+                        log_agent_output(agent_id, output)
+            finally:
+                await write_task
+            log.info("💾 Saved orchestration to: %s", orchestration_file)
             
             if result:
-                print("✅ Workflow execution completed successfully!")
-                
-                # Display results
-                print("\n📊 EMEA Analysis Results:")
-                print("=" * 40)
+                log.info("✅ Workflow execution completed successfully!")
+                log.info("🤖 Agents executed: %d", len(agent_outputs))
                 
-                # Extract key information
                 final_output = result.get('final_output', '')
-                agent_outputs = result.get('agent_outputs', {})
-                
-                # Try to get agent outputs from workflow result if available
-                if 'workflow_result' in locals():
-                    agent_outputs = workflow_result.get('agent_outputs', agent_outputs)
-                    print(f"🔍 Agent outputs from workflow: {list(agent_outputs.keys()) if agent_outputs else 'None'}")
-                
-                print(f"🤖 Agents executed: {len(agent_outputs)}")
-                
-                # Show agent outputs
-                for agent_id, output in agent_outputs.items():
-                    print(f"\n🔍 {agent_id}:")
-                    if isinstance(output, dict):
-                        analysis = output.get('analysis', {})
-                        if isinstance(analysis, dict):
-                            # Extract key insights
-                            insights = analysis.get('key_insights', [])
-                            recommendations = analysis.get('recommendations', [])
-                            
-                            if insights:
-                                print("  📈 Key Insights:")
-                                for insight in insights[:3]:  # Show top 3
-                                    print(f"    • {insight}")
-                            
-                            if recommendations:
-                                print("  🎯 Recommendations:")
-                                for rec in recommendations[:3]:  # Show top 3
-                                    print(f"    • {rec}")
-                        else:
-                            print(f"    {str(analysis)[:200]}...")
-                    else:
-                        print(f"    {str(output)[:200]}...")
                 
                 # Show final synthesis
                 if final_output:
-                    print(f"\n📋 Executive Summary:")
-                    print(f"{final_output[:500]}...")
+                    log.info("\n📋 Executive Summary:")
+                    log.info("%s...", final_output[:500])
                 
-                print(f"\n💾 Full results saved to: {orchestration_file}")
+                log.info("\n💾 Full results saved to: %s", orchestration_file)
                 
             else:
-                print("❌ Workflow execution failed")
+                log.error("❌ Workflow execution failed")
                 
         else:
-            print("❌ Failed to generate orchestration")
+            log.error("❌ Failed to generate orchestration")
             
     except Exception as error:
-        print(f"❌ Error during EMEA query processing: {error}")
+        log.error("❌ Error during EMEA query processing: %s", error)
         import traceback
         traceback.print_exc()
 
 async def main():
     """Main test function"""
-    print("🧪 Phase 3 EMEA Query Test")
-    print("=" * 50)
+    log.info("🧪 Phase 3 EMEA Query Test")
+    log.info("=" * 50)
     
     await test_emea_query()
     
-    print("\n✅ EMEA Query Test Completed!")
+    log.info("\n✅ EMEA Query Test Completed!")
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -10,10 +10,11 @@ Date: August 13, 2025
 Phase: 6 - Evaluation Phase
 """
 
+import io
 import os
 import json
-from datetime import datetime
-from gpt5_evaluator_agent import GPT5EvaluatorAgent
+import sys
+from gpt5_evaluator_agent import CachedEvaluator, file_timestamp
 
 
 def test_evaluation_storage():
@@ -33,7 +34,7 @@ def test_evaluation_storage():
     try:
         # Initialize evaluator
         print("🔧 Initializing GPT5 Evaluator Agent...")
-        evaluator = GPT5EvaluatorAgent(api_key)
+        evaluator = CachedEvaluator(api_key)
         print("✅ GPT5 Evaluator Agent initialized successfully")
         
         # Test 1: Individual evaluation storage
@@ -105,19 +106,23 @@ def test_evaluation_storage():
         if not results_list:
             print("   No evaluation results found.")
         else:
+            # One write for the whole listing instead of a print per line
+            out = io.StringIO()
             for result_meta in results_list:
                 if result_meta['type'] == 'individual':
-                    print(f"   📄 {result_meta['filename']}")
-                    print(f"      Agent: {result_meta['agent_type']}")
-                    print(f"      Score: {result_meta['total_score']}/10")
-                    print(f"      Time: {result_meta['timestamp']}")
+                    print(f"   📄 {result_meta['filename']}", file=out)
+                    print(f"      Agent: {result_meta['agent_type']}", file=out)
+                    print(f"      Score: {result_meta['total_score']}/10", file=out)
+                    print(f"      Time: {result_meta['timestamp']}", file=out)
                 else:
-                    print(f"   📊 {result_meta['filename']}")
-                    print(f"      Type: Batch Evaluation")
-                    print(f"      Count: {result_meta['total_evaluations']} evaluations")
-                    print(f"      Average: {result_meta['average_score']:.1f}/10")
-                    print(f"      Time: {result_meta['timestamp']}")
-                print()
+                    print(f"   📊 {result_meta['filename']}", file=out)
+                    print(f"      Type: Batch Evaluation", file=out)
+                    print(f"      Count: {result_meta['total_evaluations']} evaluations", file=out)
+                    print(f"      Average: {result_meta['average_score']:.1f}/10", file=out)
+                    print(f"      Time: {result_meta['timestamp']}", file=out)
+                print(file=out)
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
         
         # Test 4: Retrieve specific evaluation result
         if results_list:
@@ -150,11 +155,12 @@ def test_evaluation_storage():
             evaluation_dir = "evaluation_results"
             os.makedirs(evaluation_dir, exist_ok=True)
             
-            report_filename = f"evaluation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            report_filename = f"evaluation_report_{file_timestamp()}.md"
             report_filepath = os.path.join(evaluation_dir, report_filename)
             
-            with open(report_filepath, 'w') as f:
-                f.write(report)
+            # Encode once and write raw bytes, skipping the text I/O layer
+            with open(report_filepath, 'wb') as f:
+                f.write(report.encode('utf-8'))
             print(f"\n💾 Report saved to: {report_filepath}")
         
         print(f"\n🎉 All storage system tests completed successfully!")
@@ -12,9 +12,24 @@ Phase: 6 - Evaluation Phase
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import openai
 from openai import OpenAI
 
+# GPT-5 variants whose access is probed, all at once
+MODELS_TO_TEST = ("gpt-5", "gpt-5-mini", "gpt-5-nano")
+
+
+def _probe(client: OpenAI, model: str):
+    """Send a minimal request to confirm access to a model."""
+    return client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "user", "content": "Hello"}
+        ]
+    )
+
 
 def test_gpt5_api():
     """Test basic GPT-5 API connectivity."""
@@ -55,20 +70,18 @@ def test_gpt5_api():
         # Test model variants
         print("\n🔍 Testing GPT-5 model variants...")
         
-        models_to_test = ["gpt-5", "gpt-5-mini", "gpt-5-nano"]
+        print(f"Testing {', '.join(MODELS_TO_TEST)}...")
         
-        for model in models_to_test:
-            try:
-                print(f"Testing {model}...")
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "user", "content": "Hello"}
-                    ]
-                )
-                print(f"✅ {model} - Access confirmed")
-            except Exception as e:
-                print(f"❌ {model} - Access failed: {str(e)}")
+        # The probes are independent, so their round-trips overlap on the thread-safe client
+        with ThreadPoolExecutor(max_workers=len(MODELS_TO_TEST)) as executor:
+            futures = {executor.submit(_probe, client, model): model for model in MODELS_TO_TEST}
+            for future in as_completed(futures):
+                model = futures[future]
+                try:
+                    future.result()
+                    print(f"✅ {model} - Access confirmed")
+                except Exception as e:
+                    print(f"❌ {model} - Access failed: {str(e)}")
         
         print("\n🎉 GPT-5 API integration test completed successfully!")
         return True
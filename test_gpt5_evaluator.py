@@ -10,11 +10,25 @@ Date: August 11, 2025
 Phase: 6 - Evaluation Phase
 """
 
+import argparse
+import asyncio
+import io
 import os
-import json
 import logging
-from datetime import datetime
-from gpt5_evaluator_agent import GPT5EvaluatorAgent, EvaluationResult
+import sys
+import time
+from types import MappingProxyType
+
+import numpy as np
+import orjson
+
+try:
+    # Optional libuv-based event loop, faster at multiplexing many concurrent API calls
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from gpt5_evaluator_agent import BATCH_CONCURRENCY, CachedEvaluator, GPT5EvaluatorAgent, EvaluationResult, file_timestamp
 
 # Configure logging
 logging.basicConfig(
@@ -24,94 +38,124 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Rating fields summarized per criterion in the test report
+RATING_FIELDS = (
+    ("Factuality", "factuality_rating"),
+    ("Data Source Validation", "data_source_validation_rating"),
+    ("Instruction Following", "instruction_following_rating"),
+    ("Conciseness", "conciseness_rating"),
+    ("Completeness", "completeness_rating"),
+)
+
+
+# Sample agent responses, built once at import; read-only so callers cannot alter them between runs
+_SCENARIOS = tuple(MappingProxyType(scenario) for scenario in [
+    {
+        "agent_type": "Financial Impact Agent",
+        "query": "What is the most profitable region and why?",
+        "response": "Based on the financial data analysis, EMEA is the most profitable region with a 23% profit margin. This is driven by strong revenue growth of 18% year-over-year and effective cost optimization initiatives. The region has shown consistent performance improvement over the last three quarters.",
+        "expected_focus": "Financial accuracy, data-driven insights, regional analysis"
+    },
+    {
+        "agent_type": "Upsell Discovery Agent", 
+        "query": "Identify upsell opportunities in the EMEA region",
+        "response": "EMEA region shows significant upsell potential with 45% of customers having only basic product packages. Top opportunities include: 1) Premium monitoring services for 23 customers, 2) Advanced analytics modules for 18 customers, 3) Extended warranty for 31 customers. Estimated total value: €2.4M annually.",
+        "expected_focus": "Opportunity identification, customer targeting, value quantification"
+    },
+    {
+        "agent_type": "Operations Summary Agent",
+        "query": "Provide operational status and identify critical issues",
+        "response": "Current operational status: 94% asset utilization across all regions. Critical issues identified: 1) EMEA region experiencing 15% higher maintenance costs due to aging infrastructure, 2) APAC region showing 8% decrease in lead conversion rates, 3) Americas region operating at optimal efficiency with 98% utilization.",
+        "expected_focus": "Operational metrics, issue identification, regional breakdown"
+    },
+    {
+        "agent_type": "Campaign Planner Agent",
+        "query": "Create marketing campaign for new energy monitoring products",
+        "response": "Marketing Campaign: 'Smart Energy Future' - Target: EMEA commercial customers. Channels: LinkedIn advertising (40% budget), industry conferences (30% budget), email marketing (20% budget), partner referrals (10% budget). Timeline: Q4 2025 launch. Expected ROI: 3.2x with €1.8M projected revenue.",
+        "expected_focus": "Marketing strategy, channel selection, financial projections"
+    },
+    {
+        "agent_type": "Synthesis Agent",
+        "query": "Provide executive summary of regional performance and growth opportunities",
+        "response": "Executive Summary: EMEA leads with 23% profit margin and €2.4M upsell potential. APAC shows growth opportunity with 8% conversion improvement needed. Americas operating optimally at 98% efficiency. Strategic focus: 1) EMEA upsell execution, 2) APAC conversion optimization, 3) Americas efficiency replication. Total growth potential: €4.2M annually.",
+        "expected_focus": "Executive insights, strategic recommendations, business impact"
+    }
+])
+
+
 def create_test_scenarios():
     """Create test scenarios with sample agent responses."""
     
-    test_scenarios = [
-        {
-            "agent_type": "Financial Impact Agent",
-            "query": "What is the most profitable region and why?",
-            "response": "Based on the financial data analysis, EMEA is the most profitable region with a 23% profit margin. This is driven by strong revenue growth of 18% year-over-year and effective cost optimization initiatives. The region has shown consistent performance improvement over the last three quarters.",
-            "expected_focus": "Financial accuracy, data-driven insights, regional analysis"
-        },
-        {
-            "agent_type": "Upsell Discovery Agent", 
-            "query": "Identify upsell opportunities in the EMEA region",
-            "response": "EMEA region shows significant upsell potential with 45% of customers having only basic product packages. Top opportunities include: 1) Premium monitoring services for 23 customers, 2) Advanced analytics modules for 18 customers, 3) Extended warranty for 31 customers. Estimated total value: €2.4M annually.",
-            "expected_focus": "Opportunity identification, customer targeting, value quantification"
-        },
-        {
-            "agent_type": "Operations Summary Agent",
-            "query": "Provide operational status and identify critical issues",
-            "response": "Current operational status: 94% asset utilization across all regions. Critical issues identified: 1) EMEA region experiencing 15% higher maintenance costs due to aging infrastructure, 2) APAC region showing 8% decrease in lead conversion rates, 3) Americas region operating at optimal efficiency with 98% utilization.",
-            "expected_focus": "Operational metrics, issue identification, regional breakdown"
-        },
-        {
-            "agent_type": "Campaign Planner Agent",
-            "query": "Create marketing campaign for new energy monitoring products",
-            "response": "Marketing Campaign: 'Smart Energy Future' - Target: EMEA commercial customers. Channels: LinkedIn advertising (40% budget), industry conferences (30% budget), email marketing (20% budget), partner referrals (10% budget). Timeline: Q4 2025 launch. Expected ROI: 3.2x with €1.8M projected revenue.",
-            "expected_focus": "Marketing strategy, channel selection, financial projections"
-        },
-        {
-            "agent_type": "Synthesis Agent",
-            "query": "Provide executive summary of regional performance and growth opportunities",
-            "response": "Executive Summary: EMEA leads with 23% profit margin and €2.4M upsell potential. APAC shows growth opportunity with 8% conversion improvement needed. Americas operating optimally at 98% efficiency. Strategic focus: 1) EMEA upsell execution, 2) APAC conversion optimization, 3) Americas efficiency replication. Total growth potential: €4.2M annually.",
-            "expected_focus": "Executive insights, strategic recommendations, business impact"
-        }
-    ]
-    
-    return test_scenarios
+    return _SCENARIOS
 
 
-def test_individual_evaluation(evaluator: GPT5EvaluatorAgent, scenario: dict):
+async def test_individual_evaluation(evaluator: GPT5EvaluatorAgent, scenario: dict, semaphore: asyncio.Semaphore):
     """Test individual agent response evaluation."""
     
-    print(f"\n{'='*60}")
-    print(f"🧪 Testing: {scenario['agent_type']}")
-    print(f"{'='*60}")
-    print(f"Query: {scenario['query']}")
-    print(f"Response: {scenario['response']}")
-    print(f"Expected Focus: {scenario['expected_focus']}")
-    
     try:
         # Evaluate the response
-        start_time = datetime.now()
-        result = evaluator.evaluate_response(
-            scenario['agent_type'],
-            scenario['query'], 
-            scenario['response']
-        )
-        evaluation_time = (datetime.now() - start_time).total_seconds()
+        async with semaphore:
+            start_time = time.perf_counter()
+            result = await evaluator.aevaluate_response(
+                scenario['agent_type'],
+                scenario['query'], 
+                scenario['response']
+            )
+            evaluation_time = time.perf_counter() - start_time
+        
+        # Display the scenario and its results together, since evaluations finish out of order,
+        # buffered so the whole block goes out in a single write
+        out = io.StringIO()
+        print(f"\n{'='*60}", file=out)
+        print(f"🧪 Testing: {scenario['agent_type']}", file=out)
+        print(f"{'='*60}", file=out)
+        print(f"Query: {scenario['query']}", file=out)
+        print(f"Response: {scenario['response']}", file=out)
+        print(f"Expected Focus: {scenario['expected_focus']}", file=out)
         
-        # Display results
-        print(f"\n📊 Evaluation Results (Completed in {evaluation_time:.1f}s):")
-        print(f"Total Score: {result.total_score}/10")
-        print(f"Factuality: {result.factuality_rating}/4 ({result.factuality_points:.1f} pts)")
-        print(f"Data Source Validation: {result.data_source_validation_rating}/4 ({result.data_source_validation_points:.1f} pts)")
-        print(f"Instruction Following: {result.instruction_following_rating}/4 ({result.instruction_following_points:.1f} pts)")
-        print(f"Conciseness: {result.conciseness_rating}/4 ({result.conciseness_points:.1f} pts)")
-        print(f"Completeness: {result.completeness_rating}/4 ({result.completeness_points:.1f} pts)")
+        print(f"\n📊 Evaluation Results (Completed in {evaluation_time:.1f}s):", file=out)
+        print(f"Total Score: {result.total_score}/10", file=out)
+        print(f"Factuality: {result.factuality_rating}/4 ({result.factuality_points:.1f} pts)", file=out)
+        print(f"Data Source Validation: {result.data_source_validation_rating}/4 ({result.data_source_validation_points:.1f} pts)", file=out)
+        print(f"Instruction Following: {result.instruction_following_rating}/4 ({result.instruction_following_points:.1f} pts)", file=out)
+        print(f"Conciseness: {result.conciseness_rating}/4 ({result.conciseness_points:.1f} pts)", file=out)
+        print(f"Completeness: {result.completeness_rating}/4 ({result.completeness_points:.1f} pts)", file=out)
         
-        print(f"\n💬 Overall Assessment:")
-        print(f"{result.overall_assessment}")
+        print(f"\n💬 Overall Assessment:", file=out)
+        print(f"{result.overall_assessment}", file=out)
         
-        print(f"\n🔧 Improvement Recommendations:")
+        print(f"\n🔧 Improvement Recommendations:", file=out)
         for i, rec in enumerate(result.improvement_recommendations, 1):
-            print(f"{i}. {rec}")
+            print(f"{i}. {rec}", file=out)
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
         
         return result
         
     except Exception as e:
-        print(f"❌ Evaluation failed: {str(e)}")
+        print(f"❌ Evaluation failed for {scenario['agent_type']}: {str(e)}")
         logger.error(f"Evaluation failed for {scenario['agent_type']}: {str(e)}")
         return None
 
 
-def test_batch_evaluation(evaluator: GPT5EvaluatorAgent, scenarios: list):
+async def run_individual_evaluations(evaluator: GPT5EvaluatorAgent, scenarios: list):
+    """Evaluate every scenario concurrently, returning the successful results in scenario order."""
+    
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    results = await asyncio.gather(
+        *[test_individual_evaluation(evaluator, scenario, semaphore) for scenario in scenarios],
+        return_exceptions=True
+    )
+    return [r for r in results if isinstance(r, EvaluationResult)]
+
+
+def test_batch_evaluation(evaluator: GPT5EvaluatorAgent, scenarios: list, use_batch_api: bool = False):
     """Test batch evaluation of multiple agent responses."""
     
     print(f"\n{'='*60}")
     print(f"🚀 Starting Batch Evaluation of {len(scenarios)} Responses")
+    if use_batch_api:
+        print("📦 Using the offline Batch API (results may take a while)")
     print(f"{'='*60}")
     
     # Prepare batch evaluation data
@@ -122,9 +166,12 @@ def test_batch_evaluation(evaluator: GPT5EvaluatorAgent, scenarios: list):
     
     try:
         # Execute batch evaluation
-        start_time = datetime.now()
-        results = evaluator.batch_evaluate(batch_data)
-        total_time = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+        if use_batch_api:
+            results = evaluator.batch_evaluate_via_batch_api(batch_data)
+        else:
+            results = evaluator.batch_evaluate(batch_data)
+        total_time = time.perf_counter() - start_time
         
         print(f"✅ Batch evaluation completed in {total_time:.1f}s")
         print(f"Results: {len(results)}/{len(scenarios)} successful")
@@ -144,35 +191,44 @@ def generate_test_report(results: list, scenarios: list):
         print("❌ No results to report")
         return
     
-    print(f"\n{'='*60}")
-    print(f"📋 Test Report Summary")
-    print(f"{'='*60}")
+    # Summary lines are buffered and written in one go
+    out = io.StringIO()
+    print(f"\n{'='*60}", file=out)
+    print(f"📋 Test Report Summary", file=out)
+    print(f"{'='*60}", file=out)
+    
+    # Calculate statistics in single array reductions, so large stored batches stay cheap
+    total_scores = np.fromiter((r.total_score for r in results), dtype=np.int64, count=len(results))
+    median_score, p90_score = np.percentile(total_scores, [50, 90])
+    ratings = np.array([[getattr(r, field) for _, field in RATING_FIELDS] for r in results], dtype=np.float32)
+    mean_ratings = ratings.mean(axis=0)
     
-    # Calculate statistics
-    total_scores = [r.total_score for r in results]
-    avg_score = sum(total_scores) / len(total_scores)
-    min_score = min(total_scores)
-    max_score = max(total_scores)
+    print(f"📊 Performance Statistics:", file=out)
+    print(f"- Total Evaluations: {len(results)}", file=out)
+    print(f"- Average Score: {total_scores.mean():.1f}/10", file=out)
+    print(f"- Score Range: {total_scores.min()}/10 - {total_scores.max()}/10", file=out)
+    print(f"- Median / P90 Score: {median_score:.1f}/10 / {p90_score:.1f}/10", file=out)
+    print(f"- Success Rate: {len(results)}/{len(scenarios)} ({len(results)/len(scenarios)*100:.1f}%)", file=out)
     
-    print(f"📊 Performance Statistics:")
-    print(f"- Total Evaluations: {len(results)}")
-    print(f"- Average Score: {avg_score:.1f}/10")
-    print(f"- Score Range: {min_score}/10 - {max_score}/10")
-    print(f"- Success Rate: {len(results)}/{len(scenarios)} ({len(results)/len(scenarios)*100:.1f}%)")
+    print(f"\n📐 Average Rating by Criterion:", file=out)
+    for (label, _), mean_rating in zip(RATING_FIELDS, mean_ratings):
+        print(f"- {label}: {mean_rating:.1f}/4", file=out)
     
     # Agent performance breakdown
-    print(f"\n🤖 Agent Performance Breakdown:")
+    print(f"\n🤖 Agent Performance Breakdown:", file=out)
     for result in results:
-        print(f"- {result.agent_type}: {result.total_score}/10")
+        print(f"- {result.agent_type}: {result.total_score}/10", file=out)
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
     
     # Save detailed report
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = file_timestamp()
     report_filename = f"test_reports/gpt5_evaluator_test_report_{timestamp}.json"
     
     try:
         os.makedirs("test_reports", exist_ok=True)
-        with open(report_filename, 'w') as f:
-            json.dump([r.to_dict() for r in results], f, indent=2)
+        with open(report_filename, 'wb') as f:
+            f.write(orjson.dumps([r.to_dict() for r in results], option=orjson.OPT_INDENT_2))
         print(f"\n💾 Detailed report saved to: {report_filename}")
     except Exception as e:
         print(f"❌ Failed to save report: {str(e)}")
@@ -218,6 +274,15 @@ def test_error_handling(evaluator: GPT5EvaluatorAgent):
 def main():
     """Main test function."""
     
+    parser = argparse.ArgumentParser(description="GPT5 Evaluator Agent test suite")
+    parser.add_argument("--batch-api", action="store_true",
+                        help="run the batch test through the OpenAI Batch API instead of real-time calls")
+    args = parser.parse_args()
+    
+    # Every asyncio.run below, including the one inside batch_evaluate, then runs on uvloop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     print("🚀 GPT5 Evaluator Agent - Comprehensive Test Suite")
     print("=" * 60)
     
@@ -232,7 +297,7 @@ def main():
     try:
         # Initialize evaluator
         print("🔧 Initializing GPT5 Evaluator Agent...")
-        evaluator = GPT5EvaluatorAgent(api_key)
+        evaluator = CachedEvaluator(api_key)
         print("✅ GPT5 Evaluator Agent initialized successfully")
         
         # Create test scenarios
@@ -241,15 +306,11 @@ def main():
         
         # Test individual evaluations
         print(f"\n🧪 Testing Individual Evaluations...")
-        individual_results = []
-        for scenario in scenarios:
-            result = test_individual_evaluation(evaluator, scenario)
-            if result:
-                individual_results.append(result)
+        individual_results = asyncio.run(run_individual_evaluations(evaluator, scenarios))
         
         # Test batch evaluation
         print(f"\n🚀 Testing Batch Evaluation...")
-        batch_results = test_batch_evaluation(evaluator, scenarios)
+        batch_results = test_batch_evaluation(evaluator, scenarios, use_batch_api=args.batch_api)
         
         # Generate test report
         if individual_results:
@@ -261,6 +322,7 @@ def main():
         print(f"\n🎉 All tests completed successfully!")
         print(f"Individual evaluations: {len(individual_results)}/{len(scenarios)}")
         print(f"Batch evaluations: {len(batch_results)}/{len(scenarios)}")
+        print(f"Evaluation cache: {evaluator.cache_hits} hits, {evaluator.cache_misses} misses ({evaluator.cache_hit_rate:.0%} hit rate)")
         
     except Exception as e:
         print(f"❌ Test suite failed: {str(e)}")
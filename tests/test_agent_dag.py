@@ -0,0 +1,66 @@
+"""Agent dependency graph applied to AI-generated orchestration specs"""
+
+import asyncio
+
+import pytest
+
+from o3_orchestrator import O3Orchestrator
+
+
+class FakeAIService:
+    """AI service returning a fixed workflow instead of calling the API"""
+
+    def __init__(self, agents, execution_order):
+        self.agents = agents
+        self.execution_order = execution_order
+
+    async def analyze_query(self, user_query, rows=None):
+        return {"analysis": {"query_type": "financial"}}
+
+    async def generate_orchestration_spec(self, user_query, analysis_result):
+        return {
+            "orchestration_id": "0" * 32,
+            "user_query": user_query,
+            "ai_generated": True,
+            "workflow": {"agents": self.agents, "execution_order": list(self.execution_order)},
+        }
+
+    async def validate_orchestration(self, spec):
+        return {"is_valid": True}
+
+
+@pytest.fixture
+def generate(tmp_path, monkeypatch):
+    """Run generate_orchestration_spec against a fake AI workflow"""
+    monkeypatch.chdir(tmp_path)
+
+    def run(agents, execution_order):
+        orchestrator = O3Orchestrator(fast_mcp_client=None)
+        orchestrator.__dict__["ai_service"] = FakeAIService(agents, execution_order)
+        return asyncio.run(orchestrator.generate_orchestration_spec("Review Q2 results and plan campaigns"))
+
+    return run
+
+
+def test_string_dependency_is_one_agent(generate):
+    agents = [{"agent_id": "financial_impact_agent"},
+              {"agent_id": "campaign_planner_agent", "dependencies": "financial_impact_agent"}]
+    spec = generate(agents, ["financial_impact_agent", "campaign_planner_agent"])
+
+    assert spec["workflow"]["execution_batches"] == [["financial_impact_agent"], ["campaign_planner_agent"]]
+
+
+def test_valid_ai_order_is_kept(generate):
+    agents = [{"agent_id": "operations_summary_agent"}, {"agent_id": "financial_impact_agent"}]
+    spec = generate(agents, ["financial_impact_agent", "operations_summary_agent"])
+
+    assert spec["workflow"]["execution_order"] == ["financial_impact_agent", "operations_summary_agent"]
+
+
+def test_malformed_graph_keeps_the_ai_spec(generate):
+    agents = [{"agent_id": "a", "dependencies": ["b"]}, {"agent_id": "b", "dependencies": ["a"]}]
+    spec = generate(agents, ["b", "a"])
+
+    assert spec["ai_generated"] and "fallback_used" not in spec
+    assert spec["workflow"]["execution_order"] == ["b", "a"]
+    assert "execution_batches" not in spec["workflow"]
@@ -0,0 +1,93 @@
+"""Evaluation paths and result cache of the GPT5 evaluator agent"""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from gpt5_evaluator_agent import CachedEvaluator, GPT5EvaluatorAgent
+
+EVALUATION_TEXT = """| Criterion | Rating |
+| Factuality | 3 |
+| Data Source Validation | 4 |
+| Instruction Following | 3 |
+| Conciseness | 2 |
+| Completeness | 3 |
+"""
+
+
+@pytest.fixture
+def evaluator():
+    """Evaluator whose GPT-5 calls return a canned evaluation instead of hitting the API"""
+    evaluator = GPT5EvaluatorAgent(api_key="test-key")
+    evaluator.__dict__["system_prompt"] = "rubric"
+    evaluator._call_gpt5 = lambda prompt: EVALUATION_TEXT
+
+    async def acall(prompt):
+        return EVALUATION_TEXT
+
+    evaluator._acall_gpt5 = acall
+    return evaluator
+
+
+def test_sync_and_async_paths_score_alike(evaluator):
+    sync_result = evaluator.evaluate_response("financial_impact_agent", "Q2 ROI?", "ROI was 12%")
+    async_result = asyncio.run(evaluator.aevaluate_response("financial_impact_agent", "Q2 ROI?", "ROI was 12%"))
+
+    assert replace(async_result, timestamp=sync_result.timestamp) == sync_result
+
+
+def test_batch_evaluate_refuses_a_running_loop(evaluator):
+    async def call_from_loop():
+        return evaluator.batch_evaluate([("financial_impact_agent", "Q2 ROI?", "ROI was 12%", None)])
+
+    with pytest.raises(RuntimeError, match="abatch_evaluate"):
+        asyncio.run(call_from_loop())
+
+
+def test_batch_evaluate_runs_without_a_loop(evaluator):
+    results = evaluator.batch_evaluate([("financial_impact_agent", "Q2 ROI?", "ROI was 12%", None)])
+    assert len(results) == 1
+
+
+def test_cache_key_tracks_rubric_and_model(tmp_path):
+    def cache_path(model, rubric):
+        evaluator = CachedEvaluator(api_key="test-key", model=model, cache_dir=str(tmp_path))
+        evaluator.__dict__["system_prompt"] = rubric
+        return evaluator._cache_path("financial_impact_agent", "Q2 ROI?", "ROI was 12%", None)
+
+    baseline = cache_path("gpt-5", "rubric v1")
+    assert cache_path("gpt-5", "rubric v1") == baseline
+    assert cache_path("gpt-5", "rubric v2") != baseline
+    assert cache_path("gpt-5-mini", "rubric v1") != baseline
+
+
+def cached_evaluator(tmp_path, evaluation_text):
+    """CachedEvaluator under tmp_path whose GPT-5 calls return evaluation_text"""
+    evaluator = CachedEvaluator(api_key="test-key", cache_dir=str(tmp_path))
+    evaluator.__dict__["system_prompt"] = "rubric"
+    evaluator._call_gpt5 = lambda prompt: evaluation_text
+
+    async def acall(prompt):
+        return evaluation_text
+
+    evaluator._acall_gpt5 = acall
+    return evaluator
+
+
+def test_parsed_evaluation_is_cached(tmp_path):
+    evaluator = cached_evaluator(tmp_path, EVALUATION_TEXT)
+    evaluator.evaluate_response("financial_impact_agent", "Q2 ROI?", "ROI was 12%")
+    asyncio.run(evaluator.aevaluate_response("financial_impact_agent", "Q2 ROI?", "ROI was 12%"))
+
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    assert evaluator.cache_hits == 1
+
+
+@pytest.mark.parametrize("evaluation_text", ["", "| Factuality | 3 |\n"])
+def test_unparsed_evaluation_is_not_cached(tmp_path, evaluation_text):
+    evaluator = cached_evaluator(tmp_path, evaluation_text)
+    evaluator.evaluate_response("financial_impact_agent", "Q2 ROI?", "ROI was 12%")
+    asyncio.run(evaluator.aevaluate_response("financial_impact_agent", "Q2 ROI?", "ROI was 12%"))
+
+    assert list(tmp_path.glob("*")) == []
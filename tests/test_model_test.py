@@ -0,0 +1,67 @@
+"""Model availability failure cache of the model test script"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+import model_test
+
+
+def api_error(error_type, status_code):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return error_type("probe failed", response=httpx.Response(status_code, request=request), body=None)
+
+
+@pytest.fixture
+def probe(tmp_path, monkeypatch):
+    """Run test_models against models that fail with the given errors"""
+    monkeypatch.setattr(model_test, "FAILURE_CACHE_PATH", tmp_path / "model_availability.json")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    probed = []
+
+    def run(errors):
+        async def probe_models(models):
+            probed.append(list(models))
+            return [(model, False, str(errors[model]), isinstance(errors[model], model_test.PERMANENT_ERRORS))
+                    for model in models]
+
+        monkeypatch.setattr(model_test, "probe_models", probe_models)
+        model_test.test_models()
+        return model_test.load_failure_cache()
+
+    run.probed = probed
+    return run
+
+
+def test_only_permanent_failures_are_cached(probe):
+    errors = {
+        "gpt-4o": api_error(openai.NotFoundError, 404),
+        "gpt-4o-mini": api_error(openai.PermissionDeniedError, 403),
+        "gpt-5": api_error(openai.RateLimitError, 429),
+        "gpt-5-mini": openai.APITimeoutError(request=httpx.Request("POST", "https://api.openai.com")),
+        "gpt-5-nano": api_error(openai.InternalServerError, 500),
+    }
+    cache = probe(errors)
+
+    assert set(cache) == {"gpt-4o", "gpt-4o-mini"}
+
+    probe(errors)
+    assert probe.probed[-1] == ["gpt-5", "gpt-5-mini", "gpt-5-nano"]
+
+
+@pytest.mark.parametrize("error, permanent", [
+    (api_error(openai.NotFoundError, 404), True),
+    (api_error(openai.RateLimitError, 429), False),
+])
+def test_probe_model_classifies_errors(error, permanent):
+    async def create(**params):
+        raise error
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    model, ok, detail, is_permanent = asyncio.run(model_test.probe_model(client, "gpt-5"))
+
+    assert not ok and is_permanent is permanent
+    assert detail.startswith(type(error).__name__)
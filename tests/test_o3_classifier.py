@@ -0,0 +1,60 @@
+"""Keyword classification and the opt-in template fast path of the o3 orchestrator"""
+
+import asyncio
+
+import pytest
+
+import o3_orchestrator
+from o3_orchestrator import O3Orchestrator
+
+
+@pytest.mark.parametrize("query, categories", [
+    ("Show the ROI by property", {"financial"}),
+    ("Detroit portfolio overview", set()),
+    ("Weekly reporting cadence", set()),
+    ("Plan new marketing campaigns", {"campaign"}),
+    ("Analyze balance sheet performance", {"financial", "operations"}),
+])
+def test_keywords_match_whole_words(query, categories):
+    assert O3Orchestrator._fast_classify(query) == frozenset(categories)
+
+
+def route(monkeypatch, tmp_path, query, enabled):
+    """Which path generate_orchestration_spec takes for a query, without calling any service"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(o3_orchestrator, "FAST_PATH_ENABLED", enabled)
+    orchestrator = O3Orchestrator(fast_mcp_client=None)
+
+    async def fast_path(user_query, categories):
+        return {"path": "fast", "categories": categories}
+
+    async def basic(user_query):
+        return {"path": "ai"}
+
+    orchestrator._generate_fast_path_orchestration = fast_path
+    orchestrator._generate_basic_orchestration = basic
+    orchestrator.ai_service = None  # any AI step raises and lands in the basic fallback
+    return asyncio.run(orchestrator.generate_orchestration_spec(query))["path"]
+
+
+def test_fast_path_is_off_by_default(monkeypatch, tmp_path):
+    assert route(monkeypatch, tmp_path, "Show the ROI by property", enabled=False) == "ai"
+
+
+def test_fast_path_serves_single_intent_queries_when_enabled(monkeypatch, tmp_path):
+    assert route(monkeypatch, tmp_path, "Show the ROI by property", enabled=True) == "fast"
+
+
+def test_mixed_intent_queries_skip_the_fast_path(monkeypatch, tmp_path):
+    assert route(monkeypatch, tmp_path, "Analyze balance sheet performance", enabled=True) == "ai"
+
+
+@pytest.mark.parametrize("query, agent_ids", [
+    ("Profitability reporting", {"operations_summary_agent", "financial_impact_agent"}),
+    ("Detroit portfolio overview", {"financial_impact_agent"}),
+    ("Balance sheet overview", {"operations_summary_agent"}),
+])
+def test_basic_fallback_keeps_substring_matching(monkeypatch, tmp_path, query, agent_ids):
+    monkeypatch.chdir(tmp_path)
+    spec = asyncio.run(O3Orchestrator(fast_mcp_client=None)._generate_basic_orchestration(query))
+    assert {agent["agent_id"] for agent in spec["workflow"]["agents"]} == agent_ids
@@ -0,0 +1,36 @@
+"""Orchestration log backfill and write-behind appends of the o3 orchestrator"""
+
+import asyncio
+
+import pytest
+
+from o3_orchestrator import O3Orchestrator
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return O3Orchestrator(fast_mcp_client=None)
+
+
+def spec(index, **flags):
+    return {"orchestration_id": f"{index:032d}", "workflow": {"agents": []}, **flags}
+
+
+def test_concurrent_first_saves_all_reach_the_log(orchestrator):
+    async def save_all():
+        await asyncio.gather(*(orchestrator.save_orchestration_spec(spec(i)) for i in range(20)))
+        return await orchestrator.list_orchestrations()
+
+    listed = asyncio.run(save_all())
+    assert sorted(entry["orchestration_id"] for entry in listed) == [f"{i:032d}" for i in range(20)]
+
+
+def test_status_includes_entries_still_queued(orchestrator):
+    async def save_then_status():
+        await orchestrator.save_orchestration_spec(spec(0, ai_generated=True))
+        await orchestrator.save_orchestration_spec(spec(1, fallback_used=True))
+        return await orchestrator.get_orchestrator_status()
+
+    status = asyncio.run(save_then_status())
+    assert (status["total_orchestrations"], status["ai_generated"], status["fallback_used"]) == (2, 1, 1)
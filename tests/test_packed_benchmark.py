@@ -0,0 +1,51 @@
+"""Packed benchmark answers and the per-query fallback in main_integration_v2"""
+
+import asyncio
+import importlib
+
+import orjson
+import pytest
+
+
+@pytest.fixture
+def integration(tmp_path, monkeypatch):
+    """main_integration_v2, imported from a scratch directory so its log file lands under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    return importlib.import_module("main_integration_v2")
+
+
+def packed_result(document):
+    return {"workflow_result": {"final_output": orjson.dumps(document).decode()}}
+
+
+def test_answers_key_is_split_per_question(integration):
+    result = packed_result({"answers": ["first", "second"], "notes": [1, 2]})
+    assert integration._split_packed_answers(result, 2) == ["first", "second"]
+
+
+@pytest.mark.parametrize("document", [
+    {"metrics": ["a", "b"]},
+    {"answers": ["only one"]},
+    {"answers": ["first", {"nested": "dict"}]},
+    {"answers": ["first", "  "]},
+    ["first", "second"],
+])
+def test_anything_but_a_matching_answers_key_is_rejected(integration, document):
+    assert integration._split_packed_answers(packed_result(document), 2) == []
+
+
+def test_unusable_packed_output_falls_back_to_per_query_runs(integration):
+    system = integration.EnergyPropertyAISystemV2.__new__(integration.EnergyPropertyAISystemV2)
+    calls = []
+
+    async def process_user_query(query):
+        calls.append(query)
+        return packed_result({"portfolio": ["x", "y"]}) if len(calls) == 1 else {"answer": query}
+
+    system.process_user_query = process_user_query
+    results = asyncio.run(system._run_packed_benchmark(["q1", "q2"]))
+
+    assert calls[1:] == ["q1", "q2"]
+    assert [entry["query"] for entry in results] == ["q1", "q2"]
+    assert all("packed" not in entry for entry in results)
@@ -0,0 +1,92 @@
+"""Parquet row cache behind the performance dashboard"""
+
+import orjson
+import pandas as pd
+import pytest
+
+import performance_dashboard as dashboard
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    """Empty test_results directory with the parsed-row cache redirected under tmp_path"""
+    monkeypatch.setattr(dashboard, "PARSED_CACHE_PATH", tmp_path / "cache.parquet")
+    directory = tmp_path / "test_results"
+    directory.mkdir()
+    return directory
+
+
+def write_result(directory, index):
+    (directory / f"result_20250813_{index:06d}.json").write_bytes(
+        orjson.dumps({"execution_time": f"{index} seconds", "results": {}})
+    )
+
+
+def load(directory, dir_sig, full_scan=True):
+    frame, errors = dashboard._load_rows(
+        'execution', directory, dir_sig, dashboard._execution_rows,
+        ['execution_time', 'orchestration_id', 'has_results'], full_scan
+    )
+    assert errors == []
+    return frame
+
+
+def cached_sources(kind='execution'):
+    cached = pd.read_parquet(dashboard.PARSED_CACHE_PATH)
+    return set(cached.loc[cached['kind'] == kind, 'source'])
+
+
+def test_incremental_refresh_keeps_cached_rows(results_dir):
+    for index in range(12):
+        write_result(results_dir, index)
+    full_sig = dashboard._dir_signature(results_dir)
+    assert len(load(results_dir, full_sig)) == 12
+
+    write_result(results_dir, 12)
+    delta = tuple(entry for entry in dashboard._dir_signature(results_dir) if entry not in full_sig)
+    assert len(load(results_dir, delta, full_scan=False)) == 1
+
+    assert len(cached_sources()) == 13
+    assert len(load(results_dir, dashboard._dir_signature(results_dir))) == 13
+
+
+def test_full_scan_prunes_deleted_files(results_dir):
+    for index in range(3):
+        write_result(results_dir, index)
+    load(results_dir, dashboard._dir_signature(results_dir))
+
+    (results_dir / "result_20250813_000000.json").unlink()
+    assert len(load(results_dir, dashboard._dir_signature(results_dir))) == 2
+    assert len(cached_sources()) == 2
+
+
+class SessionState(dict):
+    """Attribute-access dict standing in for st.session_state outside a running app"""
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+def test_ring_buffer_keeps_only_timestamped_executions(results_dir, monkeypatch):
+    monkeypatch.setattr(dashboard.st, "session_state", SessionState())
+    monkeypatch.setattr(dashboard, "MAX_BUFFERED_EXECUTIONS", 2)
+    for index in range(3):
+        write_result(results_dir, index)
+    (results_dir / "result_manual.json").write_bytes(orjson.dumps({"execution_time": "9 seconds", "results": {}}))
+
+    panel = dashboard.PerformanceDashboard()
+    panel.test_results_dir = results_dir
+    executions, errors = panel.load_recent_executions()
+
+    assert errors == []
+    assert list(executions['source']) == ["result_20250813_000001.json", "result_20250813_000002.json"]
+    assert dashboard.st.session_state.execution_aggregates['avg_time'] == 1.5
+
+
+def test_cache_is_replaced_without_leftover_temp_files(results_dir):
+    write_result(results_dir, 0)
+    load(results_dir, dashboard._dir_signature(results_dir))
+    write_result(results_dir, 1)
+    load(results_dir, dashboard._dir_signature(results_dir))
+
+    assert sorted(path.name for path in dashboard.PARSED_CACHE_PATH.parent.glob("cache.parquet*")) == ["cache.parquet"]
+    assert len(cached_sources()) == 2
@@ -0,0 +1,51 @@
+"""Background task lifecycle and cache keys of the performance optimizer"""
+
+import asyncio
+
+from performance_optimizer import PerformanceOptimizer
+
+
+def test_start_is_idempotent_within_a_loop():
+    optimizer = PerformanceOptimizer()
+
+    async def start_twice():
+        await optimizer.start()
+        first = list(optimizer._bg_tasks)
+        await optimizer.start()
+        assert optimizer._bg_tasks == first
+        await optimizer.close()
+        assert all(task.done() for task in first)
+
+    asyncio.run(start_twice())
+
+
+def test_start_restarts_tasks_left_over_from_a_finished_loop():
+    optimizer = PerformanceOptimizer()
+
+    async def start():
+        await optimizer.start()
+        return asyncio.get_running_loop()
+
+    first_loop = asyncio.run(start())
+
+    async def restart():
+        await optimizer.start()
+        loops = {task.get_loop() for task in optimizer._bg_tasks}
+        running = not any(task.done() for task in optimizer._bg_tasks)
+        await optimizer.close()
+        return loops, running
+
+    loops, running = asyncio.run(restart())
+    assert first_loop not in loops and len(loops) == 1
+    assert running
+
+
+def test_inputs_that_cannot_form_a_tuple_key_still_cache():
+    optimizer = PerformanceOptimizer()
+    output = {"summary": "Q2 revenue up 4%"}
+
+    for inputs in ({1: "region", "quarter": "Q2"}, {"filters": {"region": "EMEA"}, "agents": ["a", "b"]}):
+        optimizer.cache_agent_output("financial_impact_agent", output, inputs=dict(inputs))
+        assert optimizer.get_cached_output("financial_impact_agent", inputs=dict(inputs)) == output
+
+    assert optimizer.get_cached_output("financial_impact_agent", inputs={"filters": {"region": "APAC"}}) is None
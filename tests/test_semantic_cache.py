@@ -0,0 +1,46 @@
+"""Embedding reuse in the semantic query cache"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+import semantic_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Empty cache under tmp_path whose embedding calls are counted instead of sent"""
+    monkeypatch.setattr(semantic_cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(semantic_cache, "EMBEDDINGS_FILE", tmp_path / "embeddings.npy")
+    monkeypatch.setattr(semantic_cache, "ENTRIES_FILE", tmp_path / "entries.json")
+    cache = semantic_cache.SemanticCache()
+    cache.embed_calls = []
+
+    async def embed(text):
+        cache.embed_calls.append(text)
+        return np.array([1.0, 0.0], dtype=np.float32)
+
+    cache.embed = embed
+    return cache
+
+
+def test_store_reuses_the_lookup_embedding(cache):
+    async def miss_then_store(query):
+        embedding = await cache.embed(query)
+        assert await cache.lookup(query, embedding) is None
+        await cache.store(query, {"answer": query}, embedding)
+
+    asyncio.run(miss_then_store("Which region has the highest gross margin?"))
+
+    assert cache.embed_calls == ["Which region has the highest gross margin?"]
+    assert len(cache.entries) == 1 and cache.embeddings.shape == (1, 2)
+    assert semantic_cache.ENTRIES_FILE.exists()
+
+
+def test_lookup_hits_a_similar_query(cache):
+    async def store_then_lookup():
+        await cache.store("Which region has the highest gross margin?", {"region": "EMEA"})
+        return await cache.lookup("Which region has the best gross margin?")
+
+    assert asyncio.run(store_then_lookup()) == {"region": "EMEA"}
@@ -0,0 +1,31 @@
+"""Which smoke-test requests the response cache may replay"""
+
+import pytest
+
+import smoke_cache
+
+REQUEST = {"model": "gpt-5", "messages": [{"role": "user", "content": "Say hi"}], "max_completion_tokens": 10}
+
+
+@pytest.fixture(autouse=True)
+def default_cache_setting(monkeypatch):
+    monkeypatch.delenv("SMOKE_TEST_CACHE", raising=False)
+
+
+def test_explicit_zero_temperature_is_cached():
+    assert smoke_cache.cache_key({**REQUEST, "temperature": 0}) is not None
+
+
+def test_missing_temperature_is_not_cached_by_default():
+    assert smoke_cache.cache_key(REQUEST) is None
+
+
+def test_missing_temperature_is_cached_after_opt_in(monkeypatch):
+    monkeypatch.setenv("SMOKE_TEST_CACHE", "1")
+    assert smoke_cache.cache_key(REQUEST) is not None
+
+
+@pytest.mark.parametrize("extra", [{"temperature": 0.7}, {"temperature": 0, "stream": True}])
+def test_sampled_and_streamed_requests_are_never_cached(monkeypatch, extra):
+    monkeypatch.setenv("SMOKE_TEST_CACHE", "1")
+    assert smoke_cache.cache_key({**REQUEST, **extra}) is None
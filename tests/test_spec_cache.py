@@ -0,0 +1,50 @@
+"""On-disk orchestration spec cache of the o3 orchestrator"""
+
+import asyncio
+
+import pytest
+
+from o3_orchestrator import O3Orchestrator, SPEC_CACHE_DIRNAME
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    """Orchestrator writing under tmp_path whose spec generation is counted instead of run"""
+    monkeypatch.chdir(tmp_path)
+    orchestrator = O3Orchestrator(fast_mcp_client=None)
+    orchestrator.generated = []
+
+    async def generate(user_query, skeleton=None):
+        orchestrator.generated.append(user_query)
+        return dict(orchestrator.next_spec)
+
+    orchestrator.generate_orchestration_spec = generate
+    return orchestrator
+
+
+def spec(**flags):
+    return {"orchestration_id": "0" * 32, "workflow": {"agents": []}, **flags}
+
+
+def cached_files(orchestrator):
+    return sorted(path.name for path in (orchestrator.orchestrations_dir / SPEC_CACHE_DIRNAME).glob("*"))
+
+
+def test_ai_spec_is_cached_and_reused(orchestrator):
+    orchestrator.next_spec = spec(ai_generated=True)
+    first = asyncio.run(orchestrator.generate_cached_orchestration_spec("Q2 performance"))
+    second = asyncio.run(orchestrator.generate_cached_orchestration_spec("Q2 performance"))
+
+    assert first == second
+    assert orchestrator.generated == ["Q2 performance"]
+    files = cached_files(orchestrator)
+    assert len(files) == 1 and files[0].endswith(".json")
+
+
+def test_fallback_spec_is_not_cached(orchestrator):
+    orchestrator.next_spec = spec(fallback_used=True)
+    asyncio.run(orchestrator.generate_cached_orchestration_spec("Q2 performance"))
+    asyncio.run(orchestrator.generate_cached_orchestration_spec("Q2 performance"))
+
+    assert orchestrator.generated == ["Q2 performance", "Q2 performance"]
+    assert not (orchestrator.orchestrations_dir / SPEC_CACHE_DIRNAME).exists()
@@ -0,0 +1,50 @@
+"""Memoized AI validation results of the o3 orchestrator"""
+
+import asyncio
+
+import pytest
+
+from o3_orchestrator import O3Orchestrator
+
+SPEC = {"orchestration_id": "0" * 32, "workflow": {"agents": []}}
+
+
+class FakeAIService:
+    """Returns queued validation results and counts the calls"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def validate_orchestration(self, spec):
+        self.calls += 1
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return O3Orchestrator(fast_mcp_client=None)
+
+
+def test_valid_result_is_reused(orchestrator):
+    orchestrator.ai_service = FakeAIService({"is_valid": True, "confidence_score": 0.9})
+    asyncio.run(orchestrator.validate_orchestration_spec(dict(SPEC)))
+    asyncio.run(orchestrator.validate_orchestration_spec(dict(SPEC)))
+    assert orchestrator.ai_service.calls == 1
+
+
+def test_fallback_result_is_not_cached(orchestrator):
+    fallback = {"is_valid": True, "confidence_score": 0.5, "fallback_used": True}
+    real = {"is_valid": False, "issues": ["missing synthesis"]}
+    orchestrator.ai_service = FakeAIService(fallback, real)
+    asyncio.run(orchestrator.validate_orchestration_spec(dict(SPEC)))
+    assert asyncio.run(orchestrator.validate_orchestration_spec(dict(SPEC))) == real
+
+
+def test_unencodable_spec_is_validated_without_caching(orchestrator):
+    orchestrator.ai_service = FakeAIService({"is_valid": True}, {"is_valid": True})
+    spec = {**SPEC, "extra": object()}
+    assert asyncio.run(orchestrator.validate_orchestration_spec(spec)) == {"is_valid": True}
+    asyncio.run(orchestrator.validate_orchestration_spec(spec))
+    assert orchestrator.ai_service.calls == 2
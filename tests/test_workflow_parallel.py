@@ -0,0 +1,71 @@
+"""WORKFLOW_PARALLEL execution of the LangGraph workflow engine"""
+
+import asyncio
+
+import pytest
+
+from langgraph_workflow import WorkflowEngine
+
+SPEC = {
+    "orchestration_id": "parallel-test",
+    "user_query": "Q2 review",
+    "workflow": {
+        "agents": [
+            {"agent_id": "operations_summary_agent", "directives": [], "data_sources": []},
+            {"agent_id": "financial_impact_agent", "directives": [], "data_sources": []},
+            {"agent_id": "campaign_planner_agent", "directives": [], "data_sources": [],
+             "dependencies": ["operations_summary_agent", "financial_impact_agent"]},
+        ]
+    }
+}
+
+
+class FakeAgentFactory:
+    """Agents that record when they run instead of calling Claude"""
+
+    def __init__(self):
+        self.running = set()
+        self.events = []
+
+    def create_agent(self, agent_id, fast_mcp_client):
+        factory = self
+
+        class Agent:
+            async def execute(self, **kwargs):
+                factory.events.append(("start", agent_id, frozenset(factory.running)))
+                factory.running.add(agent_id)
+                await asyncio.sleep(0.01)
+                factory.running.discard(agent_id)
+                if agent_id == "synthesis_agent":
+                    return {"status": "success", "combined": sorted(kwargs["agent_results"])}
+                return {"status": "success"}
+
+        return Agent()
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setenv("WORKFLOW_PARALLEL", "1")
+    engine = WorkflowEngine(fast_mcp_client=None)
+    engine.workflow.agent_factory = FakeAgentFactory()
+    return engine
+
+
+def test_parallel_mode_runs_independent_agents_together(engine):
+    final_output = asyncio.run(engine.execute_orchestration("parallel-test.json", SPEC))
+
+    assert engine.parallel
+    assert final_output["combined"] == ["campaign_planner_agent", "financial_impact_agent", "operations_summary_agent"]
+    starts = {agent_id: running for kind, agent_id, running in engine.workflow.agent_factory.events}
+    # The two independent agents overlap; the dependent one starts after both finished
+    assert starts["financial_impact_agent"] or starts["operations_summary_agent"]
+    assert starts["campaign_planner_agent"] == frozenset()
+
+
+def test_parallel_stream_yields_agents_then_synthesis(engine):
+    async def collect():
+        return [agent_id async for agent_id, _ in engine.stream_orchestration("parallel-test.json", SPEC)]
+
+    agent_ids = asyncio.run(collect())
+    assert set(agent_ids[:2]) == {"operations_summary_agent", "financial_impact_agent"}
+    assert agent_ids[2:] == ["campaign_planner_agent", "synthesis_agent"]
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Shared UTC Timestamps
+=====================
+
+One ISO-8601 UTC timestamp helper for the orchestrator and the integration
+systems, so every spec, log entry and report carries the same format
+(second precision with an explicit "+00:00" offset).
+
+Records are stamped at a high rate, so the formatted string is cached and
+only rebuilt when the wall-clock second changes.
+
+Usage:
+    spec["timestamp"] = utc_iso()
+"""
+
+import time
+
+# (epoch second, formatted timestamp) of the most recent call
+_iso_cache = (None, "")
+
+
+def utc_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string, formatted once per second"""
+    global _iso_cache
+    now = int(time.time())
+    if _iso_cache[0] != now:
+        _iso_cache = (now, time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(now)))
+    return _iso_cache[1]